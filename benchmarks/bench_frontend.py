@@ -0,0 +1,203 @@
+"""
+Measures throughput and peak memory of Lexer and Parser on generated
+programs. Results can be written as JSON and compared with results of
+another commit.
+
+Usage: python -m benchmarks.bench_frontend [--size KIB] [--repeats N]
+           [--seed N] [--profile NAME ...] [--json FILE] [--compare FILE]
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Callable, Optional
+
+from benchmarks.generator import PROFILES, generate
+from src.lexer.lexer import Lexer
+from src.lexer.token_kind import TokenKind
+from src.parser.ast.traversal import walk
+from src.parser.parser import Parser
+from src.utils.buffer import StreamBuffer
+
+
+@dataclass
+class Result:
+    """
+    Measurement of one stage on one generated program
+    """
+    profile: str
+    stage: str
+    bytes: int
+    tokens: int
+    nodes: int
+    seconds: float
+    peak_memory: int
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.tokens / self.seconds
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds
+
+    @property
+    def key(self) -> str:
+        return f"{self.profile}/{self.stage}"
+
+    def as_dict(self) -> dict:
+        return asdict(self) | {
+            "bytes_per_second": self.bytes_per_second,
+            "tokens_per_second": self.tokens_per_second,
+            "nodes_per_second": self.nodes_per_second
+        }
+
+
+def lex(source: str) -> tuple[int, int]:
+    lexer = Lexer(StreamBuffer.from_str(source))
+    tokens = 0
+
+    while lexer.get_next_token().kind != TokenKind.EOF:
+        tokens += 1
+
+    return tokens, 0
+
+
+def parse(source: str) -> tuple[int, int]:
+    lexer = Lexer(StreamBuffer.from_str(source), skip_comments=True)
+    tokens = 0
+    get_next_token = lexer.get_next_token
+
+    def counted():
+        nonlocal tokens
+        tokens += 1
+        return get_next_token()
+
+    lexer.get_next_token = counted
+    module = Parser(lexer).parse()
+
+    # EOF token is not counted
+    return tokens - 1, sum(1 for _ in walk(module))
+
+
+def measure(stage: Callable[[str], tuple[int, int]], source: str,
+            repeats: int) -> tuple[float, int, int, int]:
+    best = float("inf")
+    tokens = nodes = 0
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        tokens, nodes = stage(source)
+        best = min(best, time.perf_counter() - start)
+
+    # Memory is traced in separate run, tracing slows down the stage
+    tracemalloc.start()
+    try:
+        stage(source)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return best, tokens, nodes, peak
+
+
+def run(profiles: list[str], size: int, repeats: int, seed: int
+        ) -> list[Result]:
+    results = []
+
+    for profile in profiles:
+        source = generate(profile, size, seed)
+        for name, stage in (("lexer", lex), ("parser", parse)):
+            seconds, tokens, nodes, peak = measure(stage, source, repeats)
+            results.append(Result(profile, name, len(source.encode()),
+                                  tokens, nodes, seconds, peak))
+
+    return results
+
+
+def commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def report(results: list[Result], baseline: dict[str, dict]) -> str:
+    lines = [f"{'Benchmark':<22} {'KiB':>6} {'Time(s)':>8} {'MiB/s':>7} "
+             f"{'Tokens/s':>10} {'Nodes/s':>10} {'Peak KiB':>9}"
+             + ("  Change" if baseline else "")]
+
+    for result in results:
+        line = f"{result.key:<22} {result.bytes / 1024:>6.0f} " \
+               f"{result.seconds:>8.3f} " \
+               f"{result.bytes_per_second / 2 ** 20:>7.3f} " \
+               f"{result.tokens_per_second:>10,.0f} " \
+               f"{result.nodes_per_second:>10,.0f} " \
+               f"{result.peak_memory / 1024:>9,.0f}"
+
+        # Change of throughput, positive is faster
+        if (previous := baseline.get(result.key)) is not None:
+            change = result.bytes_per_second \
+                / previous["bytes_per_second"] - 1
+            line += f"  {change:>+6.1%}"
+
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+def main(arguments: list[str]) -> None:
+    parser = argparse.ArgumentParser(prog="benchmarks.bench_frontend")
+    parser.add_argument("--size", type=int, default=256,
+                        help="size of generated programs in KiB")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile", action="append", choices=PROFILES,
+                        help="generated profile, all if omitted")
+    parser.add_argument("--json", help="write results to file, - for stdout")
+    parser.add_argument("--compare", help="results of previous run")
+    options = parser.parse_args(arguments)
+
+    results = run(options.profile or list(PROFILES), options.size * 1024,
+                  options.repeats, options.seed)
+
+    baseline = {}
+    if options.compare:
+        with open(options.compare) as file:
+            baseline = {f"{entry['profile']}/{entry['stage']}": entry
+                        for entry in json.load(file)["results"]}
+
+    document = {
+        "commit": commit(),
+        "python": platform.python_version(),
+        "size": options.size * 1024,
+        "seed": options.seed,
+        "repeats": options.repeats,
+        "results": [result.as_dict() for result in results]
+    }
+
+    if options.json == "-":
+        json.dump(document, sys.stdout, indent=2)
+        print()
+        return
+
+    if options.json:
+        with open(options.json, "w") as file:
+            json.dump(document, file, indent=2)
+
+    print(report(results, baseline))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,68 @@
+"""
+Compares interpreter throughput with and without specialised operator
+handlers on arithmetic-heavy loop.
+
+Usage: python -m benchmarks.bench_operators [iterations] [repeats]
+"""
+import io
+import sys
+import time
+
+from src.flags import Flags
+from src.interpreter.interpreter import Interpreter
+from src.lexer.lexer import Lexer
+from src.parser.ast.module import Module
+from src.parser.parser import Parser
+from src.semantic.analyzer import analyze
+from src.utils.buffer import StreamBuffer
+
+PROGRAM = """
+fn main() {{
+    mut let i: i32 = 0;
+    mut let total: i64 = 0;
+    mut let ratio: f32 = 0.0;
+    while (i < {iterations}) {{
+        total = total + i * 3 - i / 2;
+        ratio = ratio + i * 0.5;
+        if (total > 1000000000) {{
+            total = total - 1000000000;
+        }}
+        i = i + 1;
+    }}
+    println(total as str + " " + ratio as str);
+}}
+"""
+
+
+def measure(module: Module, flags: Flags, repeats: int) -> float:
+    analysis = analyze(module)
+    best = float("inf")
+
+    for _ in range(repeats):
+        interpreter = Interpreter(module, flags, io.StringIO(),
+                                  analysis=analysis)
+        start = time.perf_counter()
+        interpreter.run()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main(iterations: int = 100_000, repeats: int = 3) -> None:
+    source = PROGRAM.format(iterations=iterations)
+    module = Parser(Lexer(StreamBuffer.from_str(source),
+                          skip_comments=True)).parse()
+
+    generic = measure(module, Flags(specialised_operators=False), repeats)
+    specialised = measure(module, Flags(specialised_operators=True), repeats)
+
+    print(f"iterations:  {iterations}")
+    print(f"generic:     {generic:.3f}s "
+          f"({iterations / generic:,.0f} iterations/s)")
+    print(f"specialised: {specialised:.3f}s "
+          f"({iterations / specialised:,.0f} iterations/s)")
+    print(f"speedup:     {generic / specialised:.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
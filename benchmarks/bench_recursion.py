@@ -0,0 +1,89 @@
+"""
+Times recursive FHLL programs: fib, ackermann and deep (tail) recursion.
+
+Usage: python -m benchmarks.bench_recursion [fib] [ackermann] [depth]
+"""
+import io
+import sys
+import time
+
+from src.flags import Flags
+from src.interpreter.interpreter import Interpreter
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+from src.utils.buffer import StreamBuffer
+
+PROGRAM = """
+fn fib(n: i64) -> i64 {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+fn ackermann(m: i64, n: i64) -> i64 {
+    if (m == 0) {
+        return n + 1;
+    }
+    if (n == 0) {
+        return ackermann(m - 1, 1);
+    }
+    return ackermann(m - 1, ackermann(m, n - 1));
+}
+
+fn sum(n: i64) -> i64 {
+    if (n == 0) {
+        return 0;
+    }
+    return n + sum(n - 1);
+}
+
+fn sum_tail(n: i64, total: i64) -> i64 {
+    if (n == 0) {
+        return total;
+    }
+    return sum_tail(n - 1, total + n);
+}
+"""
+
+
+def measure(call: str, depth: int) -> tuple[float, str]:
+    source = PROGRAM + f"fn main() {{ println({call} as str); }}"
+    stdout = io.StringIO()
+    module = Parser(Lexer(StreamBuffer.from_str(source),
+                          skip_comments=True)).parse()
+    interpreter = Interpreter(module, Flags(maximum_recursion_depth=depth),
+                              stdout)
+
+    start = time.perf_counter()
+    interpreter.run()
+    elapsed = time.perf_counter() - start
+
+    return elapsed, stdout.getvalue().strip()
+
+
+def fib_calls(n: int) -> int:
+    previous, current = 1, 1
+    for _ in range(n):
+        previous, current = current, previous + current + 1
+    return previous
+
+
+def main(fib: int = 20, ackermann: int = 5, depth: int = 50_000) -> None:
+    cases = [
+        (f"fib({fib})", fib + 1, fib_calls(fib)),
+        (f"ackermann(2, {ackermann})", 2 * ackermann + 8, None),
+        (f"ackermann(3, {ackermann})", 2 ** (ackermann + 3), None),
+        (f"sum({depth})", depth + 1, depth + 1),
+        (f"sum_tail({depth}, 0)", 1, depth + 1),
+    ]
+
+    for call, required_depth, calls in cases:
+        elapsed, result = measure(call, required_depth + 1)
+        rate = f", {calls / elapsed:,.0f} calls/s" if calls else ""
+
+        print(f"{call:<24} = {result:<14} {elapsed:.3f}s{rate}")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,149 @@
+"""
+Request latency of language server on large generated document.
+Scripted client opens document, then keeps typing into it and requests
+document symbols and definitions, while server analyses edits in
+background. Latency is measured from sending request until whole response
+is received, decoding of response by client is reported separately.
+Exits with status 1 if p95 latency exceeds the target.
+
+Usage: python -m benchmarks.bench_server [--lines N] [--rounds N]
+           [--seed N] [--target MS]
+"""
+import argparse
+import sys
+import time
+from random import Random
+
+from benchmarks.generator import generate
+from src.lexer.lexer import Lexer
+from src.lexer.token_kind import TokenKind
+from src.server.client import LanguageClient
+from src.utils.buffer import StreamBuffer
+
+URI = "file:///bench.fhll"
+
+# Keystrokes and requests of one round, pauses are in seconds
+EDITS = 5
+TYPING_INTERVAL = 0.05
+REQUESTS = 10
+REQUEST_INTERVAL = 0.02
+
+
+def source(lines: int, seed: int) -> str:
+    size = lines * 100
+
+    while (text := generate("mixed", size, seed)).count("\n") < lines:
+        size = size * 5 // 4
+
+    return text
+
+
+def identifiers(text: str) -> list[dict]:
+    lexer = Lexer(StreamBuffer.from_str(text))
+    positions = []
+
+    while (token := lexer.get_next_token()).kind != TokenKind.EOF:
+        if token.kind == TokenKind.Identifier:
+            begin = token.location.begin
+            positions.append({"line": begin.line - 1,
+                              "character": begin.column - 1})
+
+    return positions
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def timed(client: LanguageClient, method: str, params: dict
+          ) -> tuple[float, float]:
+    start = time.perf_counter()
+    _, latency = client.timed_request(method, params, timeout=60)
+    return latency, time.perf_counter() - start - latency
+
+
+def run(lines: int, rounds: int, seed: int
+        ) -> dict[str, list[tuple[float, float]]]:
+    text = source(lines, seed)
+    positions = identifiers(text)
+    last_line = text.count("\n")
+    random = Random(seed)
+    document = {"uri": URI}
+
+    client = LanguageClient.spawn()
+    client.request("initialize", {"capabilities": {}}, timeout=60)
+    client.notify("initialized")
+
+    start = time.perf_counter()
+    client.notify("textDocument/didOpen", {"textDocument": {
+        "uri": URI, "languageId": "fhll", "version": 0, "text": text
+    }})
+    client.notification("textDocument/publishDiagnostics")
+    print(f"{lines:,} lines, {len(text) / 1024:,.0f} KiB, "
+          f"first analysis {time.perf_counter() - start:.2f} s")
+
+    latencies = {"textDocument/documentSymbol": [],
+                 "textDocument/definition": []}
+    version = 0
+
+    for _ in range(rounds):
+        # Comments are appended, positions of identifiers do not move
+        for _ in range(EDITS):
+            version += 1
+            end = {"line": last_line, "character": 0}
+            client.notify("textDocument/didChange", {
+                "textDocument": {"uri": URI, "version": version},
+                "contentChanges": [{"range": {"start": end, "end": end},
+                                    "text": f"// edit {version}\n"}]
+            })
+            last_line += 1
+            time.sleep(TYPING_INTERVAL)
+
+        for _ in range(REQUESTS):
+            latencies["textDocument/documentSymbol"].append(timed(
+                client, "textDocument/documentSymbol",
+                {"textDocument": document}
+            ))
+            latencies["textDocument/definition"].append(timed(
+                client, "textDocument/definition",
+                {"textDocument": document,
+                 "position": random.choice(positions)}
+            ))
+            time.sleep(REQUEST_INTERVAL)
+
+    client.close(timeout=60)
+    return latencies
+
+
+def main(arguments: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.bench_server")
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--target", type=float, default=50,
+                        help="p95 latency target in milliseconds")
+    options = parser.parse_args(arguments)
+
+    latencies = run(options.lines, options.rounds, options.seed)
+    passed = True
+
+    print(f"{'Request':<30} {'Count':>6} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'Max ms':>8} {'Decode ms':>10}")
+    for method, measured in latencies.items():
+        values = [latency for latency, _ in measured]
+        decoding = [decode for _, decode in measured]
+        p95 = percentile(values, 0.95) * 1000
+        passed = passed and p95 <= options.target
+        print(f"{method:<30} {len(values):>6} "
+              f"{percentile(values, 0.5) * 1000:>8.1f} {p95:>8.1f} "
+              f"{max(values) * 1000:>8.1f} "
+              f"{percentile(decoding, 0.5) * 1000:>10.1f}")
+
+    print(f"p95 target {options.target:.0f} ms: "
+          f"{'passed' if passed else 'failed'}")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
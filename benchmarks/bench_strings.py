@@ -0,0 +1,65 @@
+"""
+Builds large strings by repeated concatenation in FHLL loop.
+Throughput should stay constant as size grows, i.e. building is linear.
+
+Usage: python -m benchmarks.bench_strings [megabytes] [repeats]
+"""
+import io
+import sys
+import time
+
+from src.interpreter.interpreter import Interpreter
+from src.lexer.lexer import Lexer
+from src.parser.ast.module import Module
+from src.parser.parser import Parser
+from src.semantic.analyzer import analyze
+from src.utils.buffer import StreamBuffer
+
+CHUNK = "0123456789abcdef"
+
+PROGRAM = """
+fn main() {{
+    mut let text = "";
+    mut let i = 0;
+    while (i < {chunks}) {{
+        text = text + "{chunk}";
+        i = i + 1;
+    }}
+    print(text);
+}}
+"""
+
+
+def measure(module: Module, size: int, repeats: int) -> float:
+    analysis = analyze(module)
+    best = float("inf")
+
+    for _ in range(repeats):
+        stdout = io.StringIO()
+        interpreter = Interpreter(module, stdout=stdout, analysis=analysis)
+        start = time.perf_counter()
+        interpreter.run()
+        best = min(best, time.perf_counter() - start)
+
+        assert len(stdout.getvalue()) == size
+
+    return best
+
+
+def main(megabytes: int = 1, repeats: int = 3) -> None:
+    total = megabytes * 2 ** 20
+
+    for size in (total // 4, total // 2, total):
+        chunks = size // len(CHUNK)
+        source = PROGRAM.format(chunks=chunks, chunk=CHUNK)
+        module = Parser(Lexer(StreamBuffer.from_str(source),
+                              skip_comments=True)).parse()
+        elapsed = measure(module, size, repeats)
+
+        print(f"{size / 2 ** 10:>6.0f} KiB: {elapsed:.3f}s "
+              f"({size / elapsed / 2 ** 20:.2f} MiB/s, "
+              f"{chunks / elapsed:,.0f} concatenations/s)")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
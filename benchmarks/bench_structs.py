@@ -0,0 +1,102 @@
+"""
+Compares passing large nested structs by value through recursive calls
+with copy-on-write instances and with eager deep copies.
+
+Usage: python -m benchmarks.bench_structs [iterations] [depth] [repeats]
+"""
+import io
+import sys
+import time
+
+from src.flags import Flags
+from src.interpreter.interpreter import Interpreter
+from src.lexer.lexer import Lexer
+from src.parser.ast.module import Module
+from src.parser.parser import Parser
+from src.semantic.analyzer import analyze
+from src.utils.buffer import StreamBuffer
+
+TYPES = """
+struct Leaf { a: i64; b: i64; c: i64; d: i64; }
+struct Branch { l1: Leaf; l2: Leaf; l3: Leaf; l4: Leaf; }
+struct Tree { b1: Branch; b2: Branch; b3: Branch; b4: Branch; }
+"""
+
+READER = """
+fn sum(t: Tree, n: i32) -> i64 {{
+    if (n == 0) {{
+        return t.b1.l1.a;
+    }}
+    return sum(t, n - 1) + t.b4.l4.d;
+}}
+
+fn main() {{
+    mut let t = Tree {{ }};
+    t.b4.l4.d = 1;
+    mut let i = 0;
+    mut let total: i64 = 0;
+    while (i < {iterations}) {{
+        total = total + sum(t, {depth});
+        i = i + 1;
+    }}
+    println(total as str);
+}}
+"""
+
+WRITER = """
+fn fill(mut t: Tree, n: i32) -> Tree {{
+    if (n == 0) {{
+        return t;
+    }}
+    t.b1.l1.a = t.b1.l1.a + 1;
+    return fill(t, n - 1);
+}}
+
+fn main() {{
+    mut let i = 0;
+    mut let total: i64 = 0;
+    while (i < {iterations}) {{
+        let t = fill(Tree {{ }}, {depth});
+        total = total + t.b1.l1.a;
+        i = i + 1;
+    }}
+    println(total as str);
+}}
+"""
+
+
+def measure(module: Module, flags: Flags, repeats: int) -> float:
+    analysis = analyze(module)
+    best = float("inf")
+
+    for _ in range(repeats):
+        interpreter = Interpreter(module, flags, io.StringIO(),
+                                  analysis=analysis)
+        start = time.perf_counter()
+        interpreter.run()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main(iterations: int = 200, depth: int = 50, repeats: int = 3) -> None:
+    print(f"iterations: {iterations}, depth: {depth}")
+
+    for name, program in (("reader", READER), ("writer", WRITER)):
+        source = TYPES + program.format(iterations=iterations,
+                                         depth=depth)
+        module = Parser(Lexer(StreamBuffer.from_str(source),
+                              skip_comments=True)).parse()
+
+        eager = measure(module, Flags(copy_on_write=False), repeats)
+        lazy = measure(module, Flags(copy_on_write=True), repeats)
+        calls = iterations * (depth + 1)
+
+        print(f"{name}:")
+        print(f"  deep copy:     {eager:.3f}s ({calls / eager:,.0f} calls/s)")
+        print(f"  copy-on-write: {lazy:.3f}s ({calls / lazy:,.0f} calls/s)")
+        print(f"  speedup:       {eager / lazy:.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
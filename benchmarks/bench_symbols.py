@@ -0,0 +1,73 @@
+"""
+Memory and lookup speed of interned identifiers on large generated module.
+Compares identifier strings built per token (as without interning) with
+interned strings and integer symbols.
+
+Usage: python -m benchmarks.bench_symbols [kilobytes] [repeats]
+"""
+import sys
+import time
+
+from benchmarks.generator import generate
+from src.lexer.lexer import Lexer
+from src.parser.ast.name import Name
+from src.parser.ast.traversal import walk
+from src.parser.parser import Parser
+from src.utils.buffer import StreamBuffer
+
+
+def copy(text: str) -> str:
+    # Fresh string object with same text, as built by StringBuilder
+    return "".join(list(text))
+
+
+def string_bytes(strings: list[str]) -> int:
+    return sum(sys.getsizeof(text)
+               for text in {id(text): text for text in strings}.values())
+
+
+def lookups(keys: list, table: dict, repeats: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for key in keys:
+            table[key]
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main(kilobytes: int = 512, repeats: int = 5) -> None:
+    source = generate("mixed", kilobytes * 1024)
+    module = Parser(Lexer(StreamBuffer.from_str(source),
+                          skip_comments=True)).parse()
+    names = [node for node in walk(module) if isinstance(node, Name)]
+
+    interned = [name.identifier for name in names]
+    built = [copy(identifier) for identifier in interned]
+    symbols = [name.symbol for name in names]
+
+    print(f"{len(names):,} names, {len(module.symbols):,} symbols")
+    print(f"identifier strings: {string_bytes(built) / 1024:,.0f} KiB "
+          f"built per token, {string_bytes(interned) / 1024:,.0f} KiB "
+          f"interned")
+
+    by_text = {identifier: None for identifier in interned}
+    by_symbol = {symbol: None for symbol in symbols}
+    by_index = [None] * len(module.symbols)
+
+    cases = [
+        ("built str keys", lookups([copy(key) for key in built], by_text,
+                                   repeats)),
+        ("interned str keys", lookups(interned, by_text, repeats)),
+        ("symbol keys", lookups(symbols, by_symbol, repeats)),
+        ("symbol index", lookups(symbols, by_index, repeats))
+    ]
+
+    for label, elapsed in cases:
+        print(f"{label:<18} {len(names) / elapsed / 1e6:>6.1f} M lookups/s")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,325 @@
+"""
+Deterministic generator of large valid FHLL programs for benchmarks.
+Same profile, size and seed always produce the same source.
+
+Usage: python -m benchmarks.generator [profile] [kilobytes] [seed]
+"""
+import sys
+from random import Random
+from typing import Callable
+
+PROFILES = ("expressions", "declarations", "functions", "strings",
+            "comments", "mixed")
+
+WORDS = ("alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta",
+         "theta", "iota", "kappa", "lambda", "omicron", "sigma", "omega")
+
+ADDITIVE = ("+", "-")
+MULTIPLICATIVE = ("*", "/")
+RELATIONS = ("==", "!=", "<", ">")
+
+
+class ProgramGenerator:
+    """
+    Generates type-correct FHLL declarations from seeded random source
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, seed: int = 0):
+        """
+        Creates new generator
+        :param seed: seed of random source
+        """
+        self._random = Random(seed)
+        self._functions = 0
+        self._arities: dict[str, int] = {}
+        self._integer_functions: list[str] = []
+        self._structs = 0
+        self._enums = 0
+
+    # endregion
+
+    # region Methods
+
+    def program(self, profile: str, size: int) -> str:
+        """
+        Program of given profile with at least size characters
+        :param profile: one of PROFILES
+        :param size: minimum length of source in characters
+        :return: source code
+        """
+        declaration = self._declarations()[profile]
+        parts = []
+        length = 0
+
+        while length < size:
+            part = declaration()
+            parts.append(part)
+            length += len(part) + 1
+
+        return "\n".join(parts) + "\n"
+
+    def expression(self, names: list[str], depth: int) -> str:
+        """
+        Integer expression over names
+        :param names: variables of type i64 in scope
+        :param depth: maximum nesting of parentheses
+        :return: expression source
+        """
+        if depth == 0 or self._random.random() < 0.2:
+            return self._operand(names)
+
+        terms = [self._term(names, depth)
+                 for _ in range(self._random.randint(2, 4))]
+        expression = terms[0]
+
+        for term in terms[1:]:
+            expression += f" {self._random.choice(ADDITIVE)} {term}"
+
+        return expression
+
+    def condition(self, names: list[str], depth: int) -> str:
+        """
+        Boolean expression over names
+        :param names: variables of type i64 in scope
+        :param depth: maximum nesting of parentheses
+        :return: expression source
+        """
+        left = self.expression(names, depth)
+        right = self.expression(names, depth)
+        relation = f"{left} {self._random.choice(RELATIONS)} {right}"
+
+        if self._random.random() < 0.3:
+            other = f"{self._operand(names)} > {self._operand(names)}"
+            return f"{relation} && !({other})"
+
+        return relation
+
+    def function(self, statements: int, depth: int) -> str:
+        """
+        Function declaration with parameters of type i64
+        :param statements: number of statements in body
+        :param depth: maximum nesting of expressions
+        :return: declaration source
+        """
+        name = f"function_{self._functions}"
+        self._functions += 1
+
+        names = [f"p{index}" for index in range(self._random.randint(1, 3))]
+        parameters = ", ".join(f"{parameter}: i64" for parameter in names)
+        body = self._statements(names, statements, depth, "    ")
+
+        self._arities[name] = len(names)
+        self._integer_functions.append(name)
+
+        return f"fn {name}({parameters}) -> i64 {{\n{body}" \
+               f"    return {self.expression(names, depth)};\n}}\n"
+
+    def struct(self) -> str:
+        """
+        Struct declaration with integer and string fields
+        :return: declaration source
+        """
+        name = f"Struct{self._structs}"
+        self._structs += 1
+
+        fields = [f"{self._random.choice(WORDS)}_{index}"
+                  for index in range(self._random.randint(1, 6))]
+
+        lines = [f"    {field}: {'str' if index % 3 == 2 else 'i64'};"
+                 for index, field in enumerate(fields)]
+
+        return f"struct {name} {{\n" + "\n".join(lines) + "\n}\n"
+
+    def enum(self, depth: int = 2) -> str:
+        """
+        Enum declaration with struct and nested enum variants
+        :param depth: maximum nesting of enums
+        :return: declaration source
+        """
+        name = f"Enum{self._enums}"
+        self._enums += 1
+
+        return self._enum(name, depth, "") + "\n"
+
+    def strings(self, statements: int) -> str:
+        """
+        Function building strings from literals with escape sequences
+        :param statements: number of statements in body
+        :return: declaration source
+        """
+        name = f"function_{self._functions}"
+        self._functions += 1
+
+        lines = ["    mut let text = \"\";"]
+        for _ in range(statements):
+            lines.append(f"    text = text + {self._string()} + "
+                         f"{self._string()};")
+        lines.append("    println(text);")
+
+        return f"fn {name}() {{\n" + "\n".join(lines) + "\n}\n"
+
+    def comments(self, statements: int) -> str:
+        """
+        Function with comment on every line
+        :param statements: number of statements in body
+        :return: declaration source
+        """
+        header = "".join(f"// {self._sentence()}\n"
+                         for _ in range(self._random.randint(1, 4)))
+        lines = self.function(statements, 2).splitlines()
+        commented = [f"{line}  // {self._sentence()}" if line.strip()
+                     else line for line in lines]
+
+        return header + "\n".join(commented) + "\n"
+
+    # endregion
+
+    # region Private Methods
+
+    def _declarations(self) -> dict[str, Callable[[], str]]:
+        return {
+            "expressions": lambda: self.function(4, 6),
+            "declarations": lambda: self.struct() if self._random.random()
+            < 0.6 else self.enum(),
+            "functions": lambda: self.function(60, 2),
+            "strings": lambda: self.strings(20),
+            "comments": lambda: self.comments(10),
+            "mixed": lambda: self._random.choice((
+                lambda: self.function(20, 3),
+                self.struct,
+                self.enum,
+                lambda: self.strings(5)
+            ))()
+        }
+
+    def _operand(self, names: list[str]) -> str:
+        if self._random.random() < 0.5:
+            return self._random.choice(names)
+
+        return str(self._random.randint(1, 1000))
+
+    def _term(self, names: list[str], depth: int) -> str:
+        factors = [self._factor(names, depth)
+                   for _ in range(self._random.randint(1, 3))]
+        term = factors[0]
+
+        for factor in factors[1:]:
+            term += f" {self._random.choice(MULTIPLICATIVE)} {factor}"
+
+        return term
+
+    def _factor(self, names: list[str], depth: int) -> str:
+        roll = self._random.random()
+
+        if roll < 0.3:
+            return f"({self.expression(names, depth - 1)})"
+
+        if roll < 0.4:
+            return f"-{self._operand(names)}"
+
+        if roll < 0.5:
+            return f"{self._operand(names)} as i64"
+
+        return self._operand(names)
+
+    def _statements(self, parameters: list[str], count: int, depth: int,
+                    indent: str, names: list[str] = None) -> str:
+        # Parameters are immutable, only declared variables are assigned
+        names = list(names if names is not None else parameters)
+        lines = []
+
+        for _ in range(count):
+            roll = self._random.random()
+
+            if roll < 0.4 or len(indent) > 12:
+                name = f"v{len(names)}"
+                lines.append(f"{indent}mut let {name}: i64 = "
+                             f"{self.expression(names, depth)};\n")
+                names.append(name)
+            elif roll < 0.6 and len(names) > len(parameters):
+                target = self._random.choice(names[len(parameters):])
+                lines.append(f"{indent}{target} = "
+                             f"{self.expression(names, depth)};\n")
+            elif roll < 0.75:
+                body = self._statements(parameters, 2, depth,
+                                        indent + "    ", names)
+                lines.append(f"{indent}if ({self.condition(names, depth)}) "
+                             f"{{\n{body}{indent}}}\n")
+            elif roll < 0.85:
+                body = self._statements(parameters, 2, depth,
+                                        indent + "    ", names)
+                lines.append(f"{indent}while "
+                             f"({self.condition(names, depth)}) "
+                             f"{{\n{body}{indent}}}\n")
+            elif self._integer_functions:
+                name = f"v{len(names)}"
+                lines.append(f"{indent}mut let {name} = "
+                             f"{self._call(names)};\n")
+                names.append(name)
+            else:
+                lines.append(f"{indent}println({names[-1]} as str);\n")
+
+        return "".join(lines)
+
+    def _call(self, names: list[str]) -> str:
+        # Only functions returning i64 are called
+        callee = self._random.choice(self._integer_functions)
+        arguments = ", ".join(self._operand(names)
+                              for _ in range(self._arities[callee]))
+
+        return f"{callee}({arguments})"
+
+    def _enum(self, name: str, depth: int, indent: str) -> str:
+        lines = [f"{indent}enum {name} {{"]
+
+        for index in range(self._random.randint(1, 4)):
+            variant = f"{name}Variant{index}"
+            inner = indent + "    "
+
+            if depth > 0 and self._random.random() < 0.3:
+                lines.append(self._enum(variant, depth - 1, inner) + ";")
+            else:
+                fields = " ".join(f"{word}: i64;" for word in
+                                  self._random.sample(WORDS, 2))
+                lines.append(f"{inner}struct {variant} {{ {fields} }};")
+
+        lines.append(f"{indent}}}")
+        return "\n".join(lines)
+
+    def _string(self) -> str:
+        words = [self._random.choice(WORDS)
+                 for _ in range(self._random.randint(1, 8))]
+
+        if self._random.random() < 0.3:
+            words.append(self._random.choice(("\\n", "\\t", "\\\"")))
+
+        return f"\"{' '.join(words)}\""
+
+    def _sentence(self) -> str:
+        return " ".join(self._random.choice(WORDS)
+                        for _ in range(self._random.randint(3, 10)))
+
+    # endregion
+
+
+def generate(profile: str, size: int, seed: int = 0) -> str:
+    """
+    Generates program
+    :param profile: one of PROFILES
+    :param size: minimum length of source in characters
+    :param seed: seed of random source
+    :return: source code
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile '{profile}'")
+
+    return ProgramGenerator(seed).program(profile, size)
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    print(generate(arguments[0] if arguments else "mixed",
+                   int(arguments[1]) * 1024 if len(arguments) > 1 else 16384,
+                   int(arguments[2]) if len(arguments) > 2 else 0), end="")
@@ -0,0 +1,55 @@
+from typing import Optional
+
+
+class SymbolTable:
+    """
+    Interned identifiers of one compilation.
+    Each distinct identifier text is stored once and gets small integer
+    symbol, equal identifiers share both the symbol and the string object.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self):
+        self._symbols: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._symbols
+
+    # endregion
+
+    # region Methods
+
+    def intern(self, name: str) -> int:
+        """
+        Symbol of identifier, added to table if seen first time
+        :param name: identifier text
+        :return: symbol of identifier
+        """
+        if (symbol := self._symbols.get(name)) is None:
+            symbol = self._symbols[name] = len(self._names)
+            self._names.append(name)
+
+        return symbol
+
+    def lookup(self, name: str) -> Optional[int]:
+        """
+        Symbol of identifier without adding it
+        :param name: identifier text
+        :return: symbol, None if identifier is not in table
+        """
+        return self._symbols.get(name)
+
+    def name(self, symbol: int) -> str:
+        """
+        Interned text of symbol
+        :param symbol: symbol returned by intern
+        :return: identifier text
+        """
+        return self._names[symbol]
+
+    # endregion
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -11,3 +12,12 @@ class Flags:
     maximum_string_length: int = 128
     maximum_integer_value: int = 2 ** 64 - 1
     minimum_integer_value: int = - (2 ** 63)
+    specialised_operators: bool = True
+    constant_folding: bool = True
+    copy_on_write: bool = True
+    output_buffer_size: int = 64 * 1024
+    input_chunk_size: int = 64 * 1024
+    maximum_recursion_depth: int = 10_000
+    maximum_steps: Optional[int] = None
+    maximum_time: Optional[float] = None
+    maximum_allocated_bytes: Optional[int] = None
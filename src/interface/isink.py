@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class ISink(ABC):
+
+    @abstractmethod
+    def write(self, text: str) -> None:
+        ...
+
+    @abstractmethod
+    def flush(self) -> None:
+        ...
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+
+class ISource(ABC):
+
+    @abstractmethod
+    def read(self, size: int) -> str:
+        ...
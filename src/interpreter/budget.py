@@ -0,0 +1,137 @@
+import time
+from typing import Optional
+
+from src.flags import Flags
+from src.interpreter.errors import BudgetExceededPanic
+from src.interpreter.rope import Rope, Text
+from src.interpreter.values import StructLayout, Value
+
+# Number of steps between checks of time and memory limits
+CHECK_INTERVAL = 1024
+
+# Estimated size in bytes of struct instance and of each of its fields
+STRUCT_SIZE = 56
+FIELD_SIZE = 8
+
+
+class Budget:
+    """
+    Execution limits of program.
+    Steps (loop iterations and calls) are counted by interpreter, step and
+    time limits are checked only when step counter reaches next checkpoint.
+    Memory limit is checked on each allocation.
+    """
+
+    __slots__ = ("steps", "allocated", "checkpoint", "_flags", "_deadline")
+
+    # region Dunder Methods
+
+    def __init__(self, flags: Flags):
+        """
+        Creates budget with limits from flags
+        :param flags: interpreter flags
+        """
+        self._flags = flags
+        self._deadline: Optional[float] = None
+
+        self.steps = 0
+        self.allocated = 0
+        self.checkpoint = self._next_checkpoint()
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def limited(self) -> bool:
+        """
+        Checks if any limit is set
+        :return: True if budget has limits, False otherwise
+        """
+        return self._flags.maximum_steps is not None \
+            or self._flags.maximum_time is not None \
+            or self._flags.maximum_allocated_bytes is not None
+
+    # endregion
+
+    # region Methods
+
+    def start(self) -> None:
+        """
+        Starts measuring time
+        """
+        if self._flags.maximum_time is not None:
+            self._deadline = time.perf_counter() + self._flags.maximum_time
+
+    def check(self) -> None:
+        """
+        Checks limits and sets next checkpoint
+        """
+        flags = self._flags
+
+        if flags.maximum_steps is not None and \
+                self.steps > flags.maximum_steps:
+            raise BudgetExceededPanic("steps", flags.maximum_steps,
+                                      self.steps)
+
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise BudgetExceededPanic("time", flags.maximum_time,
+                                      time.perf_counter() - self._deadline
+                                      + flags.maximum_time)
+
+        if flags.maximum_allocated_bytes is not None and \
+                self.allocated > flags.maximum_allocated_bytes:
+            raise BudgetExceededPanic("allocated bytes",
+                                      flags.maximum_allocated_bytes,
+                                      self.allocated)
+
+        self.checkpoint = self._next_checkpoint()
+
+    def allocate_text(self, left: Value, result: Text) -> Text:
+        """
+        Accounts memory allocated by string concatenation
+        :param left: left operand of concatenation
+        :param result: concatenated string
+        :return: result
+        """
+        # Rope shares characters of left operand
+        if isinstance(result, Rope) and isinstance(left, (str, Rope)):
+            self._allocate(len(result) - len(left))
+        else:
+            self._allocate(len(result))
+
+        return result
+
+    def allocate_struct(self, layout: StructLayout) -> None:
+        """
+        Accounts memory allocated by new or cloned struct instance
+        :param layout: layout of instance
+        """
+        self._allocate(STRUCT_SIZE + FIELD_SIZE * len(layout.names))
+
+    # endregion
+
+    # region Private Methods
+
+    def _allocate(self, size: int) -> None:
+        self.allocated += size
+
+        # Single allocation may grow memory many times between checkpoints
+        limit = self._flags.maximum_allocated_bytes
+        if limit is not None and self.allocated > limit:
+            raise BudgetExceededPanic("allocated bytes", limit,
+                                      self.allocated)
+
+    def _next_checkpoint(self) -> float:
+        if not self.limited:
+            return float("inf")
+
+        checkpoint = self.steps + CHECK_INTERVAL
+
+        # Step limit is enforced exactly
+        if self._flags.maximum_steps is not None:
+            checkpoint = min(checkpoint, self._flags.maximum_steps + 1)
+
+        return checkpoint
+
+    # endregion
@@ -0,0 +1,112 @@
+import sys
+from typing import TextIO
+
+from src.flags import Flags
+from src.interface.isink import ISink
+from src.interface.isource import ISource
+from src.interpreter.errors import PanicException, InvalidInputPanic
+from src.interpreter.rope import Text
+from src.interpreter.streams import StreamSink, StreamSource, OutputBuffer, \
+    InputBuffer
+from src.interpreter.values import Value
+from src.semantic.signatures import Signature
+from src.semantic.types import BuiltinType, integer_ranges
+
+
+class Builtins:
+    """
+    Builtin functions of the language: buffered I/O and panic
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, stdout: TextIO | ISink = None,
+                 stdin: TextIO | ISource = None, flags: Flags = None):
+        """
+        Creates builtin functions bound to streams
+        :param stdout: output stream or sink, defaults to sys.stdout
+        :param stdin: input stream or source, defaults to sys.stdin
+        :param flags: interpreter flags with buffer sizes
+        """
+        flags = flags if flags is not None else Flags()
+
+        if not isinstance(stdout, ISink):
+            stdout = StreamSink(stdout if stdout is not None else sys.stdout)
+
+        if not isinstance(stdin, ISource):
+            stdin = StreamSource(stdin if stdin is not None else sys.stdin)
+
+        self._output = OutputBuffer(stdout, flags.output_buffer_size)
+
+        # Pending output is flushed before waiting for input
+        self._input = InputBuffer(stdin, flags.input_chunk_size,
+                                  self._output.flush)
+
+        self._functions = {
+            "print": self._print,
+            "println": self._println,
+            "writeln": self._println,
+            "flush": self.flush,
+            "panic": self._panic
+        }
+
+    # endregion
+
+    # region Methods
+
+    def call(self, signature: Signature, arguments: list[Value]) -> Value:
+        """
+        Calls builtin function
+        :param signature: builtin function signature
+        :param arguments: arguments of parameter types
+        :return: returned value
+        """
+        if (function := self._functions.get(signature.name)) is not None:
+            return function(*arguments)
+
+        return self._read(signature.return_type)
+
+    def flush(self) -> None:
+        """
+        Writes buffered output
+        """
+        self._output.flush()
+
+    # endregion
+
+    # region Private Methods
+
+    def _print(self, text: Text) -> None:
+        self._output.write(str(text))
+
+    def _println(self, text: Text) -> None:
+        self._output.write(str(text))
+        self._output.write("\n")
+
+    @staticmethod
+    def _panic(message: Text) -> None:
+        raise PanicException(str(message))
+
+    def _read(self, typ: BuiltinType) -> Value:
+        if typ == BuiltinType.Str:
+            line = self._input.read_line()
+            return line if line is not None else ""
+
+        if (token := self._input.read_token()) is None:
+            raise InvalidInputPanic("", typ)
+
+        try:
+            if typ == BuiltinType.F32:
+                return float(token)
+
+            value = int(token)
+        except ValueError:
+            raise InvalidInputPanic(token, typ)
+
+        low, high = integer_ranges[typ]
+        if not low <= value <= high:
+            raise InvalidInputPanic(token, typ)
+
+        return value
+
+    # endregion
@@ -0,0 +1,78 @@
+from typing import Optional
+
+from src.common.location import Location
+
+
+class InterpreterException(Exception):
+    ...
+
+
+class PanicException(InterpreterException):
+    def __init__(self, message: str, location: Optional[Location] = None):
+        self.message = message
+        self.location = location
+
+        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        if self.location is None:
+            return f"panic!: {self.message}"
+
+        begin = self.location.begin
+        return f"panic!: {self.message} at {begin.line}:{begin.column}"
+
+
+class IntegerOverflowPanic(PanicException):
+    def __init__(self, operator: str, typ: object):
+        super().__init__(f"Integer overflow in '{operator}' for '{typ}'")
+        self.operator = operator
+        self.type = typ
+
+
+class DivisionByZeroPanic(PanicException):
+    def __init__(self):
+        super().__init__("Cannot divide by zero")
+
+
+class InvalidCastPanic(PanicException):
+    def __init__(self, source: object, target: object):
+        super().__init__(f"Cannot cast '{source}' to '{target}'")
+        self.source = source
+        self.target = target
+
+
+class UninitializedVariablePanic(PanicException):
+    def __init__(self, name: str):
+        super().__init__(f"Use of uninitialized variable '{name}'")
+        self.name = name
+
+
+class InvalidInputPanic(PanicException):
+    def __init__(self, value: str, typ: object):
+        super().__init__(f"Cannot read '{value}' as '{typ}'")
+        self.value = value
+        self.type = typ
+
+
+class RecursionDepthPanic(PanicException):
+    def __init__(self, depth: int):
+        super().__init__(f"Maximum recursion depth {depth} exceeded")
+        self.depth = depth
+
+
+class BudgetExceededPanic(PanicException):
+    def __init__(self, resource: str, limit: float, used: float):
+        super().__init__(
+            f"Execution budget exceeded: {resource} ({used:g} > {limit:g})"
+        )
+        self.resource = resource
+        self.limit = limit
+        self.used = used
+
+
+class EntryPointException(InterpreterException):
+    def __init__(self, name: str):
+        self.message = f"Undefined entry point '{name}()'"
+        self.name = name
+
+        super().__init__(self.message)
@@ -0,0 +1,209 @@
+import time
+from collections import defaultdict
+from typing import Callable, Optional, TextIO
+
+from src.flags import Flags
+from src.interface.isink import ISink
+from src.interface.isource import ISource
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.values import Value
+from src.parser.ast.expressions.expression import Expression
+from src.parser.ast.module import Module
+from src.parser.ast.node import Node
+from src.semantic.analyzer import Analysis
+
+type EnterHook = Callable[[Node], None]
+type ExitHook = Callable[[Node, float], None]
+
+
+class NodeStatistics:
+    """
+    Execution count and cumulative (inclusive) time of node
+    """
+
+    __slots__ = ("node", "count", "time")
+
+    def __init__(self, node: Node):
+        self.node = node
+        self.count = 0
+        self.time = 0.0
+
+    def __repr__(self) -> str:
+        return f"NodeStatistics({type(self.node).__name__}, " \
+               f"count={self.count}, time={self.time:.6f})"
+
+
+class Instrumentation:
+    """
+    Per-node counters and hooks called around execution of nodes
+    """
+
+    # region Dunder Methods
+
+    def __init__(self):
+        self._statistics: dict[int, NodeStatistics] = {}
+        self._enter: dict[type, list[EnterHook]] = defaultdict(list)
+        self._exit: dict[type, list[ExitHook]] = defaultdict(list)
+
+    # endregion
+
+    # region Methods
+
+    def on_enter(self, kind: type[Node], hook: EnterHook) -> None:
+        """
+        Registers hook called before node of given kind is executed
+        :param kind: node class, e.g. WhileStatement
+        :param hook: function called with node
+        """
+        self._enter[kind].append(hook)
+
+    def on_exit(self, kind: type[Node], hook: ExitHook) -> None:
+        """
+        Registers hook called after node of given kind was executed,
+        also when execution panicked
+        :param kind: node class, e.g. FnCall
+        :param hook: function called with node and elapsed seconds
+        """
+        self._exit[kind].append(hook)
+
+    def statistics(self, node: Node) -> Optional[NodeStatistics]:
+        """
+        Statistics of node
+        :param node: statement or expression
+        :return: statistics, None if node was never executed
+        """
+        return self._statistics.get(id(node))
+
+    def hottest(self, kind: type[Node] = Node, limit: int = 10
+                ) -> list[NodeStatistics]:
+        """
+        Nodes with highest cumulative time
+        :param kind: only nodes of this class
+        :param limit: maximum number of nodes
+        :return: statistics ordered by time
+        """
+        selected = [statistics for statistics in self._statistics.values()
+                    if isinstance(statistics.node, kind)]
+        selected.sort(key=lambda statistics: -statistics.time)
+
+        return selected[:limit]
+
+    def report(self, kind: type[Node] = Node, limit: int = 20) -> str:
+        """
+        Report of hottest nodes
+        :param kind: only nodes of this class
+        :param limit: maximum number of nodes
+        :return: report text
+        """
+        lines = [f"{'Count':>10} {'Time(s)':>9}  Node"]
+
+        for statistics in self.hottest(kind, limit):
+            begin = statistics.node.location.begin
+            lines.append(f"{statistics.count:>10} {statistics.time:>9.3f}  "
+                         f"{type(statistics.node).__name__} "
+                         f"{begin.line}:{begin.column}")
+
+        return "\n".join(lines)
+
+    def enter(self, node: Node) -> NodeStatistics:
+        """
+        Records start of node execution
+        :param node: executed node
+        :return: statistics of node
+        """
+        if (statistics := self._statistics.get(id(node))) is None:
+            statistics = self._statistics[id(node)] = NodeStatistics(node)
+
+        statistics.count += 1
+
+        if (hooks := self._enter.get(type(node))) is not None:
+            for hook in hooks:
+                hook(node)
+
+        return statistics
+
+    def exit(self, statistics: NodeStatistics, elapsed: float) -> None:
+        """
+        Records end of node execution
+        :param statistics: statistics returned by enter
+        :param elapsed: execution time in seconds
+        """
+        statistics.time += elapsed
+
+        if (hooks := self._exit.get(type(statistics.node))) is not None:
+            for hook in hooks:
+                hook(statistics.node, elapsed)
+
+    # endregion
+
+
+class InstrumentedInterpreter(Interpreter):
+    """
+    Interpreter counting and timing execution of every statement and
+    expression. Kept separate so the regular interpreter has no overhead.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, module: Module, flags: Flags = None,
+                 stdout: TextIO | ISink = None, stdin: TextIO | ISource = None,
+                 analysis: Analysis = None,
+                 instrumentation: Instrumentation = None):
+        """
+        Creates new instrumented interpreter
+        :param module: module to execute
+        :param flags: interpreter flags
+        :param stdout: output stream or sink of builtin functions
+        :param stdin: input stream or source of builtin functions
+        :param analysis: analysis of module, computed if omitted
+        :param instrumentation: counters and hooks, created if omitted
+        """
+        super().__init__(module, flags, stdout, stdin, analysis)
+        self._instrumentation = instrumentation if instrumentation \
+            is not None else Instrumentation()
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """
+        Collected counters and registered hooks
+        :return: instrumentation
+        """
+        return self._instrumentation
+
+    # endregion
+
+    # region Methods
+
+    def execute(self, node: Node):
+        statistics = self._instrumentation.enter(node)
+        start = time.perf_counter()
+
+        try:
+            return super().execute(node)
+        finally:
+            self._instrumentation.exit(statistics,
+                                       time.perf_counter() - start)
+
+    def evaluate(self, node: Expression) -> Value:
+        statistics = self._instrumentation.enter(node)
+        start = time.perf_counter()
+
+        try:
+            return super().evaluate(node)
+        finally:
+            self._instrumentation.exit(statistics,
+                                       time.perf_counter() - start)
+
+    # endregion
+
+    # region Private Methods
+
+    def _execute_expression(self, node: Expression) -> None:
+        # Call statement was already recorded by execute
+        super().evaluate(node)
+
+    # endregion
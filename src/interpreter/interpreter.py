@@ -0,0 +1,662 @@
+from typing import Optional, TextIO
+
+from src.flags import Flags
+from src.interface.isink import ISink
+from src.interface.isource import ISource
+from src.interface.ivisitor import IVisitor
+from src.interpreter.budget import Budget
+from src.interpreter.builtins import Builtins
+from src.interpreter.errors import PanicException, InvalidCastPanic, \
+    UninitializedVariablePanic, EntryPointException, RecursionDepthPanic
+from src.interpreter.layouts import Layouts
+from src.interpreter.operators import Handler, apply, convert, \
+    specialised_handler
+from src.interpreter.stack import run_with_depth
+from src.interpreter.values import Value, StructValue, StructLayout
+from src.parser.ast.access import Access
+from src.parser.ast.cast import Cast
+from src.parser.ast.constant import Constant
+from src.parser.ast.declaration.function_declaration import FunctionDeclaration
+from src.parser.ast.expressions.binary_operation import BinaryOperation
+from src.parser.ast.expressions.bool_operation import BoolOperation
+from src.parser.ast.expressions.bool_operation_type import EBoolOperationType
+from src.parser.ast.expressions.compare import Compare
+from src.parser.ast.expressions.expression import Expression
+from src.parser.ast.expressions.unary_operation import UnaryOperation
+from src.parser.ast.is_compare import IsCompare
+from src.parser.ast.module import Module
+from src.parser.ast.name import Name
+from src.parser.ast.node import Node
+from src.parser.ast.statements.assignment import Assignment
+from src.parser.ast.statements.block import Block
+from src.parser.ast.statements.fn_call import FnCall
+from src.parser.ast.statements.if_statement import IfStatement
+from src.parser.ast.statements.match_statement import MatchStatement
+from src.parser.ast.statements.new_struct_statement import NewStruct
+from src.parser.ast.statements.return_statement import ReturnStatement
+from src.parser.ast.statements.variable_declaration import VariableDeclaration
+from src.parser.ast.statements.while_statement import WhileStatement
+from src.parser.ast.traversal import walk
+from src.optimizer.constant_folder import ConstantFolder
+from src.semantic.analyzer import Analysis, analyze
+from src.semantic.overloads import InlineCache
+from src.semantic.signatures import Signature
+from src.semantic.types import ResolvedType, BuiltinType
+
+type Operation = BinaryOperation | Compare | BoolOperation | UnaryOperation
+type FieldPath = tuple[Name, tuple[int, ...]]
+type Constructor = tuple[StructLayout,
+                         tuple[tuple[int, Expression, ResolvedType], ...]]
+type JumpTable = tuple[int, list[Optional[tuple[int, list[Node]]]]]
+
+
+class _Return:
+    __slots__ = ("value",)
+
+    def __init__(self, value: Value):
+        self.value = value
+
+
+class _TailCall(_Return):
+    __slots__ = ("function", "arguments")
+
+    def __init__(self, function: FunctionDeclaration,
+                 arguments: list[Value]):
+        super().__init__(None)
+        self.function = function
+        self.arguments = arguments
+
+
+class Interpreter(IVisitor[Node]):
+    """
+    Tree-walking interpreter.
+    Executes module using results of static analysis: variables live in
+    frame slots, types and call targets are taken from side tables.
+    Module is optimised in place before execution (see Flags).
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, module: Module, flags: Flags = None,
+                 stdout: TextIO | ISink = None, stdin: TextIO | ISource = None,
+                 analysis: Analysis = None):
+        """
+        Creates new interpreter
+        :param module: module to execute
+        :param flags: interpreter flags
+        :param stdout: output stream or sink of builtin functions
+        :param stdin: input stream or source of builtin functions
+        :param analysis: analysis of module, computed if omitted
+        """
+        self._module = module
+        self._flags = flags if flags is not None else Flags()
+        self._analysis = analysis if analysis is not None \
+            else analyze(module)
+
+        self._types = self._analysis.types
+        self._resolution = self._analysis.resolution
+        self._registry = self._analysis.registry
+        self._builtins = Builtins(stdout, stdin, self._flags)
+        self._layouts = Layouts(self._registry)
+        self._budget = Budget(self._flags)
+
+        self._frame: list[Value] = []
+        self._depth = 0
+        self._handlers: dict[int, Handler] = {}
+        self._return_types: dict[int, ResolvedType] = {}
+        self._paths: dict[int, FieldPath] = {}
+        self._constructors: dict[int, Constructor] = {}
+        self._jump_tables: dict[int, JumpTable] = {}
+        self._ranges: dict[int, tuple[int, int]] = {}
+        self._tail_calls: set[int] = set()
+
+        self._statements = {
+            Block: self._execute_block,
+            VariableDeclaration: self._execute_variable_declaration,
+            Assignment: self._execute_assignment,
+            FnCall: self._execute_expression,
+            NewStruct: self._execute_expression,
+            ReturnStatement: self._execute_return_statement,
+            IfStatement: self._execute_if_statement,
+            WhileStatement: self._execute_while_statement,
+            MatchStatement: self._execute_match_statement
+        }
+
+        self._expressions = {
+            Constant: self._evaluate_constant,
+            Name: self._evaluate_name,
+            Access: self._evaluate_access,
+            BinaryOperation: self._evaluate_binary_operation,
+            Compare: self._evaluate_binary_operation,
+            BoolOperation: self._evaluate_bool_operation,
+            UnaryOperation: self._evaluate_unary_operation,
+            Cast: self._evaluate_cast,
+            IsCompare: self._evaluate_is_compare,
+            FnCall: self._evaluate_fn_call,
+            NewStruct: self._evaluate_new_struct
+        }
+
+        if self._flags.constant_folding:
+            ConstantFolder(self._analysis).fold()
+
+        self._prepare()
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def flags(self) -> Flags:
+        """
+        Interpreter flags
+        :return: interpreter flags
+        """
+        return self._flags
+
+    @property
+    def analysis(self) -> Analysis:
+        """
+        Static analysis of executed module
+        :return: analysis results
+        """
+        return self._analysis
+
+    @property
+    def budget(self) -> Budget:
+        """
+        Execution limits and resources used so far
+        :return: budget
+        """
+        return self._budget
+
+    # endregion
+
+    # region Methods
+
+    def run(self, entry: str = "main") -> Value:
+        """
+        Executes entry point function without parameters.
+        Program runs on stack deep enough for maximum recursion depth.
+        Buffered output is flushed when program ends, also on panic.
+        Panics when execution budget from flags is exceeded.
+        :param entry: name of entry point
+        :return: value returned by entry point
+        """
+        signature = self._analysis.overloads.exact(entry, ())
+
+        if signature is None or signature.is_builtin:
+            raise EntryPointException(entry)
+
+        self._budget.start()
+
+        try:
+            return run_with_depth(
+                lambda: self.call(signature.declaration, []),
+                self._flags.maximum_recursion_depth
+            )
+        finally:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes buffered output of builtin functions
+        """
+        self._builtins.flush()
+
+    def call(self, function: FunctionDeclaration,
+             arguments: list[Value]) -> Value:
+        """
+        Calls user function.
+        Tail calls reuse the call instead of nesting, other calls count
+        towards maximum recursion depth.
+        :param function: called function
+        :param arguments: arguments converted to parameter types
+        :return: returned value
+        """
+        if self._depth >= self._flags.maximum_recursion_depth:
+            raise RecursionDepthPanic(self._flags.maximum_recursion_depth)
+
+        caller = self._frame
+        budget = self._budget
+        self._depth += 1
+        try:
+            while True:
+                budget.steps += 1
+                if budget.steps >= budget.checkpoint:
+                    budget.check()
+
+                frame = [None] * self._resolution.frame(function).size
+                frame[:len(arguments)] = arguments
+                self._frame = frame
+
+                result = self._execute_body(function.block.body)
+
+                if type(result) is not _TailCall:
+                    return result.value if result is not None else None
+
+                function, arguments = result.function, result.arguments
+        finally:
+            self._frame = caller
+            self._depth -= 1
+
+    def visit(self, node: Node) -> Optional[Value]:
+        if isinstance(node, Expression):
+            return self.evaluate(node)
+
+        result = self.execute(node)
+        return result.value if result is not None else None
+
+    def execute(self, node: Node) -> Optional[_Return]:
+        """
+        Executes statement
+        :param node: statement
+        :return: return signal if function returned, None otherwise
+        """
+        try:
+            return self._statements[type(node)](node)
+        except PanicException as panic:
+            if panic.location is None:
+                panic.location = node.location
+            raise
+
+    def evaluate(self, node: Expression) -> Value:
+        """
+        Evaluates expression
+        :param node: expression
+        :return: value of expression
+        """
+        return self._expressions[type(node)](node)
+
+    # endregion
+
+    # region Private Methods (Preparation)
+
+    def _prepare(self) -> None:
+        for function in self._module.function_declarations:
+            return_type = self._types.signature(function).return_type
+
+            for node in walk(function.block):
+                if isinstance(node, ReturnStatement):
+                    self._return_types[id(node)] = return_type
+                    if self._is_tail_call(node, return_type):
+                        self._tail_calls.add(id(node))
+                elif isinstance(node, Access):
+                    self._paths[id(node)] = self._compile_access(node)
+                elif isinstance(node, NewStruct):
+                    self._constructors[id(node)] = \
+                        self._compile_new_struct(node)
+                elif isinstance(node, MatchStatement):
+                    self._jump_tables[id(node)] = self._compile_match(node)
+                elif isinstance(node, IsCompare):
+                    self._ranges[id(node)] = self._registry.tags(
+                        self._registry.resolve(node.is_type)
+                    )
+                elif self._flags.specialised_operators and \
+                        isinstance(node, (BinaryOperation, Compare,
+                                          UnaryOperation)):
+                    self._specialise(node)
+
+    def _specialise(self, node: Operation) -> None:
+        target = self._types.target(node)
+
+        if not isinstance(target, Signature):
+            return
+
+        operands = (node.operand,) if isinstance(node, UnaryOperation) \
+            else (node.left, node.right)
+        types = tuple(self._types.type_of(operand) for operand in operands)
+
+        if (handler := specialised_handler(target, types)) is None:
+            return
+
+        # Concatenated strings count towards allocated bytes
+        if self._flags.maximum_allocated_bytes is not None and \
+                target.return_type == BuiltinType.Str:
+            budget, concatenate = self._budget, handler
+            handler = lambda left, right: budget.allocate_text(
+                left, concatenate(left, right)
+            )
+
+        self._handlers[id(node)] = handler
+
+    def _is_tail_call(self, node: ReturnStatement,
+                      return_type: ResolvedType) -> bool:
+        # Returned call result must not need conversion
+        if not isinstance(node.value, FnCall) or \
+                self._types.type_of(node.value) != return_type:
+            return False
+
+        target = self._types.target(node.value)
+        return isinstance(target, InlineCache) or not target.is_builtin
+
+    def _compile_access(self, node: Access) -> FieldPath:
+        # Access chain is resolved to root variable and field indices
+        indices = []
+
+        while isinstance(node, Access):
+            layout = self._layouts.layout(self._types.type_of(node.parent))
+            indices.append(layout.index(node.name.identifier))
+            node = node.parent
+
+        return node, tuple(reversed(indices))
+
+    def _compile_new_struct(self, node: NewStruct) -> Constructor:
+        layout = self._layouts.layout(self._types.type_of(node))
+
+        return layout, tuple(
+            (index := layout.index(assignment.access.identifier),
+             assignment.value, layout.types[index])
+            for assignment in node.assignments
+        )
+
+    def _compile_match(self, node: MatchStatement) -> JumpTable:
+        # Every tag possible at runtime is mapped to first matching arm
+        low, high = self._registry.tags(self._types.type_of(node.expression))
+        table = [None] * (high - low)
+
+        for matcher in reversed(node.matchers):
+            first, end = self._registry.tags(self._types.type_of(matcher))
+            arm = (self._resolution.slot(matcher).index, matcher.block.body)
+
+            for tag in range(max(first, low), min(end, high)):
+                table[tag - low] = arm
+
+        return low, table
+
+    # endregion
+
+    # region Private Methods (Statements)
+
+    def _execute_body(self, body: list[Node]) -> Optional[_Return]:
+        for statement in body:
+            if (result := self.execute(statement)) is not None:
+                return result
+
+        return None
+
+    def _execute_block(self, node: Block) -> Optional[_Return]:
+        return self._execute_body(node.body)
+
+    def _execute_expression(self, node: Expression) -> None:
+        self.evaluate(node)
+
+    def _execute_variable_declaration(self, node: VariableDeclaration
+                                      ) -> None:
+        typ = self._types.type_of(node)
+
+        if node.value is not None:
+            value = self._evaluate_as(node.value, typ)
+        else:
+            value = self._layouts.default(typ)
+
+        self._frame[self._resolution.slot(node).index] = value
+
+    def _execute_assignment(self, node: Assignment) -> None:
+        access = node.access
+        value = self._evaluate_as(node.value, self._types.type_of(access))
+
+        if isinstance(access, Name):
+            self._frame[self._resolution.slot(access).index] = value
+        else:
+            root, indices = self._paths[id(access)]
+            slot = self._resolution.slot(root).index
+
+            # Shared instances on written path are cloned first
+            if (owner := self._evaluate_name(root)).shared:
+                owner = self._frame[slot] = owner.clone()
+                self._budget.allocate_struct(owner.layout)
+
+            for index in indices[:-1]:
+                if (field := owner.values[index]).shared:
+                    field = owner.values[index] = field.clone()
+                    self._budget.allocate_struct(field.layout)
+                owner = field
+
+            owner.values[indices[-1]] = value
+
+    def _execute_return_statement(self, node: ReturnStatement) -> _Return:
+        if node.value is None:
+            return _Return(None)
+
+        if id(node) in self._tail_calls:
+            target, arguments = self._bind_call(node.value)
+            if not target.is_builtin:
+                return _TailCall(target.declaration, arguments)
+            return _Return(self._builtins.call(target, arguments))
+
+        return _Return(
+            self._evaluate_as(node.value, self._return_types[id(node)])
+        )
+
+    def _execute_if_statement(self, node: IfStatement) -> Optional[_Return]:
+        if self._evaluate_as(node.condition, BuiltinType.Bool):
+            return self._execute_body(node.block.body)
+
+        if node.else_block is not None:
+            return self._execute_body(node.else_block.body)
+
+        return None
+
+    def _execute_while_statement(self, node: WhileStatement
+                                 ) -> Optional[_Return]:
+        budget = self._budget
+
+        while self._evaluate_as(node.condition, BuiltinType.Bool):
+            if (result := self._execute_body(node.block.body)) is not None:
+                return result
+
+            # Budget is checked at loop back-edge
+            budget.steps += 1
+            if budget.steps >= budget.checkpoint:
+                budget.check()
+
+        return None
+
+    def _execute_match_statement(self, node: MatchStatement
+                                 ) -> Optional[_Return]:
+        value = self.evaluate(node.expression)
+        low, table = self._jump_tables[id(node)]
+
+        if (arm := table[value.layout.tag - low]) is None:
+            return None
+
+        slot, body = arm
+        self._frame[slot] = value.share()
+        return self._execute_body(body)
+
+    # endregion
+
+    # region Private Methods (Expressions)
+
+    @staticmethod
+    def _evaluate_constant(node: Constant) -> Value:
+        return node.value
+
+    def _evaluate_name(self, node: Name) -> Value:
+        value = self._frame[self._resolution.slot(node).index]
+
+        if value is None:
+            raise UninitializedVariablePanic(node.identifier)
+
+        return value
+
+    def _evaluate_access(self, node: Access) -> Value:
+        root, indices = self._paths[id(node)]
+        value = self._evaluate_name(root)
+
+        for index in indices:
+            value = value.values[index]
+
+        # Enum fields left out of struct initialiser have no default
+        if value is None:
+            raise UninitializedVariablePanic(_access_path(node))
+
+        return value
+
+    def _evaluate_binary_operation(self, node: BinaryOperation | Compare
+                                   ) -> Value:
+        left = self.evaluate(node.left)
+        right = self.evaluate(node.right)
+
+        if (handler := self._handlers.get(id(node))) is not None:
+            return handler(left, right)
+
+        return self._apply(node, (node.left, node.right), (left, right))
+
+    def _evaluate_unary_operation(self, node: UnaryOperation) -> Value:
+        operand = self.evaluate(node.operand)
+
+        if (handler := self._handlers.get(id(node))) is not None:
+            return handler(operand)
+
+        return self._apply(node, (node.operand,), (operand,))
+
+    def _evaluate_bool_operation(self, node: BoolOperation) -> Value:
+        target = self._types.target(node)
+
+        if not target.is_builtin:
+            left = self.evaluate(node.left)
+            right = self.evaluate(node.right)
+            return self._apply(node, (node.left, node.right), (left, right))
+
+        # Builtin boolean operations short-circuit
+        left = self._evaluate_as(node.left, BuiltinType.Bool)
+
+        if node.op == EBoolOperationType.And and not left:
+            return False
+
+        if node.op == EBoolOperationType.Or and left:
+            return True
+
+        return self._evaluate_as(node.right, BuiltinType.Bool)
+
+    def _evaluate_cast(self, node: Cast) -> Value:
+        return self._convert(self.evaluate(node.value),
+                             self._types.type_of(node.value),
+                             self._types.type_of(node))
+
+    def _evaluate_is_compare(self, node: IsCompare) -> bool:
+        low, high = self._ranges[id(node)]
+        return low <= self.evaluate(node.value).layout.tag < high
+
+    def _evaluate_fn_call(self, node: FnCall) -> Value:
+        target, arguments = self._bind_call(node)
+
+        if target.is_builtin:
+            return self._builtins.call(target, arguments)
+
+        return self.call(target.declaration, arguments)
+
+    def _bind_call(self, node: FnCall) -> tuple[Signature, list[Value]]:
+        target = self._types.target(node)
+        values = [self.evaluate(argument) for argument in node.arguments]
+
+        if isinstance(target, InlineCache):
+            target = self._dispatch(target, node.arguments, values)
+
+        arguments = [
+            self._copy(self._convert(value, self._types.type_of(argument),
+                                     parameter), argument)
+            for value, argument, parameter
+            in zip(values, node.arguments, target.parameters)
+        ]
+
+        return target, arguments
+
+    def _evaluate_new_struct(self, node: NewStruct) -> StructValue:
+        layout, fields = self._constructors[id(node)]
+        value = layout.instance()
+        self._budget.allocate_struct(layout)
+
+        for index, expression, typ in fields:
+            value.values[index] = self._evaluate_as(expression, typ)
+
+        return value
+
+    # endregion
+
+    # region Private Methods (Helpers)
+
+    def _evaluate_as(self, node: Expression, typ: ResolvedType) -> Value:
+        value = self._convert(self.evaluate(node),
+                              self._types.type_of(node), typ)
+        return self._copy(value, node)
+
+    def _apply(self, node: Operation, operands: tuple[Expression, ...],
+               values: tuple[Value, ...]) -> Value:
+        target = self._types.target(node)
+
+        arguments = tuple(
+            self._convert(value, self._types.type_of(operand), parameter)
+            for value, operand, parameter
+            in zip(values, operands, target.parameters)
+        )
+
+        if target.is_builtin:
+            result = apply(target, arguments)
+
+            if self._flags.maximum_allocated_bytes is not None and \
+                    target.return_type == BuiltinType.Str:
+                self._budget.allocate_text(arguments[0], result)
+
+            return result
+
+        return self.call(target.declaration, list(arguments))
+
+    def _dispatch(self, cache: InlineCache, nodes: list[Expression],
+                  values: list[Value]) -> Signature:
+        types = tuple(
+            value.type if isinstance(value, StructValue)
+            else self._types.type_of(node)
+            for value, node in zip(values, nodes)
+        )
+
+        if (target := cache.lookup(types)) is None:
+            raise PanicException(
+                f"No overload of '{cache.name}' for "
+                f"({', '.join(str(typ) for typ in types)})"
+            )
+
+        return target
+
+    def _convert(self, value: Value, source: ResolvedType,
+                 target: ResolvedType) -> Value:
+        if source == target:
+            return value
+
+        if isinstance(source, BuiltinType):
+            return convert(value, source, target)
+
+        low, high = self._registry.tags(target)
+        if low <= value.layout.tag < high:
+            return value
+
+        raise InvalidCastPanic(value.type, target)
+
+    def _copy(self, value: Value, node: Expression) -> Value:
+        # Struct values are passed by value
+        if isinstance(value, StructValue) and \
+                not isinstance(node, (NewStruct, FnCall)):
+            if self._flags.copy_on_write:
+                return value.share()
+            self._budget.allocate_struct(value.layout)
+            return value.copy()
+
+        return value
+
+    # endregion
+
+
+# region Helpers
+
+def _access_path(node: Access) -> str:
+    names = []
+
+    while isinstance(node, Access):
+        names.append(node.name.identifier)
+        node = node.parent
+
+    names.append(node.identifier)
+    return ".".join(reversed(names))
+
+# endregion
@@ -0,0 +1,65 @@
+from src.interpreter.values import Value, StructLayout
+from src.parser.ast.declaration.struct_declaration import StructDeclaration
+from src.semantic.registry import TypeRegistry
+from src.semantic.types import ResolvedType, BuiltinType, UserType, \
+    integer_types
+
+
+class Layouts:
+    """
+    Memoized layouts of struct types with prebuilt default instances
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, registry: TypeRegistry):
+        """
+        Creates layouts of module types
+        :param registry: registry of module types
+        """
+        self._registry = registry
+        self._layouts: dict[UserType, StructLayout] = {}
+
+    # endregion
+
+    # region Methods
+
+    def layout(self, typ: UserType) -> StructLayout:
+        """
+        Layout of struct or variant type
+        :param typ: struct or variant type
+        :return: layout with default instance template
+        """
+        if (layout := self._layouts.get(typ)) is not None:
+            return layout
+
+        layout = StructLayout(typ, self._registry.fields(typ),
+                              self._registry.tag(typ))
+        self._layouts[typ] = layout
+        layout.template = [self.default(field) for field in layout.types]
+
+        return layout
+
+    def default(self, typ: ResolvedType) -> Value:
+        """
+        Default value of type, structs are default-initialised recursively
+        :param typ: type of value
+        :return: default value, None for enums
+        """
+        if typ in integer_types:
+            return 0
+
+        match typ:
+            case BuiltinType.F32:
+                return 0.0
+            case BuiltinType.Bool:
+                return False
+            case BuiltinType.Str:
+                return ""
+            case UserType() if isinstance(self._registry.declaration(typ),
+                                          StructDeclaration):
+                return self.layout(typ).instance()
+
+        return None
+
+    # endregion
@@ -0,0 +1,261 @@
+import math
+import operator
+from typing import Callable, Optional
+
+from src.interpreter.errors import IntegerOverflowPanic, \
+    DivisionByZeroPanic, InvalidCastPanic
+from src.interpreter.rope import concat
+from src.interpreter.values import Value
+from src.parser.ast.expressions.binary_operation_type import \
+    EBinaryOperationType
+from src.parser.ast.expressions.unary_operation_type import EUnaryOperationType
+from src.semantic.overloads import OverloadTable
+from src.semantic.signatures import Signature, builtin_signatures, \
+    operator_symbols, binary_operators, compare_operators, unary_operators
+from src.semantic.types import BuiltinType, ResolvedType, integer_ranges, \
+    numeric_types, builtin_types
+
+type Handler = Callable[..., Value]
+
+
+# region Conversions
+
+def format_value(value: Value) -> str:
+    """
+    Text representation of value, used by conversion to str
+    :param value: runtime value
+    :return: text representation
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    return str(value)
+
+
+def wrap_integer(value: int, typ: BuiltinType) -> int:
+    """
+    Wraps integer to width of type (two's complement)
+    :param value: integer value
+    :param typ: integer type
+    :return: wrapped value
+    """
+    low, high = integer_ranges[typ]
+    return (value - low) % (high - low + 1) + low
+
+
+def convert(value: Value, source: BuiltinType, target: BuiltinType) -> Value:
+    """
+    Converts value between builtin types
+    :param value: value of source type
+    :param source: type of value
+    :param target: type to convert to
+    :return: converted value
+    """
+    if source == target:
+        return value
+
+    if target == BuiltinType.Str:
+        return format_value(value)
+
+    if target == BuiltinType.Bool:
+        if source == BuiltinType.Str:
+            return value != ""
+        return value != 0
+
+    if source in numeric_types:
+        if target in integer_ranges:
+            if source == BuiltinType.F32:
+                if not math.isfinite(value):
+                    raise InvalidCastPanic(source, target)
+                value = int(value)
+
+            return wrap_integer(value, target)
+
+        if target == BuiltinType.F32:
+            return float(value)
+
+    raise InvalidCastPanic(source, target)
+
+
+def converter(source: ResolvedType, target: ResolvedType
+              ) -> Optional[Callable[[Value], Value]]:
+    """
+    Conversion function between builtin types
+    :param source: type of value
+    :param target: type to convert to
+    :return: conversion function or None if conversion does not change value
+    """
+    if source == target or not isinstance(source, BuiltinType) or \
+            not isinstance(target, BuiltinType):
+        return None
+
+    if source in integer_ranges and target in integer_ranges:
+        low, high = integer_ranges[source]
+        target_low, target_high = integer_ranges[target]
+        if target_low <= low and high <= target_high:
+            return None
+
+    return lambda value: convert(value, source, target)
+
+
+# endregion
+
+# region Generic Operations
+
+def _divide(left: int | float, right: int | float) -> int | float:
+    if right == 0:
+        raise DivisionByZeroPanic()
+
+    if isinstance(left, float) or isinstance(right, float):
+        return left / right
+
+    # Integer division truncates towards zero
+    quotient = abs(left) // abs(right)
+    return quotient if (left < 0) == (right < 0) else -quotient
+
+
+_functions = {
+    "__add": operator.add,
+    "__sub": operator.sub,
+    "__mul": operator.mul,
+    "__div": _divide,
+    "__lt": operator.lt,
+    "__gt": operator.gt,
+    "__eq": operator.eq,
+    "__ne": operator.ne,
+    "__and": lambda left, right: left and right,
+    "__or": lambda left, right: left or right,
+    "__neg": operator.neg,
+    "__not": operator.not_
+}
+
+_string_functions = {
+    "__add": concat
+}
+
+
+def _function(signature: Signature) -> Handler:
+    if signature.return_type == BuiltinType.Str:
+        return _string_functions[signature.name]
+
+    return _functions[signature.name]
+
+
+def apply(signature: Signature, arguments: tuple[Value, ...]) -> Value:
+    """
+    Applies builtin operation to arguments of its parameter types
+    :param signature: builtin operator signature
+    :param arguments: converted arguments
+    :return: result of operation
+    """
+    name = signature.name
+    result = _function(signature)(*arguments)
+
+    if (limits := integer_ranges.get(signature.return_type)) is not None:
+        low, high = limits
+        if not low <= result <= high:
+            raise IntegerOverflowPanic(operator_symbols[name],
+                                       signature.return_type)
+
+    return result
+
+
+# endregion
+
+# region Specialised Operations
+
+def _specialise(signature: Signature,
+                arguments: tuple[BuiltinType, ...]) -> Handler:
+    function = _function(signature)
+    return_type = signature.return_type
+
+    if return_type in integer_ranges:
+        low, high = integer_ranges[return_type]
+        symbol = operator_symbols[signature.name]
+
+        if len(arguments) == 1:
+            def checked(operand):
+                result = function(operand)
+                if low <= result <= high:
+                    return result
+                raise IntegerOverflowPanic(symbol, return_type)
+        else:
+            def checked(left, right):
+                result = function(left, right)
+                if low <= result <= high:
+                    return result
+                raise IntegerOverflowPanic(symbol, return_type)
+    else:
+        checked = function
+
+    converters = [converter(argument, parameter) for argument, parameter
+                  in zip(arguments, signature.parameters)]
+
+    if not any(converters):
+        return checked
+
+    if len(arguments) == 1:
+        (convert_operand,) = converters
+        return lambda operand: checked(convert_operand(operand))
+
+    convert_left, convert_right = converters
+    convert_left = convert_left or (lambda value: value)
+    convert_right = convert_right or (lambda value: value)
+
+    return lambda left, right: checked(convert_left(left),
+                                       convert_right(right))
+
+
+def _build_handlers() -> dict[tuple, tuple[Signature, Handler]]:
+    table = OverloadTable(builtin_signatures)
+    keys = [
+        (name, left, right)
+        for name in (*binary_operators.values(), *compare_operators.values())
+        for left in numeric_types
+        for right in numeric_types
+    ] + [
+        (unary_operators[EUnaryOperationType.Minus], typ)
+        for typ in numeric_types
+    ] + [
+        (binary_operators[EBinaryOperationType.Add], *arguments)
+        for typ in builtin_types.values()
+        for arguments in ((BuiltinType.Str, typ), (typ, BuiltinType.Str))
+    ]
+
+    built = {}
+    for name, *arguments in keys:
+        if (signature := table.resolve(name, tuple(arguments))) is None:
+            continue
+        built[(name, *arguments)] = (
+            signature, _specialise(signature, tuple(arguments))
+        )
+
+    return built
+
+
+handlers = _build_handlers()
+
+
+def specialised_handler(signature: Signature,
+                        arguments: tuple[ResolvedType, ...]
+                        ) -> Optional[Handler]:
+    """
+    Precomputed handler of builtin numeric operation or string
+    concatenation.
+    Handler converts operands and performs width-specific overflow checks.
+    :param signature: bound operator signature
+    :param arguments: static types of operands
+    :return: handler or None if operation has no specialised handler
+    """
+    if not signature.is_builtin:
+        return None
+
+    entry = handlers.get((signature.name, *arguments))
+
+    # Handler is valid only if it implements the bound signature
+    if entry is None or entry[0] != signature:
+        return None
+
+    return entry[1]
+
+# endregion
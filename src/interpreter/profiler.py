@@ -0,0 +1,329 @@
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Optional
+
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.values import Value
+from src.parser.ast.declaration.function_declaration import FunctionDeclaration
+
+
+@dataclass(frozen=True)
+class ProfileFrame:
+    """
+    FHLL call in sampled stack with statement executed in it
+    """
+    function: str
+    line: int
+    column: int
+
+    def __str__(self) -> str:
+        return f"{self.function} {self.line}:{self.column}"
+
+
+@dataclass
+class Sample:
+    """
+    Sampled FHLL stack (outermost call first) with attributed times
+    """
+    stack: tuple[ProfileFrame, ...]
+    wall: float
+    cpu: float
+
+
+@dataclass
+class Profile:
+    """
+    Samples collected by profiler with flat, call-tree and collapsed-stack
+    reports. Times are wall-clock unless report is asked for CPU time.
+    """
+    samples: list[Sample] = field(default_factory=list)
+
+    # region Methods
+
+    def total(self, cpu: bool = False) -> float:
+        """
+        Total sampled time
+        :param cpu: use CPU time instead of wall time
+        :return: time in seconds
+        """
+        return sum(self._weight(sample, cpu) for sample in self.samples)
+
+    def functions(self, cpu: bool = False
+                  ) -> dict[str, tuple[float, float]]:
+        """
+        Self and total time of functions
+        :param cpu: use CPU time instead of wall time
+        :return: (self, total) times by function, highest self time first
+        """
+        own = defaultdict(float)
+        total = defaultdict(float)
+
+        for sample in self.samples:
+            weight = self._weight(sample, cpu)
+            own[sample.stack[-1].function] += weight
+
+            for function in {frame.function for frame in sample.stack}:
+                total[function] += weight
+
+        return {
+            function: (own[function], total[function])
+            for function in sorted(total, key=lambda f: (-own[f], f))
+        }
+
+    def statements(self, cpu: bool = False) -> dict[ProfileFrame, float]:
+        """
+        Self time of statements
+        :param cpu: use CPU time instead of wall time
+        :return: time by statement, highest first
+        """
+        own = defaultdict(float)
+
+        for sample in self.samples:
+            own[sample.stack[-1]] += self._weight(sample, cpu)
+
+        return dict(sorted(own.items(), key=lambda item: -item[1]))
+
+    def flat(self, cpu: bool = False, limit: int = 20) -> str:
+        """
+        Flat report of functions and statements
+        :param cpu: use CPU time instead of wall time
+        :param limit: maximum number of statements in report
+        :return: report text
+        """
+        total = self.total(cpu) or 1.0
+        lines = [f"{'Self(s)':>9} {'Self%':>6} {'Total(s)':>9} "
+                 f"{'Total%':>6}  Function"]
+
+        for function, (own, cumulative) in self.functions(cpu).items():
+            lines.append(f"{own:>9.3f} {own / total:>6.1%} "
+                         f"{cumulative:>9.3f} {cumulative / total:>6.1%}  "
+                         f"{function}")
+
+        lines.append("")
+        lines.append(f"{'Self(s)':>9} {'Self%':>6}  Statement")
+
+        statements = list(self.statements(cpu).items())[:limit]
+        for frame, own in statements:
+            lines.append(f"{own:>9.3f} {own / total:>6.1%}  {frame}")
+
+        return "\n".join(lines)
+
+    def tree(self, cpu: bool = False) -> str:
+        """
+        Call-tree report, children ordered by total time
+        :param cpu: use CPU time instead of wall time
+        :return: report text
+        """
+        root = _TreeNode()
+
+        for sample in self.samples:
+            weight = self._weight(sample, cpu)
+            node = root
+            for frame in sample.stack:
+                node = node.children.setdefault(frame.function, _TreeNode())
+                node.total += weight
+            node.own += weight
+
+        total = self.total(cpu) or 1.0
+        lines = []
+        stack = [(name, child, 0) for name, child
+                 in reversed(root.ordered())]
+
+        while stack:
+            name, node, depth = stack.pop()
+            lines.append(f"{node.total / total:>6.1%} {node.total:>9.3f}s "
+                         f"{'  ' * depth}{name}")
+            stack.extend((child_name, child, depth + 1) for child_name, child
+                         in reversed(node.ordered()))
+
+        return "\n".join(lines)
+
+    def collapsed(self, lines: bool = False) -> str:
+        """
+        Collapsed stacks for flamegraph tools, one stack per line with
+        number of samples
+        :param lines: include statement positions in frames
+        :return: collapsed stacks
+        """
+        counts = defaultdict(int)
+
+        for sample in self.samples:
+            key = ";".join(str(frame) if lines else frame.function
+                           for frame in sample.stack)
+            counts[key] += 1
+
+        return "\n".join(f"{stack} {count}"
+                         for stack, count in sorted(counts.items()))
+
+    # endregion
+
+    # region Private Methods
+
+    @staticmethod
+    def _weight(sample: Sample, cpu: bool) -> float:
+        return sample.cpu if cpu else sample.wall
+
+    # endregion
+
+
+class _TreeNode:
+    __slots__ = ("children", "total", "own")
+
+    def __init__(self):
+        self.children: dict[str, _TreeNode] = {}
+        self.total = 0.0
+        self.own = 0.0
+
+    def ordered(self) -> list[tuple[str, '_TreeNode']]:
+        return sorted(self.children.items(), key=lambda item: -item[1].total)
+
+
+class Profiler:
+    """
+    Sampling profiler of FHLL programs.
+    Sampler thread periodically inspects Python stack of thread running
+    interpreter and maps it to FHLL calls and statements, interpreter itself
+    runs without any profiling overhead.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, interpreter: Interpreter, interval: float = 0.001):
+        """
+        Creates new profiler
+        :param interpreter: profiled interpreter
+        :param interval: sampling interval in seconds
+        """
+        self._interpreter = interpreter
+        self._interval = interval
+        self._profile = Profile()
+        self._labels: dict[int, str] = {}
+
+        kind = type(interpreter)
+        self._call_code = kind.call.__code__
+        self._execute_code = kind.execute.__code__
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def profile(self) -> Profile:
+        """
+        Collected samples
+        :return: profile
+        """
+        return self._profile
+
+    # endregion
+
+    # region Methods
+
+    def run(self, entry: str = "main") -> Value:
+        """
+        Runs interpreter while sampling it
+        :param entry: name of entry point
+        :return: value returned by entry point
+        """
+        stop = threading.Event()
+        sampler = threading.Thread(target=self._sample, args=(stop,),
+                                   daemon=True)
+        sampler.start()
+
+        try:
+            return self._interpreter.run(entry)
+        finally:
+            stop.set()
+            sampler.join()
+
+    # endregion
+
+    # region Private Methods
+
+    def _sample(self, stop: threading.Event) -> None:
+        ident: Optional[int] = None
+        clock: Optional[int] = None
+        wall = time.perf_counter()
+        cpu = 0.0
+
+        while not stop.wait(self._interval):
+            now = time.perf_counter()
+            frames = sys._current_frames()
+
+            if ident is None or ident not in frames:
+                ident, clock, cpu = self._find_thread(frames)
+                wall = now
+                continue
+
+            stack = self._stack(frames[ident])
+            used = time.clock_gettime(clock) if clock is not None else 0.0
+
+            if stack:
+                self._profile.samples.append(
+                    Sample(stack, now - wall, max(used - cpu, 0.0))
+                )
+
+            wall, cpu = now, used
+
+    def _find_thread(self, frames: dict[int, FrameType]
+                     ) -> tuple[Optional[int], Optional[int], float]:
+        for ident, frame in frames.items():
+            if ident == threading.get_ident() or not self._stack(frame):
+                continue
+
+            try:
+                clock = time.pthread_getcpuclockid(ident)
+                return ident, clock, time.clock_gettime(clock)
+            except (AttributeError, OSError):
+                return ident, None, 0.0
+
+        return None, None, 0.0
+
+    def _stack(self, frame: Optional[FrameType]
+               ) -> tuple[ProfileFrame, ...]:
+        calls = []
+        statement = None
+
+        # Innermost executed statement belongs to innermost call
+        while frame is not None:
+            code = frame.f_code
+
+            if code is self._execute_code or code is self._call_code:
+                local = frame.f_locals
+
+                if local.get("self") is self._interpreter:
+                    if code is self._execute_code:
+                        if statement is None:
+                            statement = local["node"]
+                    else:
+                        calls.append(
+                            self._frame(local["function"], statement)
+                        )
+                        statement = None
+
+            frame = frame.f_back
+
+        return tuple(reversed(calls))
+
+    def _frame(self, function: FunctionDeclaration,
+               statement: Optional[object]) -> ProfileFrame:
+        location = statement.location if statement is not None \
+            else function.location
+
+        return ProfileFrame(self._label(function), location.begin.line,
+                            location.begin.column)
+
+    def _label(self, function: FunctionDeclaration) -> str:
+        if (label := self._labels.get(id(function))) is None:
+            signature = self._interpreter.analysis.types.signature(function)
+            parameters = ", ".join(str(typ) for typ in signature.parameters)
+            label = f"{signature.name}({parameters})"
+            self._labels[id(function)] = label
+
+        return label
+
+    # endregion
@@ -0,0 +1,100 @@
+from typing import Optional
+
+type Text = str | 'Rope'
+
+# Concatenations shorter than limit produce flat strings
+FLAT_LIMIT = 1024
+
+
+class Rope:
+    """
+    Immutable runtime string built by repeated concatenation.
+    Ropes created by appending to each other share one buffer of parts,
+    every rope owns a prefix of that buffer, so appending to the most recent
+    rope is O(1) amortised. Text is joined lazily and cached.
+    """
+
+    __slots__ = ("_parts", "_count", "_length", "_text")
+
+    # region Dunder Methods
+
+    def __init__(self, parts: list[str], length: int):
+        """
+        Creates new rope owning all parts of buffer
+        :param parts: buffer of parts
+        :param length: total length of parts
+        """
+        self._parts = parts
+        self._count = len(parts)
+        self._length = length
+        self._text: Optional[str] = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        if self._text is None:
+            parts = self._parts
+            if len(parts) != self._count:
+                parts = parts[:self._count]
+            self._text = "".join(parts)
+
+        return self._text
+
+    def __repr__(self) -> str:
+        return f"Rope({str(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (str, Rope)):
+            return NotImplemented
+
+        return len(self) == len(other) and str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __add__(self, other: Text) -> Text:
+        return concat(self, other)
+
+    def __radd__(self, other: Text) -> Text:
+        return concat(other, self)
+
+    # endregion
+
+    # region Methods
+
+    def append(self, text: str) -> 'Rope':
+        """
+        Rope with text appended
+        :param text: appended text
+        :return: new rope
+        """
+        parts = self._parts
+
+        # Buffer was already extended by another rope, start new one
+        if len(parts) != self._count:
+            parts = [str(self)]
+
+        parts.append(text)
+        return Rope(parts, self._length + len(text))
+
+    # endregion
+
+
+def concat(left: Text, right: Text) -> Text:
+    """
+    Concatenates runtime strings
+    :param left: left string
+    :param right: right string
+    :return: flat string if result is short, rope otherwise
+    """
+    if isinstance(right, Rope):
+        right = str(right)
+
+    if isinstance(left, Rope):
+        return left.append(right) if right else left
+
+    if len(left) + len(right) < FLAT_LIMIT:
+        return left + right
+
+    return Rope([left, right], len(left) + len(right))
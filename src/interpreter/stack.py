@@ -0,0 +1,53 @@
+import sys
+import threading
+from typing import Callable
+
+# Python frames used by the interpreter for one FHLL call, with margin for
+# nested statements and expressions
+FRAMES_PER_CALL = 32
+
+# Native stack reserved per FHLL call for C-level recursion
+STACK_PER_CALL = 8 * 1024
+
+MINIMUM_STACK_SIZE = 8 * 1024 * 1024
+
+
+def run_with_depth[T](function: Callable[[], T], depth: int) -> T:
+    """
+    Runs function so that interpreter can nest given number of FHLL calls.
+    Function runs in worker thread with native stack sized for depth, and
+    Python recursion limit is raised for the duration of the call.
+    :param function: executed function
+    :param depth: maximum number of nested FHLL calls
+    :return: result of function
+    """
+    limit = sys.getrecursionlimit()
+    required = limit + depth * FRAMES_PER_CALL
+    outcome: list = []
+
+    def target() -> None:
+        try:
+            outcome.append((True, function()))
+        except BaseException as exception:
+            outcome.append((False, exception))
+
+    previous = threading.stack_size(
+        max(MINIMUM_STACK_SIZE, depth * STACK_PER_CALL)
+    )
+    try:
+        sys.setrecursionlimit(max(limit, required))
+        worker = threading.Thread(target=target, daemon=True)
+        worker.start()
+    finally:
+        threading.stack_size(previous)
+
+    try:
+        worker.join()
+    finally:
+        sys.setrecursionlimit(limit)
+
+    succeeded, result = outcome[0]
+    if not succeeded:
+        raise result
+
+    return result
@@ -0,0 +1,216 @@
+import re
+from typing import Callable, Optional, TextIO
+
+from src.interface.isink import ISink
+from src.interface.isource import ISource
+
+_token = re.compile(r"\S+")
+
+
+# region Sinks and Sources
+
+class StreamSink(ISink):
+    """
+    Sink writing to text stream
+    """
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+
+    def write(self, text: str) -> None:
+        self._stream.write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+class MemorySink(ISink):
+    """
+    Sink collecting written text in memory
+    """
+
+    def __init__(self):
+        self._parts: list[str] = []
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        """
+        Text written to sink
+        :return: written text
+        """
+        return "".join(self._parts)
+
+
+class StreamSource(ISource):
+    """
+    Source reading from text stream.
+    Stream is read line by line, reading whole chunk from terminal or pipe
+    would block until chunk is filled.
+    """
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+
+    def read(self, size: int) -> str:
+        return self._stream.readline(size)
+
+
+class MemorySource(ISource):
+    """
+    Source reading from text in memory
+    """
+
+    def __init__(self, text: str):
+        self._text = text
+        self._position = 0
+
+    def read(self, size: int) -> str:
+        chunk = self._text[self._position:self._position + size]
+        self._position += len(chunk)
+        return chunk
+
+
+# endregion
+
+# region Buffers
+
+class OutputBuffer:
+    """
+    Batches writes to sink.
+    Buffer is flushed when its size reaches threshold or on request.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, sink: ISink, threshold: int):
+        """
+        Creates new output buffer
+        :param sink: destination of output
+        :param threshold: size of buffered text which triggers flush
+        """
+        self._sink = sink
+        self._threshold = threshold
+        self._parts: list[str] = []
+        self._size = 0
+
+    # endregion
+
+    # region Methods
+
+    def write(self, text: str) -> None:
+        """
+        Buffers text
+        :param text: written text
+        """
+        self._parts.append(text)
+        self._size += len(text)
+
+        if self._size >= self._threshold:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes buffered text to sink
+        """
+        if self._parts:
+            self._sink.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+
+        self._sink.flush()
+
+    # endregion
+
+
+class InputBuffer:
+    """
+    Reads source in large chunks and splits it into tokens or lines
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, source: ISource, chunk_size: int,
+                 before_read: Callable[[], None] = None):
+        """
+        Creates new input buffer
+        :param source: source of input
+        :param chunk_size: size of chunks read from source
+        :param before_read: called before blocking on source
+        """
+        self._source = source
+        self._chunk_size = chunk_size
+        self._before_read = before_read
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    # endregion
+
+    # region Methods
+
+    def read_token(self) -> Optional[str]:
+        """
+        Reads next whitespace separated token
+        :return: token, None at end of input
+        """
+        while True:
+            match = _token.search(self._buffer, self._position)
+
+            # Token touching end of buffer may continue in next chunk
+            if match is not None and \
+                    (match.end() < len(self._buffer) or self._eof):
+                self._position = match.end()
+                return match.group()
+
+            if self._eof:
+                self._position = len(self._buffer)
+                return None
+
+            self._fill()
+
+    def read_line(self) -> Optional[str]:
+        """
+        Reads rest of current line
+        :return: line without newline, None at end of input
+        """
+        while True:
+            end = self._buffer.find("\n", self._position)
+
+            if end != -1:
+                line = self._buffer[self._position:end]
+                self._position = end + 1
+                return line
+
+            if self._eof:
+                if self._position == len(self._buffer):
+                    return None
+
+                line = self._buffer[self._position:]
+                self._position = len(self._buffer)
+                return line
+
+            self._fill()
+
+    # endregion
+
+    # region Private Methods
+
+    def _fill(self) -> None:
+        if self._before_read is not None:
+            self._before_read()
+
+        chunk = self._source.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+
+    # endregion
+
+# endregion
@@ -0,0 +1,153 @@
+from src.interpreter.rope import Rope
+from src.semantic.types import ResolvedType, UserType
+
+type Value = int | float | bool | str | Rope | 'StructValue' | None
+
+
+class StructLayout:
+    """
+    Fixed layout of struct or enum variant fields.
+    Field values of instances are stored in list ordered as declaration.
+    """
+
+    __slots__ = ("type", "tag", "names", "types", "indices", "nested",
+                 "template")
+
+    # region Dunder Methods
+
+    def __init__(self, typ: UserType, fields: dict[str, ResolvedType],
+                 tag: int = 0):
+        """
+        Creates new struct layout
+        :param typ: struct or variant type
+        :param fields: field types by name in declaration order
+        :param tag: numeric tag of type
+        """
+        self.type = typ
+        self.tag = tag
+        self.names = tuple(fields)
+        self.types = tuple(fields.values())
+        self.indices = {name: index for index, name in enumerate(fields)}
+
+        # Fields which may hold struct values shared with other instances
+        self.nested = tuple(index for index, field in enumerate(self.types)
+                            if isinstance(field, UserType))
+
+        self.template: list[Value] = []
+
+    # endregion
+
+    # region Methods
+
+    def index(self, name: str) -> int:
+        """
+        Index of field
+        :param name: field name
+        :return: index of field value in instance
+        """
+        return self.indices[name]
+
+    def instance(self) -> 'StructValue':
+        """
+        New default-initialised instance copied from template.
+        Nested structs stay shared with template until written.
+        :return: new instance
+        """
+        return StructValue(self, self.template).clone()
+
+    # endregion
+
+
+class StructValue:
+    """
+    Runtime instance of struct or enum variant.
+    Instances are copy-on-write: passing by value only marks instance as
+    shared, holders clone shared instance before writing to it.
+    """
+
+    __slots__ = ("layout", "values", "shared")
+
+    # region Dunder Methods
+
+    def __init__(self, layout: StructLayout, values: list[Value]):
+        """
+        Creates new struct instance
+        :param layout: layout of struct or variant
+        :param values: field values in layout order
+        """
+        self.layout = layout
+        self.values = values
+        self.shared = False
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StructValue):
+            return NotImplemented
+
+        return self.layout.type == other.layout.type and \
+            self.values == other.values
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value
+                           in zip(self.layout.names, self.values))
+        return f"{self.layout.type} {{ {fields} }}"
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def type(self) -> UserType:
+        """
+        Runtime type of instance
+        :return: struct or variant type
+        """
+        return self.layout.type
+
+    # endregion
+
+    # region Methods
+
+    def field(self, name: str) -> Value:
+        """
+        Value of field by name
+        :param name: field name
+        :return: field value
+        """
+        return self.values[self.layout.indices[name]]
+
+    def share(self) -> 'StructValue':
+        """
+        Marks instance as shared, used for passing by value
+        :return: same instance
+        """
+        self.shared = True
+        return self
+
+    def clone(self) -> 'StructValue':
+        """
+        Shallow copy of instance owned by caller, nested structs become
+        shared between copy and original
+        :return: unshared copy
+        """
+        values = self.values.copy()
+
+        for index in self.layout.nested:
+            if (value := values[index]) is not None:
+                value.shared = True
+
+        return StructValue(self.layout, values)
+
+    def copy(self) -> 'StructValue':
+        """
+        Deep copy of instance
+        :return: copied instance
+        """
+        values = self.values.copy()
+
+        for index in self.layout.nested:
+            if (value := values[index]) is not None:
+                values[index] = value.copy()
+
+        return StructValue(self.layout, values)
+
+    # endregion
@@ -58,3 +58,15 @@ class ExpectingCharException(LexerException):
         self.expected = expected
         self.got = got
         self.position = position
+
+
+def error_position(exception: Exception) -> Position:
+    """
+    Position where error begins, errors store either location or position
+    :param exception: lexer, parser or semantic error
+    :return: begin position of error
+    """
+    if (location := getattr(exception, "location", None)) is not None:
+        return location.begin
+
+    return exception.position
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Callable
 
 from src.flags import Flags
 from src.interface.ilexer import ILexer
@@ -9,11 +9,15 @@ from src.lexer.errors import IdentifierTooLongException, \
     InvalidEscapeSequenceException, ExpectingCharException
 from src.lexer.iter import LexerIter
 from src.common.location import Location
+from src.common.symbols import SymbolTable
 from src.common.position import Position
 from src.lexer.token import Token
 from src.lexer.token_kind import TokenKind
+from src.lexer.trivia import Trivia, TriviaKind
 from src.utils.buffer import StreamBuffer
-from src.utils.builder import StringBuilder
+from src.utils.span import Span
+from src.utils.char_class import WHITESPACE, IDENTIFIER_START, IDENTIFIER, \
+    DECIMAL, STRING, COMMENT, TABLE, char_class
 
 
 class Lexer(ILexer):
@@ -56,16 +60,29 @@ class Lexer(ILexer):
 
     string_delimiter = "\""
 
+    punctuation_chars = "(){}.,;:"
+
+    operator_chars = "><+*&|!=-"
+
     # region Dunder Methods
 
-    def __init__(self, stream: StreamBuffer, flags: Flags = None):
+    def __init__(self, stream: StreamBuffer, flags: Flags = None,
+                 symbols: SymbolTable = None, skip_comments: bool = False,
+                 trivia: Trivia = None):
         """
         Creates new lexer
         :param stream: input stream buffer
         :param flags: interpreter flags
+        :param symbols: table interning identifiers, created if omitted
+        :param skip_comments: skip comments like whitespace instead of
+            returning Comment tokens
+        :param trivia: side table recording skipped whitespace and comments
         """
         self._stream = stream
         self._flags = flags if flags is not None else Flags()
+        self._symbols = symbols if symbols is not None else SymbolTable()
+        self._skip_comments = skip_comments
+        self._trivia = trivia
 
         self._builders = {
             self._build_punctation,
@@ -76,6 +93,9 @@ class Lexer(ILexer):
             self._build_string
         }
 
+        # Builder by first character of token, for first 256 code points
+        self._dispatch = self._create_dispatch_table()
+
     def __iter__(self):
         return LexerIter(self)
 
@@ -91,6 +111,22 @@ class Lexer(ILexer):
         """
         return self._flags
 
+    @property
+    def symbols(self) -> SymbolTable:
+        """
+        Identifiers interned by lexer
+        :return: symbol table
+        """
+        return self._symbols
+
+    @property
+    def trivia(self) -> Optional[Trivia]:
+        """
+        Skipped whitespace and comments, if recorded
+        :return: trivia side table or None
+        """
+        return self._trivia
+
     # endregion
 
     # region Methods
@@ -105,45 +141,108 @@ class Lexer(ILexer):
         if self._stream.char is None:
             self._stream.read_next_char()
 
-        # Skip whitespaces
-        while not self._stream.eof and self._stream.char.isspace():
-            self._stream.read_next_char()
+        # Skip whitespaces and comments
+        self._skip_whitespace()
+        while self._skip_comments and self._skip_comment():
+            self._skip_whitespace()
 
         # Return EOF token on end
         if self._stream.eof:
             return Token(TokenKind.EOF,
                          Location.at(self._stream.position))
 
+        char = self._stream.char
+        if char < "\u0100":
+            builder = self._dispatch[ord(char)]
+            if builder is not None and (token := builder()):
+                return token
+            return self._build_invalid()
+
         # Try build token
         for builder in self._builders:
             if token := builder():
                 return token
 
+        return self._build_invalid()
+
     # endregion
 
     # region Private Methods
 
+    def _skip_whitespace(self) -> None:
+        if self._trivia is None:
+            self._stream.read_while(WHITESPACE)
+            return
+
+        begin = self._stream.position
+        if span := self._stream.read_span(WHITESPACE):
+            self._trivia.add(TriviaKind.Whitespace,
+                             Location(begin, self._stream.previous_position),
+                             span)
+
+    def _skip_comment(self) -> bool:
+        if self._stream.eof or self._stream.char != "/" or \
+                self._stream.peek() != "/":
+            return False
+
+        begin = self._stream.position
+        self._stream.read_next_char()
+        self._stream.read_next_char()
+        span = self._stream.read_span(COMMENT)
+
+        if self._trivia is not None:
+            self._trivia.add(TriviaKind.Comment,
+                             Location(begin, self._stream.previous_position),
+                             span)
+
+        return True
+
+    def _create_dispatch_table(self) -> list[Optional[Callable]]:
+        table: list[Optional[Callable]] = [None] * len(TABLE)
+
+        for code, classes in enumerate(TABLE):
+            char = chr(code)
+
+            if char in self.punctuation_chars:
+                table[code] = self._build_punctation
+            elif char in self.operator_chars:
+                table[code] = self._build_operator
+            elif char == "/":
+                table[code] = self._build_comment_or_divide
+            elif char == self.string_delimiter:
+                table[code] = self._build_string
+            elif classes & IDENTIFIER_START:
+                table[code] = self._build_identifier_or_keyword
+            elif classes & DECIMAL:
+                table[code] = self._build_number_literal
+
+        return table
+
+    def _build_invalid(self) -> Token:
+        # Unknown char is consumed, so parser can report it and go on
+        begin = self._stream.position
+        char = self._stream.char
+        self._stream.read_next_char()
+
+        return Token(TokenKind.Invalid,
+                     Location(begin, self._stream.previous_position), char)
+
     def _build_identifier_or_keyword(self) -> Optional[Token]:
         if not self.is_first_identifier_char(self._stream.char):
             return None
 
-        builder = StringBuilder()
         begin = self._stream.position
-        builder += self._stream.char
-        self._stream.read_next_char()
-
-        while builder.length <= self._flags.maximum_identifier_length and \
-                self.is_identifier_char(self._stream.char) and \
-                not self._stream.eof:
-            builder += self._stream.char
-            self._stream.read_next_char()
+        value = self._stream.read_while(
+            IDENTIFIER, self._flags.maximum_identifier_length + 1
+        )
 
-        end = self._stream.previous_position
-        location = Location(begin, end)
-        value = builder.build()
+        if len(value) > self._flags.maximum_identifier_length:
+            # Rest of identifier is skipped, lexing resumes after it
+            self._stream.read_while(IDENTIFIER)
+            raise IdentifierTooLongException(
+                Location(begin, self._stream.previous_position))
 
-        if builder.length > self._flags.maximum_identifier_length:
-            raise IdentifierTooLongException(location)
+        location = Location(begin, self._stream.previous_position)
 
         if (builtin := self.builtin_types.get(value)) is not None:
             return Token(builtin, location)
@@ -154,10 +253,12 @@ class Lexer(ILexer):
         if value == "true" or value == "false":
             return Token(TokenKind.Boolean, location, value == "true")
 
-        return Token(TokenKind.Identifier, location, value)
+        symbol = self._symbols.intern(value)
+        return Token(TokenKind.Identifier, location,
+                     self._symbols.name(symbol), symbol)
 
     def _build_number_literal(self) -> Optional[Token]:
-        if not self._stream.char.isdecimal():
+        if not char_class(self._stream.char) & DECIMAL:
             return None
 
         begin = self._stream.position
@@ -183,58 +284,51 @@ class Lexer(ILexer):
         return Token(TokenKind.Float, Location(begin, end), value)
 
     def _internal_build_integer(self) -> int:
-        value = 0
-        length = 0
         begin = self._stream.position
+        digits = self._stream.read_while(DECIMAL)
 
-        while self._stream.char.isdecimal() and not self._stream.eof:
-            if length > 0 and value == 0:
-                raise IntegerLeadingZerosException(
-                    Location(begin, self._stream.previous_position))
-
-            digit = int(self._stream.char)
-            value = value * 10 + digit
+        if len(digits) > 1 and int(digits[0]) == 0:
+            raise IntegerLeadingZerosException(Location(begin, begin))
 
-            length += 1
-
-            self._stream.read_next_char()
-
-        return value
+        return int(digits)
 
     def _internal_build_fraction(self) -> float:
-        value = 0
-        multiplier = 0
+        digits = self._stream.read_while(DECIMAL)
 
-        while self._stream.char.isdecimal() and not self._stream.eof:
-            digit = int(self._stream.char)
-            value = value * 10 + digit
-            multiplier += 1
-            self._stream.read_next_char()
+        if not digits:
+            return 0.0
 
-        return value / (10 ** multiplier)
+        return int(digits) / (10 ** len(digits))
 
     def _build_string(self) -> Optional[Token]:
         if self._stream.char != self.string_delimiter:
             return None
 
-        builder = StringBuilder()
+        parts: list[Span | str] = []
+        length = 0
         begin = self._stream.position
         self._stream.read_next_char()
 
-        while builder.length <= self._flags.maximum_string_length and \
+        while length <= self._flags.maximum_string_length and \
                 self._stream.char != self.string_delimiter and \
                 not self._stream.eof:
 
-            char = self._stream.char
+            if self._stream.char != "\\":
+                span = self._stream.read_span(
+                    STRING, self._flags.maximum_string_length + 1 - length
+                )
+                parts.append(span)
+                length += len(span)
+                continue
 
-            if self._stream.char == "\\":
-                self._stream.read_next_char()
-                char = self._internal_build_escape_sequence(begin)
-
-            builder += char
+            self._stream.read_next_char()
+            parts.append(self._internal_build_escape_sequence(begin))
+            length += 1
             self._stream.read_next_char()
 
-        if builder.length > self._flags.maximum_string_length:
+        if length > self._flags.maximum_string_length:
+            # Rest of literal is skipped, lexing resumes after it
+            self._internal_skip_string()
             raise StringTooLongException(
                 Location(begin, self._stream.previous_position))
 
@@ -244,10 +338,30 @@ class Lexer(ILexer):
             raise UnterminatedStringException(
                 Location(begin, self._stream.previous_position))
 
-        value = builder.build()
+        # Escape-free literal stays single span of source
+        if len(parts) == 1:
+            value = parts[0]
+        else:
+            value = "".join(str(part) for part in parts)
+
         return Token(TokenKind.String,
                      Location(begin, self._stream.previous_position), value)
 
+    def _internal_skip_string(self) -> None:
+        while True:
+            self._stream.read_span(STRING)
+
+            if self._stream.eof:
+                return
+
+            if self._stream.char == self.string_delimiter:
+                self._stream.read_next_char()
+                return
+
+            # Escaped char, also delimiter, does not end literal
+            self._stream.read_next_char()
+            self._stream.read_next_char()
+
     def _internal_build_escape_sequence(self, begin: Position) -> str:
         if self._stream.eof:
             raise UnterminatedStringException(
@@ -368,14 +482,11 @@ class Lexer(ILexer):
         begin = self._stream.previous_position
         self._stream.read_next_char()
 
-        builder = StringBuilder()
-        while self._stream.char != "\n" and not self._stream.eof:
-            builder += self._stream.char
-            self._stream.read_next_char()
+        value = self._stream.read_span(COMMENT)
 
         return Token(TokenKind.Comment,
                      Location(begin, self._stream.previous_position),
-                     builder.build())
+                     value)
 
     # endregion
 
@@ -383,10 +494,10 @@ class Lexer(ILexer):
 
     @staticmethod
     def is_first_identifier_char(char: str) -> bool:
-        return char.isalpha() or char == "_"
+        return char_class(char) & IDENTIFIER_START != 0
 
     @staticmethod
     def is_identifier_char(char: str) -> bool:
-        return char.isalnum() or char == "_"
+        return char_class(char) & IDENTIFIER != 0
 
     # endregion
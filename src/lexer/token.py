@@ -3,30 +3,34 @@ from typing import Optional
 from src.interface.itoken import IToken
 from src.common.location import Location
 from src.lexer.token_kind import TokenKind
+from src.utils.span import Span
 
 
 class Token[T: (int, float, bool, str, None)](IToken):
     """
-    Class representing a token
+    Class representing a token.
+    Value may be given as span of source, which is sliced on first access.
     """
 
     # region Dunder Methods
 
     def __init__(self, kind: TokenKind, location: Location,
-                 value: Optional[T] = None):
+                 value: Optional[T | Span] = None,
+                 symbol: Optional[int] = None):
         self._kind = kind
         self._value = value
         self._location = location
+        self._symbol = symbol
 
     def __str__(self) -> str:
-        value = f"({repr(self._value)})" if self._value is not None else ""
+        value = f"({repr(self.value)})" if self._value is not None else ""
         position = f"{self._location.begin.line}:{self._location.begin.column}"
         return f"{self._kind.value}{value} at <{position}>"
 
     def __repr__(self) -> str:
         return (f"Token(kind={self._kind}, "
                 f"location={repr(self._location)}, "
-                f"value={repr(self._value)})")
+                f"value={repr(self.value)})")
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Token):
@@ -34,7 +38,7 @@ class Token[T: (int, float, bool, str, None)](IToken):
                 f"Token equality not implemented for {type(other)}")
 
         return self._kind == other._kind and \
-            self._location == other._location and self._value == other._value
+            self._location == other._location and self.value == other.value
 
     # endregion
 
@@ -54,6 +58,9 @@ class Token[T: (int, float, bool, str, None)](IToken):
         The value of the token
         :return: value of the token
         """
+        if type(self._value) is Span:
+            self._value = str(self._value)
+
         return self._value
 
     @property
@@ -64,4 +71,12 @@ class Token[T: (int, float, bool, str, None)](IToken):
         """
         return self._location
 
+    @property
+    def symbol(self) -> Optional[int]:
+        """
+        The symbol of identifier token in lexer symbol table
+        :return: symbol of identifier, None for other tokens
+        """
+        return self._symbol
+
     # endregion
@@ -3,7 +3,8 @@ from enum import Enum
 
 class TokenKind(Enum):
     """
-    Enum class that represents the kind of token
+    Enum class that represents the kind of token.
+    Each kind has dense integer code and bit mask for membership tests.
     """
 
     # Builtin Types
@@ -78,3 +79,12 @@ class TokenKind(Enum):
 
     Invalid = "<invalid>"
     EOF = "<eof>"
+
+    # region Dunder Methods
+
+    def __init__(self, text: str):
+        # Dense integer code and single-bit mask used by TokenKindSet
+        self.code = len(type(self).__members__)
+        self.mask = 1 << self.code
+
+    # endregion
@@ -0,0 +1,51 @@
+from typing import Iterator
+
+from src.lexer.token_kind import TokenKind
+
+
+class TokenKindSet:
+    """
+    Immutable set of token kinds stored as bitmask of kind codes.
+    Membership test is single bitwise and, without allocation.
+    """
+
+    __slots__ = ("mask",)
+
+    # region Dunder Methods
+
+    def __init__(self, *kinds: TokenKind):
+        """
+        Creates new set of token kinds
+        :param kinds: kinds in set
+        """
+        mask = 0
+        for kind in kinds:
+            mask |= kind.mask
+
+        self.mask = mask
+
+    def __contains__(self, kind: TokenKind) -> bool:
+        return self.mask & kind.mask != 0
+
+    def __iter__(self) -> Iterator[TokenKind]:
+        return (kind for kind in TokenKind if self.mask & kind.mask)
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __or__(self, other: 'TokenKindSet | TokenKind') -> 'TokenKindSet':
+        result = TokenKindSet()
+        result.mask = self.mask | other.mask
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TokenKindSet) and self.mask == other.mask
+
+    def __hash__(self) -> int:
+        return hash(self.mask)
+
+    def __repr__(self) -> str:
+        kinds = ", ".join(kind.name for kind in self)
+        return f"TokenKindSet({kinds})"
+
+    # endregion
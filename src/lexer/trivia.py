@@ -0,0 +1,112 @@
+from bisect import bisect_left
+from enum import Enum
+from typing import Iterator
+
+from src.common.location import Location
+from src.common.position import Position
+from src.utils.span import Span
+
+
+class TriviaKind(Enum):
+    """
+    Enum class that represents the kind of skipped source text
+    """
+    Whitespace = "whitespace"
+    Comment = "comment"
+
+
+class TriviaEntry:
+    """
+    Skipped whitespace or comment, text is sliced from source on access
+    """
+
+    __slots__ = ("kind", "location", "_text")
+
+    # region Dunder Methods
+
+    def __init__(self, kind: TriviaKind, location: Location,
+                 text: Span | str):
+        self.kind = kind
+        self.location = location
+        self._text = text
+
+    def __repr__(self) -> str:
+        return f"TriviaEntry(kind={self.kind}, " \
+               f"location={self.location!r}, text={self.text!r})"
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def text(self) -> str:
+        """
+        Skipped text, without leading slashes of comment
+        :return: text of entry
+        """
+        if type(self._text) is Span:
+            self._text = str(self._text)
+
+        return self._text
+
+    # endregion
+
+
+class Trivia:
+    """
+    Side table of whitespace and comments skipped by lexer, in source order
+    """
+
+    # region Dunder Methods
+
+    def __init__(self):
+        self._entries: list[TriviaEntry] = []
+        self._begins: list[tuple[int, int]] = []
+
+    def __iter__(self) -> Iterator[TriviaEntry]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def comments(self) -> list[TriviaEntry]:
+        """
+        Skipped comments
+        :return: comment entries in source order
+        """
+        return [entry for entry in self._entries
+                if entry.kind == TriviaKind.Comment]
+
+    # endregion
+
+    # region Methods
+
+    def add(self, kind: TriviaKind, location: Location,
+            text: Span | str) -> None:
+        """
+        Records skipped text
+        :param kind: kind of text
+        :param location: location of text
+        :param text: text or its span in source
+        """
+        self._entries.append(TriviaEntry(kind, location, text))
+        self._begins.append((location.begin.line, location.begin.column))
+
+    def between(self, begin: Position, end: Position) -> list[TriviaEntry]:
+        """
+        Entries starting in range, e.g. comments preceding a declaration
+        :param begin: first position of range
+        :param end: position after range
+        :return: entries in source order
+        """
+        low = bisect_left(self._begins, (begin.line, begin.column))
+        high = bisect_left(self._begins, (end.line, end.column))
+
+        return self._entries[low:high]
+
+    # endregion
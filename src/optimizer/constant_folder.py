@@ -0,0 +1,240 @@
+from typing import Optional
+
+from src.interface.ivisitor import IVisitor
+from src.interpreter.errors import PanicException
+from src.interpreter.operators import apply, convert
+from src.parser.ast.cast import Cast
+from src.parser.ast.constant import Constant
+from src.parser.ast.expressions.binary_operation import BinaryOperation
+from src.parser.ast.expressions.bool_operation import BoolOperation
+from src.parser.ast.expressions.bool_operation_type import EBoolOperationType
+from src.parser.ast.expressions.compare import Compare
+from src.parser.ast.expressions.expression import Expression
+from src.parser.ast.expressions.unary_operation import UnaryOperation
+from src.parser.ast.module import Module
+from src.parser.ast.node import Node
+from src.parser.ast.statements.assignment import Assignment
+from src.parser.ast.statements.block import Block
+from src.parser.ast.statements.fn_call import FnCall
+from src.parser.ast.statements.if_statement import IfStatement
+from src.parser.ast.statements.match_statement import MatchStatement
+from src.parser.ast.statements.new_struct_statement import NewStruct
+from src.parser.ast.statements.return_statement import ReturnStatement
+from src.parser.ast.statements.variable_declaration import VariableDeclaration
+from src.parser.ast.statements.while_statement import WhileStatement
+from src.semantic.analyzer import Analysis
+from src.semantic.signatures import Signature
+from src.semantic.types import BuiltinType, ResolvedType
+
+
+class ConstantFolder(IVisitor[Node]):
+    """
+    Optimisation pass over analysed module.
+    Folds operations on constants and removes branches with constant
+    conditions. Folded constants keep the type of replaced expression in
+    the TypeTable, so module must not be analysed again afterwards.
+    Operations that would panic (overflow, division by zero, invalid cast)
+    are left to panic at runtime.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, analysis: Analysis):
+        """
+        Creates new constant folder
+        :param analysis: analysis of module to optimise
+        """
+        self._analysis = analysis
+        self._types = analysis.types
+
+        self._folded = 0
+        self._eliminated = 0
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def folded(self) -> int:
+        """
+        Number of folded operations
+        :return: number of operations replaced with constants
+        """
+        return self._folded
+
+    @property
+    def eliminated(self) -> int:
+        """
+        Number of eliminated statements
+        :return: number of removed if and while statements
+        """
+        return self._eliminated
+
+    # endregion
+
+    # region Methods
+
+    def fold(self) -> Module:
+        """
+        Optimises module in place
+        :return: optimised module
+        """
+        module = self._analysis.module
+
+        for function in module.function_declarations:
+            self.visit(function.block)
+
+        return module
+
+    def visit(self, node: Node) -> Optional[Node]:
+        """
+        Folds node and its children
+        :param node: statement or expression
+        :return: replacement node, None if statement was removed
+        """
+        match node:
+            case Block():
+                node.body = self._fold_body(node.body)
+            case VariableDeclaration() if node.value is not None:
+                node.value = self.visit(node.value)
+            case Assignment():
+                node.value = self.visit(node.value)
+            case ReturnStatement() if node.value is not None:
+                node.value = self.visit(node.value)
+            case FnCall():
+                node.arguments = [self.visit(argument)
+                                  for argument in node.arguments]
+            case NewStruct():
+                for assignment in node.assignments:
+                    self.visit(assignment)
+            case MatchStatement():
+                node.expression = self.visit(node.expression)
+                for matcher in node.matchers:
+                    self.visit(matcher.block)
+            case IfStatement():
+                return self._fold_if_statement(node)
+            case WhileStatement():
+                return self._fold_while_statement(node)
+            case BinaryOperation() | Compare():
+                node.left = self.visit(node.left)
+                node.right = self.visit(node.right)
+                return self._fold_operation(node, node.left, node.right)
+            case UnaryOperation():
+                node.operand = self.visit(node.operand)
+                return self._fold_operation(node, node.operand)
+            case BoolOperation():
+                node.left = self.visit(node.left)
+                node.right = self.visit(node.right)
+                return self._fold_bool_operation(node)
+            case Cast():
+                node.value = self.visit(node.value)
+                return self._fold_cast(node)
+
+        return node
+
+    # endregion
+
+    # region Private Methods (Statements)
+
+    def _fold_body(self, body: list[Node]) -> list[Node]:
+        return [folded for statement in body
+                if (folded := self.visit(statement)) is not None]
+
+    def _fold_if_statement(self, node: IfStatement) -> Optional[Node]:
+        node.condition = self.visit(node.condition)
+        self.visit(node.block)
+        if node.else_block is not None:
+            self.visit(node.else_block)
+
+        if (condition := self._condition(node.condition)) is None:
+            return node
+
+        self._eliminated += 1
+        return node.block if condition else node.else_block
+
+    def _fold_while_statement(self, node: WhileStatement) -> Optional[Node]:
+        node.condition = self.visit(node.condition)
+        self.visit(node.block)
+
+        if self._condition(node.condition) is False:
+            self._eliminated += 1
+            return None
+
+        return node
+
+    # endregion
+
+    # region Private Methods (Expressions)
+
+    def _fold_operation(self, node: Expression, *operands: Expression
+                        ) -> Expression:
+        target = self._types.target(node)
+
+        if not isinstance(target, Signature) or not target.is_builtin or \
+                not all(isinstance(operand, Constant) for operand in operands):
+            return node
+
+        try:
+            arguments = tuple(
+                convert(operand.value, self._types.type_of(operand), typ)
+                for operand, typ in zip(operands, target.parameters)
+            )
+            value = apply(target, arguments)
+        except PanicException:
+            return node
+
+        return self._constant(node, value, self._types.type_of(node))
+
+    def _fold_bool_operation(self, node: BoolOperation) -> Expression:
+        target = self._types.target(node)
+
+        if not target.is_builtin or \
+                (left := self._condition(node.left)) is None:
+            return node
+
+        # Result is decided by left operand, right one is never evaluated
+        if left == (node.op == EBoolOperationType.Or):
+            return self._constant(node, left, BuiltinType.Bool)
+
+        if (right := self._condition(node.right)) is not None:
+            return self._constant(node, right, BuiltinType.Bool)
+
+        if self._types.type_of(node.right) == BuiltinType.Bool:
+            self._folded += 1
+            return node.right
+
+        return node
+
+    def _fold_cast(self, node: Cast) -> Expression:
+        if not isinstance(node.value, Constant):
+            return node
+
+        try:
+            value = convert(node.value.value,
+                            self._types.type_of(node.value),
+                            self._types.type_of(node))
+        except PanicException:
+            return node
+
+        return self._constant(node, value, self._types.type_of(node))
+
+    # endregion
+
+    # region Private Methods (Helpers)
+
+    def _condition(self, node: Expression) -> Optional[bool]:
+        if not isinstance(node, Constant):
+            return None
+
+        return convert(node.value, self._types.type_of(node),
+                       BuiltinType.Bool)
+
+    def _constant(self, node: Expression, value: object,
+                  typ: ResolvedType) -> Constant:
+        constant = Constant(value=value, location=node.location)
+        self._types.set(constant, typ)
+        self._folded += 1
+
+        return constant
+
+    # endregion
@@ -0,0 +1,186 @@
+from typing import Optional
+
+from src.parser.ast.common import Type
+from src.parser.ast.declaration.declaration import Declaration
+from src.parser.ast.declaration.enum_declaration import EnumDeclaration
+from src.parser.ast.declaration.function_declaration import FunctionDeclaration
+from src.parser.ast.declaration.struct_declaration import StructDeclaration
+from src.parser.ast.variant_access import VariantAccess
+
+type TypePath = tuple[str, ...]
+type ParameterTypes = tuple[TypePath, ...]
+type UserDeclaration = StructDeclaration | EnumDeclaration
+
+
+def type_path(type_node: Type) -> TypePath:
+    """
+    Variant path of type annotation, e.g. ("Shape", "Circle")
+    :param type_node: type annotation
+    :return: path of names
+    """
+    path = []
+
+    while isinstance(type_node, VariantAccess):
+        path.append(type_node.name.identifier)
+        type_node = type_node.parent
+
+    path.append(type_node.identifier)
+    return tuple(reversed(path))
+
+
+class DeclarationIndex:
+    """
+    Declarations of module by name.
+    Functions are grouped into overload sets by parameter type paths,
+    structs, enums and their (nested) variants are indexed by variant path.
+    Index follows declaration lists of module, declarations appended to
+    them are indexed incrementally. Replaced or shortened lists rebuild it,
+    declarations replaced in place are noticed only by invalidate.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self):
+        self._names: dict[str, list[Declaration]] = {}
+        self._functions: dict[str, list[FunctionDeclaration]] = {}
+        self._overloads: dict[
+            str, dict[ParameterTypes, list[FunctionDeclaration]]
+        ] = {}
+        self._types: dict[TypePath, UserDeclaration] = {}
+
+        # Indexed list of module, its length and last declaration
+        self._states: list[tuple[list, int, Optional[Declaration]]] = []
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    # endregion
+
+    # region Methods
+
+    def update(self, functions: list[FunctionDeclaration],
+               structs: list[StructDeclaration],
+               enums: list[EnumDeclaration]) -> None:
+        """
+        Indexes declarations appended to lists since last update.
+        Index is rebuilt if list was replaced, shortened or its last indexed
+        declaration changed, checks take constant time.
+        :param functions: function declarations of module
+        :param structs: struct declarations of module
+        :param enums: enum declarations of module
+        """
+        sources = (functions, structs, enums)
+        states = self._states
+
+        if len(states) != len(sources) or any(
+                source is not indexed or len(source) < count
+                or count and source[count - 1] is not last
+                for source, (indexed, count, last) in zip(sources, states)
+        ):
+            self.invalidate()
+            states = self._states = [(source, 0, None) for source in sources]
+
+        for kind, source in enumerate(sources):
+            if (count := states[kind][1]) == len(source):
+                continue
+
+            for declaration in source[count:]:
+                self.add(declaration)
+            states[kind] = (source, len(source), source[-1])
+
+    def invalidate(self) -> None:
+        """
+        Drops indexed declarations, next update indexes lists again
+        """
+        self._names.clear()
+        self._functions.clear()
+        self._overloads.clear()
+        self._types.clear()
+        self._states = []
+
+    def add(self, declaration: FunctionDeclaration | UserDeclaration
+            ) -> None:
+        """
+        Indexes top level declaration
+        :param declaration: function, struct or enum declaration
+        """
+        name = declaration.name.identifier
+        self._names.setdefault(name, []).append(declaration)
+
+        if isinstance(declaration, FunctionDeclaration):
+            parameters = tuple(type_path(parameter.declared_type)
+                               for parameter in declaration.parameters)
+            self._functions.setdefault(name, []).append(declaration)
+            self._overloads.setdefault(name, {}) \
+                .setdefault(parameters, []).append(declaration)
+        else:
+            self._add_type((), declaration)
+
+    def declarations(self, name: str) -> list[Declaration]:
+        """
+        Top level declarations with name, in declaration order
+        :param name: declared name
+        :return: functions and types named so
+        """
+        return self._names.get(name, [])
+
+    def functions(self, name: str) -> list[FunctionDeclaration]:
+        """
+        All overloads of function
+        :param name: function name
+        :return: function declarations in declaration order
+        """
+        return self._functions.get(name, [])
+
+    def overloads(self, name: str
+                  ) -> dict[ParameterTypes, list[FunctionDeclaration]]:
+        """
+        Overload sets of function
+        :param name: function name
+        :return: declarations grouped by parameter type paths
+        """
+        return self._overloads.get(name, {})
+
+    def overload(self, name: str, parameters: ParameterTypes
+                 ) -> list[FunctionDeclaration]:
+        """
+        Declarations of function with exactly given parameter types
+        :param name: function name
+        :param parameters: type path of each parameter, e.g. (("i64",),)
+        :return: matching declarations, more than one if duplicated
+        """
+        return self._overloads.get(name, {}).get(parameters, [])
+
+    def type(self, path: TypePath | str) -> Optional[UserDeclaration]:
+        """
+        Struct, enum or variant declaration, first one if duplicated
+        :param path: variant path or name of top level type
+        :return: declaration, None if undeclared
+        """
+        if isinstance(path, str):
+            path = (path,)
+
+        return self._types.get(path)
+
+    def variant(self, type_node: Type) -> Optional[UserDeclaration]:
+        """
+        Declaration referenced by type annotation or variant access
+        :param type_node: type annotation, e.g. Shape::Circle
+        :return: declaration, None if undeclared
+        """
+        return self._types.get(type_path(type_node))
+
+    # endregion
+
+    # region Private Methods
+
+    def _add_type(self, parent: TypePath,
+                  declaration: UserDeclaration) -> None:
+        path = parent + (declaration.name.identifier,)
+        self._types.setdefault(path, declaration)
+
+        if isinstance(declaration, EnumDeclaration):
+            for variant in declaration.variants:
+                self._add_type(path, variant)
+
+    # endregion
@@ -1,9 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 
+from src.common.symbols import SymbolTable
+
+from src.parser.ast.declaration.declaration_index import DeclarationIndex
 from src.parser.ast.declaration.enum_declaration import EnumDeclaration
 from src.parser.ast.declaration.function_declaration import FunctionDeclaration
 from src.parser.ast.declaration.struct_declaration import StructDeclaration
 from src.parser.ast.node import Node
+from src.parser.ast.statements.error_statement import ErrorStatement
 
 
 @dataclass
@@ -13,3 +18,46 @@ class Module(Node):
     function_declarations: list[FunctionDeclaration]
     struct_declarations: list[StructDeclaration]
     enum_declarations: list[EnumDeclaration]
+    symbols: Optional[SymbolTable] = field(default=None, compare=False,
+                                           repr=False)
+    errors: list[ErrorStatement] = field(default_factory=list)
+    _index: Optional[DeclarationIndex] = field(default=None, init=False,
+                                               compare=False, repr=False)
+
+    @property
+    def index(self) -> DeclarationIndex:
+        """
+        Declaration index, built on first use.
+        Declarations appended to lists later are indexed on next access,
+        after replacing declaration in place call invalidate_index.
+        :return: index of declarations
+        """
+        if self._index is None:
+            self._index = DeclarationIndex()
+
+        self._index.update(self.function_declarations,
+                           self.struct_declarations, self.enum_declarations)
+        return self._index
+
+    def invalidate_index(self) -> None:
+        """
+        Rebuilds declaration index on next access
+        """
+        if self._index is not None:
+            self._index.invalidate()
+
+    def add_declaration(
+            self,
+            declaration: FunctionDeclaration | StructDeclaration
+            | EnumDeclaration
+    ) -> None:
+        """
+        Appends top level declaration to its list
+        :param declaration: function, struct or enum declaration
+        """
+        if isinstance(declaration, FunctionDeclaration):
+            self.function_declarations.append(declaration)
+        elif isinstance(declaration, StructDeclaration):
+            self.struct_declarations.append(declaration)
+        else:
+            self.enum_declarations.append(declaration)
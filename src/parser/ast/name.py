@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 
 from src.parser.ast.expressions.term import Term
 
@@ -6,3 +7,4 @@ from src.parser.ast.expressions.term import Term
 @dataclass
 class Name(Term):
     identifier: str
+    symbol: Optional[int] = field(default=None, compare=False, repr=False)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from src.parser.ast.statements.statement import Statement
+
+
+@dataclass
+class ErrorStatement(Statement):
+    """
+    Source skipped by parser in recovery mode, spans tokens from the
+    error up to synchronisation point
+    """
+    message: str
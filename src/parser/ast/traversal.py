@@ -0,0 +1,70 @@
+from dataclasses import fields
+from enum import Enum
+from hashlib import blake2b
+from typing import Iterator, Optional
+
+from src.parser.ast.node import Node
+
+
+def children(node: Node) -> Iterator[Node]:
+    """
+    Direct child nodes of node in field order
+    :param node: parent node
+    :return: iterator over child nodes
+    """
+    for node_field in fields(node):
+        value = getattr(node, node_field.name)
+
+        if isinstance(value, Node):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, Node):
+                    yield item
+
+
+def walk(node: Node) -> Iterator[Node]:
+    """
+    Pre-order traversal of syntax tree
+    :param node: root node
+    :return: iterator over node and all its descendants
+    """
+    stack = [node]
+
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(reversed(list(children(current))))
+
+
+def fingerprint(node: Node, identifiers: Optional[set[str]] = None) -> str:
+    """
+    Structural hash of syntax tree, independent of node locations
+    :param node: root node
+    :param identifiers: if given, identifiers of names in tree are added
+    :return: hex digest of tree structure
+    """
+    return blake2b(repr(_canonical(node, identifiers)).encode(),
+                   digest_size=16).hexdigest()
+
+
+def _canonical(value, identifiers: Optional[set[str]] = None):
+    if isinstance(value, Node):
+        canonical = (type(value).__name__,) + tuple(
+            _canonical(getattr(value, node_field.name), identifiers)
+            for node_field in fields(value)
+            if node_field.name != "location" and node_field.compare
+        )
+
+        if identifiers is not None and canonical[0] == "Name":
+            identifiers.add(value.identifier)
+
+        return canonical
+
+    if isinstance(value, list):
+        return tuple(_canonical(item, identifiers) for item in value)
+
+    if isinstance(value, Enum):
+        return value.value
+
+    return value
@@ -28,6 +28,7 @@ class SyntaxExpectedTokenException(ParserException):
                         f"got \"{got.value}\" at {position}")
         self.expected = expected
         self.got = got
+        self.position = position
 
         super().__init__(self.message, position)
 
@@ -3,9 +3,11 @@ from typing import Optional
 
 from src.common.location import Location
 from src.common.position import Position
+from src.lexer.errors import LexerException, error_position
 from src.lexer.lexer import Lexer
 from src.lexer.token import Token
 from src.lexer.token_kind import TokenKind
+from src.lexer.token_kind_set import TokenKindSet
 from src.parser.ast.access import Access
 from src.parser.ast.cast import Cast
 from src.parser.ast.common import Type
@@ -30,6 +32,7 @@ from src.parser.ast.name import Name
 from src.parser.ast.declaration.parameter import Parameter
 from src.parser.ast.statements.assignment import Assignment
 from src.parser.ast.statements.block import Block
+from src.parser.ast.statements.error_statement import ErrorStatement
 from src.parser.ast.statements.match_statement import MatchStatement
 from src.parser.ast.statements.matcher import Matcher
 from src.parser.ast.statements.variable_declaration import VariableDeclaration
@@ -43,6 +46,7 @@ from src.parser.ast.declaration.struct_declaration import StructDeclaration
 from src.parser.ast.variant_access import VariantAccess
 from src.parser.ebnf import ebnf
 from src.parser.errors import SyntaxExpectedTokenException, SyntaxException, \
+    ParserException, \
     NameExpectedError, SemicolonExpectedError, ColonExpectedError, \
     BlockExpectedError, ParenthesisExpectedError, TypeExpectedError, \
     ParameterExpectedError, ExpressionExpectedError, LetKeywordExpectedError, \
@@ -63,62 +67,93 @@ def shall(value, error, *error_args):
 class Parser:
     # region Language Definition (builtin-types)
 
-    _builtin_types_kinds = [
+    _builtin_types_kinds = TokenKindSet(
+        TokenKind.U16,
+        TokenKind.U32,
+        TokenKind.U64,
+        TokenKind.I16,
         TokenKind.I32,
+        TokenKind.I64,
         TokenKind.F32,
         TokenKind.Bool,
         TokenKind.Str
-    ]
+    )
 
-    _literal_kinds = [
+    _literal_kinds = TokenKindSet(
         TokenKind.Integer,
         TokenKind.Float,
         TokenKind.String,
         TokenKind.Boolean
-    ]
+    )
 
     # endregion
 
     # region Language Definition (operators)
 
-    _and_op = [
+    _and_op = TokenKindSet(
         TokenKind.And
-    ]
+    )
 
-    _or_op = [
+    _or_op = TokenKindSet(
         TokenKind.Or
-    ]
+    )
 
-    _relation_op = [
+    _relation_op = TokenKindSet(
         TokenKind.Equal,
         TokenKind.NotEqual,
         TokenKind.Less,
         TokenKind.Greater
-    ]
+    )
 
-    _additive_op = [
+    _additive_op = TokenKindSet(
         TokenKind.Plus,
         TokenKind.Minus
-    ]
+    )
 
-    _multiplicative_op = [
+    _multiplicative_op = TokenKindSet(
         TokenKind.Multiply,
         TokenKind.Divide
-    ]
+    )
 
-    _unary_op = [
+    _unary_op = TokenKindSet(
         TokenKind.Minus,
         TokenKind.Negate
-    ]
+    )
+
+    # endregion
+
+    # region Language Definition (synchronisation)
+
+    _declaration_sync = TokenKindSet(
+        TokenKind.Fn,
+        TokenKind.Struct,
+        TokenKind.Enum,
+        TokenKind.EOF
+    )
+
+    _statement_sync = _declaration_sync | TokenKindSet(
+        TokenKind.Semicolon,
+        TokenKind.BraceClose
+    )
+
+    _block_end = _declaration_sync | TokenKindSet(
+        TokenKind.BraceClose
+    )
 
     # endregion
 
     # region Dunder Methods
 
-    def __init__(self, lexer: Lexer):
+    def __init__(self, lexer: Lexer, recover: bool = False):
         self._lexer = lexer
+        self._symbols = lexer.symbols
         self._token = None
         self._last = None
+        self._recover = recover
+        self._diagnostics: list[ParserException | LexerException] = []
+
+        # Token read right after lexer error, it replaces dropped token
+        self._after_lexer_error: Optional[Token] = None
 
         # Start consuming tokens
         if self._token is None:
@@ -126,46 +161,146 @@ class Parser:
 
     # endregion
 
+    # region Properties
+
+    @property
+    def recover(self) -> bool:
+        """
+        Whether parser recovers from errors instead of raising them
+        :return: True if recovery mode is enabled
+        """
+        return self._recover
+
+    @property
+    def diagnostics(self) -> list[ParserException | LexerException]:
+        """
+        Errors collected in recovery mode, in source order
+        :return: lexer and parser errors
+        """
+        return self._diagnostics
+
+    # endregion
+
     # region Helper Methods
 
-    def check_if(self, *kinds: TokenKind) -> bool:
+    def check_if(self, kinds: TokenKind | TokenKindSet,
+                 *others: TokenKind | TokenKindSet) -> bool:
         if self._token is None:
             return False
 
-        return self._token.kind in kinds
+        mask = kinds.mask
+        for other in others:
+            mask |= other.mask
+
+        return self._token.kind.mask & mask != 0
 
     def consume(self) -> Token:
         token = self._token
-        self._token = self._lexer.get_next_token()
-        return token
+        failed = False
+
+        while True:
+            try:
+                self._token = self._lexer.get_next_token()
+                self._after_lexer_error = self._token if failed else None
+                return token
+            except LexerException as exception:
+                if not self._recover:
+                    raise
+                # Lexer always advances on error, retry from next char
+                self._report(exception)
+                failed = True
+
+    def consume_if(self, kinds: TokenKind | TokenKindSet,
+                   *others: TokenKind | TokenKindSet) -> Optional[Token]:
+        if self._token is None:
+            return None
 
-    def consume_if(self, *kinds: TokenKind) -> Optional[Token]:
-        if self.check_if(*kinds):
+        mask = kinds.mask
+        for other in others:
+            mask |= other.mask
+
+        if self._token.kind.mask & mask:
             return self.consume()
 
         return None
 
     def expect(
-            self, kinds: TokenKind | list[TokenKind], condition: bool = True,
-            exception: SyntaxExceptionType = None
+            self, kinds: TokenKind | TokenKindSet | list[TokenKind],
+            condition: bool = True, exception: SyntaxExceptionType = None
     ) -> Optional[Token]:
-        if not isinstance(kinds, list):
-            kinds = [kinds]
+        if isinstance(kinds, list):
+            kinds = TokenKindSet(*kinds)
 
-        if token := self.consume_if(*kinds):
+        if token := self.consume_if(kinds):
             return token
 
         if condition:
             if exception:
                 raise exception(self._token.location.begin)
             raise SyntaxExpectedTokenException(
-                kinds, self._token.kind, self._token.location.begin
+                list(kinds) if isinstance(kinds, TokenKindSet) else kinds,
+                self._token.kind, self._token.location.begin
             )
 
         return None
 
     # endregion
 
+    # region Recovery
+
+    def synchronise(self, kinds: TokenKindSet) -> Position:
+        """
+        Skips tokens until one of kinds is current token
+        :param kinds: kinds of synchronisation tokens, which are not skipped
+        :return: end of last skipped token, begin of current token if none
+        """
+        self._last = None
+        end = self._token.location.begin
+
+        while not self._token.kind.mask & kinds.mask:
+            end = self.consume().location.end
+
+        return end
+
+    def _report(self, exception: ParserException | LexerException) -> None:
+        # Error cascading from previous one at same position is dropped
+        position = error_position(exception)
+
+        # Parser error at token replacing dropped one cascades from lexer
+        # error, e.g. missing expression after too long string
+        if isinstance(exception, ParserException) and \
+                self._after_lexer_error is not None and \
+                self._after_lexer_error is self._token:
+            return
+
+        if self._diagnostics:
+            last = self._diagnostics[-1]
+            if not isinstance(last, LexerException) \
+                    and last.position == position:
+                return
+
+        self._diagnostics.append(exception)
+
+    def _recover_from(self, exception: ParserException,
+                      kinds: TokenKindSet) -> ErrorStatement:
+        if not self._recover:
+            raise exception
+
+        self._report(exception)
+        begin = getattr(exception, "position", self._token.location.begin)
+        end = self.synchronise(kinds)
+
+        # Nothing skipped, error position may lie after current token
+        if (end.line, end.column) < (begin.line, begin.column):
+            end = begin
+
+        return ErrorStatement(
+            message=exception.message,
+            location=Location(begin, end)
+        )
+
+    # endregion
+
     # region Parse Program
     @ebnf(
         "Program",
@@ -175,16 +310,24 @@ class Parser:
         function_declarations = []
         struct_declarations = []
         enum_declarations = []
+        errors = []
 
         while True:
-            if function_declaration := self.parse_function_declaration():
-                function_declarations.append(function_declaration)
-            elif struct_declaration := self.parse_struct_declaration():
-                struct_declarations.append(struct_declaration)
-            elif enum_declaration := self.parse_enum_declaration():
-                enum_declarations.append(enum_declaration)
-            else:
-                break
+            try:
+                if function_declaration := self.parse_function_declaration():
+                    function_declarations.append(function_declaration)
+                elif struct_declaration := self.parse_struct_declaration():
+                    struct_declarations.append(struct_declaration)
+                elif enum_declaration := self.parse_enum_declaration():
+                    enum_declarations.append(enum_declaration)
+                elif self._recover and self._token.kind != TokenKind.EOF:
+                    raise UnexpectedTokenError(self._token.location.begin)
+                else:
+                    break
+            except ParserException as exception:
+                errors.append(
+                    self._recover_from(exception, self._declaration_sync)
+                )
 
         if (token := self.consume()) and token.kind != TokenKind.EOF:
             raise UnexpectedTokenError(token.location.begin)
@@ -195,7 +338,9 @@ class Parser:
             function_declarations=function_declarations,
             struct_declarations=struct_declarations,
             enum_declarations=enum_declarations,
-            location=Location.at(Position(1, 1))
+            location=Location.at(Position(1, 1)),
+            symbols=self._symbols,
+            errors=errors
         )
 
     # endregion
@@ -274,9 +419,10 @@ class Parser:
 
             return None
 
-        self.expect(TokenKind.Colon, exception=ColonExpectedError)
+        colon = self.expect(TokenKind.Colon, exception=ColonExpectedError)
 
-        typ = self.parse_type()
+        typ = shall(self.parse_type(), TypeExpectedError,
+                    colon.location.end)
 
         return Parameter(
             name=name,
@@ -389,13 +535,22 @@ class Parser:
         statements = self.parse_statements_list()
 
         close_paren = self.expect(TokenKind.BraceClose,
+                                  condition=not self._recover,
                                   exception=BraceExpectedError)
 
+        # Unclosed block is kept in recovery mode, ends at last statement
+        if close_paren:
+            end = close_paren.location.end
+        else:
+            self._report(BraceExpectedError(self._token.location.begin))
+            end = statements[-1].location.end if statements \
+                else open_paren.location.end
+
         return Block(
             body=statements,
             location=Location(
                 open_paren.location.begin,
-                close_paren.location.end
+                end
             )
         )
 
@@ -406,14 +561,25 @@ class Parser:
     def parse_statements_list(self) -> list[Statement]:
         statements = []
 
-        while (statement := self.parse_statement()) \
-                or (block_statement := self.parse_block_statement()):
-            if statement:
-                statements.append(statement)
-                self.expect(TokenKind.Semicolon,
-                            exception=SemicolonExpectedError)
-            else:
-                statements.append(statement)
+        while True:
+            try:
+                if statement := self.parse_statement():
+                    statements.append(statement)
+                    self.expect(TokenKind.Semicolon,
+                                exception=SemicolonExpectedError)
+                elif block_statement := self.parse_block_statement():
+                    statements.append(block_statement)
+                elif self._recover and not self.check_if(self._block_end):
+                    raise UnexpectedTokenError(self._token.location.begin)
+                else:
+                    break
+            except ParserException as exception:
+                statements.append(
+                    self._recover_from(exception, self._statement_sync)
+                )
+                if self.check_if(self._block_end):
+                    break
+                self.consume_if(TokenKind.Semicolon)
 
         return statements
 
@@ -786,7 +952,8 @@ class Parser:
 
         return Name(
             identifier=identifier.value,
-            location=identifier.location
+            location=identifier.location,
+            symbol=identifier.symbol
         )
 
     @ebnf(
@@ -838,10 +1005,11 @@ class Parser:
         "builtin_type | VariantAccess"
     )
     def parse_type(self) -> Optional[Type]:
-        if builtin := self.consume_if(*self._builtin_types_kinds):
+        if builtin := self.consume_if(self._builtin_types_kinds):
             return Name(
                 identifier=builtin.kind.value,
-                location=builtin.location
+                location=builtin.location,
+                symbol=self._symbols.intern(builtin.kind.value)
             )
 
         return self.parse_variant_access()
@@ -881,7 +1049,8 @@ class Parser:
     def parse_relation_expression(self) -> Optional[Expression]:
         left = self.parse_additive_term()
 
-        if op := self.consume_if(*self._relation_op):
+        if op := self.consume_if(self._relation_op):
+            shall(left, ExpressionExpectedError, op.location.begin)
             right = shall(self.parse_additive_term(), ExpressionExpectedError,
                           op.location.end)
 
@@ -923,11 +1092,12 @@ class Parser:
 
     def _parse_tree_like_expression[T: ITreeLikeExpression, K: IFromTokenKind](
             self, base: typing.Type[T], parent_type: typing.Type[K],
-            operators: list[TokenKind], child: typing.Callable
+            operators: TokenKindSet, child: typing.Callable
     ) -> T:
         left = child()
 
-        while op := self.consume_if(*operators):
+        while op := self.consume_if(operators):
+            shall(left, ExpressionExpectedError, op.location.begin)
             right = shall(child(), ExpressionExpectedError, op.location.end)
 
             left = base(
@@ -947,7 +1117,7 @@ class Parser:
         "[ unary_op ], CastedTerm"
     )
     def parse_unary_term(self) -> Optional[Expression]:
-        if op := self.consume_if(*self._unary_op):
+        if op := self.consume_if(self._unary_op):
             term = shall(self.parse_casted_term(), ExpressionExpectedError,
                          op.location.end)
 
@@ -998,7 +1168,7 @@ class Parser:
         "| FnCall | NewStruct | '(', Expression, ')'"
     )
     def parse_term(self) -> Optional[Term]:
-        if literal := self.consume_if(*self._literal_kinds):
+        if literal := self.consume_if(self._literal_kinds):
             return Constant(
                 value=literal.value,
                 location=literal.location
@@ -0,0 +1,177 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.common.position import Position
+from src.common.symbols import SymbolTable
+from src.lexer.errors import error_position
+from src.lexer.lexer import Lexer
+from src.parser.ast.module import Module
+from src.parser.ast.name import Name
+from src.parser.ast.traversal import walk
+from src.parser.parser import Parser
+from src.program.program import Program, LoadDiagnostic, build_graph
+from src.utils.buffer import StreamBuffer
+
+EXTENSION = ".fhll"
+
+type ParseResult = tuple[Module, list[LoadDiagnostic]]
+
+
+def parse_file(path: str) -> ParseResult:
+    """
+    Parses one file, runs in worker process.
+    Diagnostics are returned as plain data, parser exceptions are not
+    picklable.
+    :param path: path of file
+    :return: module and syntax errors
+    """
+    with open(path, "rb") as file:
+        text = file.read().decode(errors="replace")
+
+    parser = Parser(Lexer(StreamBuffer.from_str(text), skip_comments=True),
+                    recover=True)
+    module = parser.parse()
+
+    diagnostics = [
+        LoadDiagnostic(path, error_position(exception), exception.message)
+        for exception in parser.diagnostics
+    ]
+
+    return module, diagnostics
+
+
+def _parse_pickled(path: str) -> bytes:
+    # Cached as bytes, each load unpickles own copy of module
+    return pickle.dumps(parse_file(path))
+
+
+class ProgramLoader:
+    """
+    Loads program from all source files under root directory.
+    Files are parsed in parallel worker processes, each file is parsed at
+    most once by loader, also when reached by many paths. Programs do not
+    share modules, loaded modules may be modified.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, workers: Optional[int] = None,
+                 extension: str = EXTENSION):
+        """
+        Creates new loader
+        :param workers: number of worker processes, CPU count if None,
+            files are parsed in this process if 1
+        :param extension: extension of source files
+        """
+        self._workers = workers if workers is not None else os.cpu_count()
+        self._extension = extension
+        self._cache: dict[str, bytes] = {}
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def parsed(self) -> int:
+        """
+        Number of files parsed by loader
+        :return: size of parse cache
+        """
+        return len(self._cache)
+
+    # endregion
+
+    # region Methods
+
+    def load(self, root: str) -> Program:
+        """
+        Loads program from directory
+        :param root: root directory of program
+        :return: program with modules named by their path relative to root
+        """
+        paths = {}
+        for path in self._find(root):
+            # File reached by many paths is loaded once, not through link
+            real = os.path.realpath(path)
+            if real not in paths or os.path.islink(paths[real]):
+                paths[real] = path
+
+        self._parse([real for real in paths if real not in self._cache])
+
+        symbols = SymbolTable()
+        modules: dict[str, Module] = {}
+        diagnostics: list[LoadDiagnostic] = []
+
+        for real, path in sorted(paths.items(), key=lambda item: item[1]):
+            name = self._module_name(root, path)
+
+            # E.g. a.b.fhll and a/b.fhll, first path in order is loaded
+            if (loaded := modules.get(name)) is not None:
+                diagnostics.append(LoadDiagnostic(
+                    path, Position(1, 1),
+                    f"Module '{name}' is already loaded from '{loaded.path}'"
+                ))
+                continue
+
+            module, errors = pickle.loads(self._cache[real])
+            module.name = name
+            module.path = path
+            self._merge_symbols(module, symbols)
+
+            modules[module.name] = module
+            diagnostics.extend(errors)
+
+        dependencies, duplicates = build_graph(modules)
+
+        return Program(root, modules, symbols, dependencies,
+                       diagnostics + duplicates)
+
+    # endregion
+
+    # region Private Methods
+
+    def _find(self, root: str) -> list[str]:
+        found = []
+
+        for directory, directories, files in os.walk(root):
+            directories[:] = sorted(name for name in directories
+                                    if not name.startswith("."))
+            found.extend(os.path.join(directory, name)
+                         for name in sorted(files)
+                         if name.endswith(self._extension))
+
+        return found
+
+    def _parse(self, paths: list[str]) -> None:
+        if self._workers <= 1 or len(paths) <= 1:
+            for path in paths:
+                self._cache[path] = _parse_pickled(path)
+            return
+
+        with ProcessPoolExecutor(min(self._workers, len(paths))) as executor:
+            results = executor.map(_parse_pickled, paths)
+            for path, result in zip(paths, results):
+                self._cache[path] = result
+
+    def _module_name(self, root: str, path: str) -> str:
+        relative = os.path.relpath(path, root)[:-len(self._extension)]
+        return relative.replace(os.sep, ".")
+
+    @staticmethod
+    def _merge_symbols(module: Module, symbols: SymbolTable) -> None:
+        # Symbols of worker are remapped to program table, identifiers
+        # get interned string of program table
+        if module.symbols is symbols:
+            return
+
+        for node in walk(module):
+            if isinstance(node, Name):
+                symbol = symbols.intern(node.identifier)
+                node.identifier = symbols.name(symbol)
+                node.symbol = symbol
+
+        module.symbols = symbols
+
+    # endregion
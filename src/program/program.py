@@ -0,0 +1,157 @@
+from dataclasses import dataclass, field
+
+from src.common.location import Location
+from src.common.position import Position
+from src.common.symbols import SymbolTable
+from src.parser.ast.common import Type
+from src.parser.ast.declaration.field_declaration import FieldDeclaration
+from src.parser.ast.declaration.function_declaration import FunctionDeclaration
+from src.parser.ast.declaration.parameter import Parameter
+from src.parser.ast.cast import Cast
+from src.parser.ast.is_compare import IsCompare
+from src.parser.ast.module import Module
+from src.parser.ast.name import Name
+from src.parser.ast.statements.fn_call import FnCall
+from src.parser.ast.statements.matcher import Matcher
+from src.parser.ast.statements.new_struct_statement import NewStruct
+from src.parser.ast.statements.variable_declaration import VariableDeclaration
+from src.parser.ast.traversal import walk
+from src.parser.ast.variant_access import VariantAccess
+
+
+@dataclass
+class LoadDiagnostic:
+    """
+    Error found while loading program, e.g. syntax error in one file
+    """
+    path: str
+    position: Position
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.position.line}:{self.position.column}: " \
+               f"{self.message}"
+
+
+@dataclass
+class Program:
+    """
+    Modules of program loaded from source tree.
+    Each module depends on modules declaring functions and types it
+    references, all modules share one symbol table.
+    """
+    root: str
+    modules: dict[str, Module]
+    symbols: SymbolTable
+    dependencies: dict[str, set[str]] = field(default_factory=dict)
+    diagnostics: list[LoadDiagnostic] = field(default_factory=list)
+
+    def module(self) -> Module:
+        """
+        Declarations of all modules merged into one module, so references
+        between files resolve in analysis and interpretation
+        :return: merged module
+        """
+        modules = list(self.modules.values())
+
+        return Module(
+            name="",
+            path=self.root,
+            function_declarations=[
+                function for module in modules
+                for function in module.function_declarations
+            ],
+            struct_declarations=[
+                struct for module in modules
+                for struct in module.struct_declarations
+            ],
+            enum_declarations=[
+                enum for module in modules
+                for enum in module.enum_declarations
+            ],
+            location=Location.at(Position(1, 1)),
+            symbols=self.symbols,
+            errors=[error for module in modules for error in module.errors]
+        )
+
+
+# region Module Graph
+
+def build_graph(modules: dict[str, Module]) -> tuple[dict[str, set[str]],
+                                                     list[LoadDiagnostic]]:
+    """
+    Finds dependencies between modules from references to functions and
+    types declared in other modules
+    :param modules: modules by name
+    :return: dependencies by module name and duplicate type declarations
+    """
+    functions: dict[str, set[str]] = {}
+    types: dict[str, str] = {}
+    diagnostics = []
+
+    for name, module in modules.items():
+        for function in module.function_declarations:
+            functions.setdefault(function.name.identifier, set()).add(name)
+
+        for declaration in module.struct_declarations \
+                + module.enum_declarations:
+            identifier = declaration.name.identifier
+            if (other := types.get(identifier)) is not None:
+                diagnostics.append(LoadDiagnostic(
+                    module.path, declaration.name.location.begin,
+                    f"Type '{identifier}' is already declared in "
+                    f"module '{other}'"
+                ))
+                continue
+            types[identifier] = name
+
+    dependencies = {}
+    for name, module in modules.items():
+        called, used = _references(module)
+        dependencies[name] = {
+            declaring for identifier in called
+            for declaring in functions.get(identifier, ())
+        } | {
+            types[identifier] for identifier in used if identifier in types
+        }
+        dependencies[name].discard(name)
+
+    return dependencies, diagnostics
+
+
+def _references(module: Module) -> tuple[set[str], set[str]]:
+    called = set()
+    used = set()
+
+    for node in walk(module):
+        match node:
+            case FnCall():
+                called.add(node.name.identifier)
+            case FunctionDeclaration():
+                if node.return_type is not None:
+                    used.add(_root(node.return_type))
+            case Parameter() | FieldDeclaration():
+                used.add(_root(node.declared_type))
+            case VariableDeclaration():
+                if node.declared_type is not None:
+                    used.add(_root(node.declared_type))
+            case Cast():
+                used.add(_root(node.to_type))
+            case IsCompare():
+                used.add(_root(node.is_type))
+            case Matcher():
+                used.add(_root(node.checked_type))
+            case NewStruct():
+                if isinstance(node.variant, Name | VariantAccess):
+                    used.add(_root(node.variant))
+
+    return called, used
+
+
+def _root(declared_type: Type) -> str:
+    while isinstance(declared_type, VariantAccess):
+        declared_type = declared_type.parent
+
+    return declared_type.identifier
+
+# endregion
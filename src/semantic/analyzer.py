@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+from src.parser.ast.module import Module
+from src.semantic.overloads import OverloadTable
+from src.semantic.registry import TypeRegistry
+from src.semantic.resolver import Resolution, Resolver
+from src.semantic.type_checker import TypeTable, TypeCache, TypeChecker
+
+
+@dataclass
+class Analysis:
+    """
+    Results of static analysis of module
+    """
+    module: Module
+    resolution: Resolution
+    types: TypeTable
+    registry: TypeRegistry
+    overloads: OverloadTable
+
+
+def analyze(module: Module, cache: TypeCache = None) -> Analysis:
+    """
+    Resolves variables and checks types of module
+    :param module: parsed module
+    :param cache: type cache shared between runs
+    :return: analysis results
+    """
+    resolution = Resolver().resolve(module)
+    checker = TypeChecker(cache)
+    types = checker.check(module, resolution)
+
+    return Analysis(
+        module=module,
+        resolution=resolution,
+        types=types,
+        registry=checker.registry,
+        overloads=checker.overloads
+    )
@@ -0,0 +1,109 @@
+from src.common.location import Location
+
+
+class SemanticException(Exception):
+    ...
+
+
+class UndefinedVariableError(SemanticException):
+    def __init__(self, name: str, location: Location):
+        self.message = f"Undefined variable '{name}'"
+        self.name = name
+        self.location = location
+
+        super().__init__(self.message)
+
+
+class ImmutableAssignmentError(SemanticException):
+    def __init__(self, name: str, location: Location):
+        self.message = f"Cannot assign twice to immutable variable '{name}'"
+        self.name = name
+        self.location = location
+
+        super().__init__(self.message)
+
+
+class TypeMismatchError(SemanticException):
+    def __init__(self, expected: object, got: object, location: Location):
+        self.message = f"Mismatched type: expected '{expected}', got '{got}'"
+        self.expected = expected
+        self.got = got
+        self.location = location
+
+        super().__init__(self.message)
+
+
+class TypeInferenceError(SemanticException):
+    def __init__(self, name: str, location: Location):
+        self.message = f"Cannot infer type of variable '{name}'"
+        self.name = name
+        self.location = location
+
+        super().__init__(self.message)
+
+
+class UndefinedTypeError(SemanticException):
+    def __init__(self, name: str, location: Location):
+        self.message = f"Undefined type '{name}'"
+        self.name = name
+        self.location = location
+
+        super().__init__(self.message)
+
+
+class UndefinedFieldError(SemanticException):
+    def __init__(self, owner: object, name: str, location: Location):
+        self.message = f"Undefined field '{name}' for '{owner}'"
+        self.owner = owner
+        self.name = name
+        self.location = location
+
+        super().__init__(self.message)
+
+
+class UndefinedFunctionError(SemanticException):
+    def __init__(self, name: str, arguments: tuple, location: Location):
+        arguments_list = ", ".join(str(argument) for argument in arguments)
+        self.message = f"Undefined function '{name}({arguments_list})'"
+        self.name = name
+        self.arguments = arguments
+        self.location = location
+
+        super().__init__(self.message)
+
+
+class UndefinedOperationError(SemanticException):
+    def __init__(self, operator: str, operands: tuple, location: Location):
+        operands_list = " and ".join(f"\"{operand}\"" for operand in operands)
+        self.message = (f"Undefined operation \"{operator}\" "
+                        f"for {operands_list}")
+        self.operator = operator
+        self.operands = operands
+        self.location = location
+
+        super().__init__(self.message)
+
+
+class InvalidCastError(SemanticException):
+    def __init__(self, source: object, target: object, location: Location):
+        self.message = f"Cannot cast '{source}' to '{target}'"
+        self.source = source
+        self.target = target
+        self.location = location
+
+        super().__init__(self.message)
+
+
+class DuplicateOverloadError(SemanticException):
+    def __init__(self, signature: object, return_only: bool,
+                 location: Location):
+        if return_only:
+            self.message = ("Cannot overload only by return value: "
+                            f"'{signature}'")
+        else:
+            self.message = f"Function '{signature}' is already defined"
+
+        self.signature = signature
+        self.location = location
+
+        super().__init__(self.message)
@@ -0,0 +1,177 @@
+from typing import Iterable, Optional
+
+from src.semantic.errors import DuplicateOverloadError
+from src.semantic.signatures import Signature, select_overload
+from src.semantic.types import ResolvedType, is_castable
+
+type ArgumentTypes = tuple[ResolvedType, ...]
+
+
+class OverloadTable:
+    """
+    Per-name dispatch index of function and operator overloads.
+    Exact signatures are indexed by argument types at load time, lookups
+    requiring implicit conversions are memoized on first use.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, signatures: Iterable[Signature] = ()):
+        """
+        Creates new overload table
+        :param signatures: initial signatures, user ones before builtins
+        """
+        self._overloads: dict[str, list[Signature]] = {}
+        self._index: dict[str, dict[ArgumentTypes, Optional[Signature]]] = {}
+
+        for signature in signatures:
+            self.add(signature)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._overloads
+
+    # endregion
+
+    # region Methods
+
+    def add(self, signature: Signature) -> None:
+        """
+        Adds overload to table.
+        Builtin overload is shadowed by user overload with same parameters.
+        :param signature: overload signature
+        """
+        index = self._index.setdefault(signature.name, {})
+
+        if (existing := self.exact(signature.name,
+                                   signature.parameters)) is not None:
+            if signature.is_builtin:
+                return
+
+            if not existing.is_builtin:
+                raise DuplicateOverloadError(
+                    signature, existing.return_type != signature.return_type,
+                    signature.declaration.location
+                )
+
+            self._overloads[signature.name].remove(existing)
+
+        # Conversions memoized so far may be outdated
+        for arguments in [arguments for arguments, target in index.items()
+                          if target is None
+                          or target.parameters != arguments]:
+            del index[arguments]
+
+        index[signature.parameters] = signature
+        self._overloads.setdefault(signature.name, []).append(signature)
+
+    def overloads(self, name: str) -> list[Signature]:
+        """
+        All overloads of name in declaration order
+        :param name: function or operator name
+        :return: list of overloads
+        """
+        return self._overloads.get(name, [])
+
+    def exact(self, name: str, parameters: ArgumentTypes
+              ) -> Optional[Signature]:
+        """
+        Overload with exactly given parameter types
+        :param name: function or operator name
+        :param parameters: parameter types
+        :return: overload or None if there is no such overload
+        """
+        signature = self._index.get(name, {}).get(parameters)
+
+        if signature is not None and signature.parameters == parameters:
+            return signature
+
+        return None
+
+    def resolve(self, name: str, arguments: ArgumentTypes
+                ) -> Optional[Signature]:
+        """
+        Resolves overload for argument types
+        :param name: function or operator name
+        :param arguments: argument types
+        :return: selected overload or None if no overload is applicable
+        """
+        if (index := self._index.get(name)) is None:
+            return None
+
+        try:
+            return index[arguments]
+        except KeyError:
+            signature = select_overload(self._overloads[name], arguments)
+            index[arguments] = signature
+            return signature
+
+    def candidates(self, name: str, arguments: ArgumentTypes
+                   ) -> list[Signature]:
+        """
+        Overloads which may be applicable depending on runtime variants
+        of arguments
+        :param name: function or operator name
+        :param arguments: static argument types
+        :return: list of overloads
+        """
+        return [
+            signature for signature in self.overloads(name)
+            if len(signature.parameters) == len(arguments)
+            and all(is_castable(argument, parameter)
+                    for argument, parameter
+                    in zip(arguments, signature.parameters))
+        ]
+
+    # endregion
+
+
+class InlineCache:
+    """
+    Polymorphic inline cache of call site, whose target depends on runtime
+    variants of arguments
+    """
+
+    __slots__ = ("name", "_table", "_entries", "_last_arguments",
+                 "_last_target")
+
+    # region Dunder Methods
+
+    def __init__(self, name: str, table: OverloadTable):
+        """
+        Creates new inline cache
+        :param name: called function or operator
+        :param table: table used to resolve misses
+        """
+        self.name = name
+        self._table = table
+        self._entries: dict[ArgumentTypes, Optional[Signature]] = {}
+        self._last_arguments = None
+        self._last_target = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # endregion
+
+    # region Methods
+
+    def lookup(self, arguments: ArgumentTypes) -> Optional[Signature]:
+        """
+        Target for runtime argument types
+        :param arguments: runtime argument types
+        :return: selected overload or None if no overload is applicable
+        """
+        if arguments == self._last_arguments:
+            return self._last_target
+
+        try:
+            target = self._entries[arguments]
+        except KeyError:
+            target = self._table.resolve(self.name, arguments)
+            self._entries[arguments] = target
+
+        self._last_arguments = arguments
+        self._last_target = target
+        return target
+
+    # endregion
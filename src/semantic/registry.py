@@ -0,0 +1,148 @@
+from typing import Optional
+
+from src.parser.ast.common import Type
+from src.parser.ast.declaration.declaration_index import type_path
+from src.parser.ast.declaration.enum_declaration import EnumDeclaration
+from src.parser.ast.declaration.struct_declaration import StructDeclaration
+from src.parser.ast.module import Module
+from src.parser.ast.name import Name
+from src.semantic.errors import UndefinedTypeError, UndefinedFieldError
+from src.semantic.types import ResolvedType, UserType, builtin_types
+
+type UserDeclaration = StructDeclaration | EnumDeclaration
+
+
+class TypeRegistry:
+    """
+    Registry of user defined types of module.
+    Types are identified by variant paths, e.g. ("Item", "Fruit").
+    Each type gets numeric tag in preorder, so tags of all variants of enum
+    form contiguous range following its own tag.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, module: Module):
+        """
+        Creates new registry with all structs and enums of module
+        :param module: module with declarations
+        """
+        self._declarations: dict[tuple[str, ...], UserDeclaration] = {}
+        self._fields: dict[UserType, dict[str, ResolvedType]] = {}
+        self._tags: dict[UserType, tuple[int, int]] = {}
+
+        for declaration in module.struct_declarations:
+            self._register((), declaration)
+
+        for declaration in module.enum_declarations:
+            self._register((), declaration)
+
+    # endregion
+
+    # region Methods
+
+    def declaration(self, typ: UserType) -> Optional[UserDeclaration]:
+        """
+        Declaration of user type
+        :param typ: user type
+        :return: struct or enum declaration, None if type is undefined
+        """
+        return self._declarations.get(typ.path)
+
+    def resolve(self, type_node: Type) -> ResolvedType:
+        """
+        Resolves type annotation to type
+        :param type_node: type annotation
+        :return: resolved type
+        """
+        if isinstance(type_node, Name) and \
+                (builtin := builtin_types.get(type_node.identifier)):
+            return builtin
+
+        path = self.path(type_node)
+        if path not in self._declarations:
+            raise UndefinedTypeError("::".join(path), type_node.location)
+
+        return UserType(path)
+
+    def tag(self, typ: UserType) -> int:
+        """
+        Numeric tag of user type
+        :param typ: user type
+        :return: tag
+        """
+        return self._tags[typ][0]
+
+    def tags(self, typ: UserType) -> tuple[int, int]:
+        """
+        Range of tags of type and all its (nested) variants
+        :param typ: user type
+        :return: tag of type and end (exclusive) of range
+        """
+        return self._tags[typ]
+
+    def fields(self, typ: UserType) -> dict[str, ResolvedType]:
+        """
+        Field types of struct in declaration order
+        :param typ: struct type
+        :return: field types by name
+        """
+        if (fields := self._fields.get(typ)) is not None:
+            return fields
+
+        declaration = self.declaration(typ)
+        if not isinstance(declaration, StructDeclaration):
+            return {}
+
+        fields = {
+            field.name.identifier: self.resolve(field.declared_type)
+            for field in declaration.fields
+        }
+
+        self._fields[typ] = fields
+        return fields
+
+    def field(self, typ: ResolvedType, name: Name) -> ResolvedType:
+        """
+        Type of struct field
+        :param typ: struct type
+        :param name: field name
+        :return: field type
+        """
+        if isinstance(typ, UserType) and \
+                (field := self.fields(typ).get(name.identifier)) is not None:
+            return field
+
+        raise UndefinedFieldError(typ, name.identifier, name.location)
+
+    # endregion
+
+    # region Static Methods
+
+    @staticmethod
+    def path(type_node: Type) -> tuple[str, ...]:
+        """
+        Variant path of type annotation
+        :param type_node: type annotation
+        :return: path of names
+        """
+        return type_path(type_node)
+
+    # endregion
+
+    # region Private Methods
+
+    def _register(self, prefix: tuple[str, ...],
+                  declaration: UserDeclaration) -> None:
+        path = prefix + (declaration.name.identifier,)
+        self._declarations[path] = declaration
+        tag = len(self._tags)
+        self._tags[UserType(path)] = (tag, tag + 1)
+
+        if isinstance(declaration, EnumDeclaration):
+            for variant in declaration.variants:
+                self._register(path, variant)
+
+            self._tags[UserType(path)] = (tag, len(self._tags))
+
+    # endregion
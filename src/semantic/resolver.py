@@ -0,0 +1,315 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.interface.ivisitor import IVisitor
+from src.parser.ast.access import Access
+from src.parser.ast.cast import Cast
+from src.parser.ast.constant import Constant
+from src.parser.ast.declaration.function_declaration import FunctionDeclaration
+from src.parser.ast.declaration.parameter import Parameter
+from src.parser.ast.expressions.binary_operation import BinaryOperation
+from src.parser.ast.expressions.bool_operation import BoolOperation
+from src.parser.ast.expressions.compare import Compare
+from src.parser.ast.expressions.unary_operation import UnaryOperation
+from src.parser.ast.is_compare import IsCompare
+from src.parser.ast.module import Module
+from src.parser.ast.name import Name
+from src.parser.ast.node import Node
+from src.parser.ast.statements.assignment import Assignment
+from src.parser.ast.statements.block import Block
+from src.parser.ast.statements.error_statement import ErrorStatement
+from src.parser.ast.statements.fn_call import FnCall
+from src.parser.ast.statements.if_statement import IfStatement
+from src.parser.ast.statements.match_statement import MatchStatement
+from src.parser.ast.statements.matcher import Matcher
+from src.parser.ast.statements.new_struct_statement import NewStruct
+from src.parser.ast.statements.return_statement import ReturnStatement
+from src.parser.ast.statements.variable_declaration import VariableDeclaration
+from src.parser.ast.statements.while_statement import WhileStatement
+from src.semantic.errors import UndefinedVariableError, \
+    ImmutableAssignmentError
+
+type Binder = Parameter | VariableDeclaration | Matcher
+
+
+@dataclass
+class Slot:
+    """
+    Local variable bound to a fixed index in its function frame
+    """
+    index: int
+    name: str
+    mutable: bool
+    declaration: Binder
+
+
+@dataclass
+class FrameLayout:
+    """
+    Slots of a single function frame
+    """
+    function: FunctionDeclaration
+    slots: list[Slot] = field(default_factory=list)
+    size: int = 0
+
+
+class Resolution:
+    """
+    Result of static variable resolution.
+    Maps binding and referencing nodes to slots in their function frames.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self):
+        self._frames: dict[int, FrameLayout] = {}
+        self._slots: dict[int, Slot] = {}
+
+    # endregion
+
+    # region Methods
+
+    def frame(self, function: FunctionDeclaration) -> FrameLayout:
+        """
+        Frame layout of given function
+        :param function: resolved function
+        :return: frame layout
+        """
+        return self._frames[id(function)]
+
+    def slot(self, node: Name | Binder) -> Slot:
+        """
+        Slot bound to variable reference or declaration
+        :param node: name reference, parameter, declaration or matcher
+        :return: slot of variable
+        """
+        return self._slots[id(node)]
+
+    def add_frame(self, frame: FrameLayout) -> None:
+        self._frames[id(frame.function)] = frame
+
+    def bind(self, node: Name | Binder, slot: Slot) -> None:
+        self._slots[id(node)] = slot
+
+    # endregion
+
+
+@dataclass
+class _Variable:
+    slot: Slot
+    loop_depth: int
+    initialized: bool
+
+
+class Resolver(IVisitor[Node]):
+    """
+    Resolves local variables to frame slot indices.
+    Block-local variables release their slots on block exit, so the frame
+    size is the maximum number of simultaneously live variables.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, resolution: Resolution = None):
+        """
+        Creates new resolver
+        :param resolution: resolution to fill, new one is created if omitted
+        """
+        self._resolution = resolution if resolution is not None \
+            else Resolution()
+        self._scopes: list[dict[str, _Variable]] = []
+        self._frame: Optional[FrameLayout] = None
+        self._next_slot = 0
+        self._loop_depth = 0
+        self._assigned: set[int] = set()
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def resolution(self) -> Resolution:
+        """
+        Resolution filled by this resolver
+        :return: resolution
+        """
+        return self._resolution
+
+    # endregion
+
+    # region Methods
+
+    def resolve(self, module: Module) -> Resolution:
+        """
+        Resolves variables of every function in module
+        :param module: module to resolve
+        :return: resolution
+        """
+        for function in module.function_declarations:
+            self.resolve_function(function)
+
+        return self._resolution
+
+    def resolve_function(self, function: FunctionDeclaration) -> FrameLayout:
+        """
+        Resolves variables of single function
+        :param function: function to resolve
+        :return: frame layout of function
+        """
+        self._frame = FrameLayout(function)
+        self._next_slot = 0
+        self._loop_depth = 0
+        self._assigned = set()
+        self._scopes = [{}]
+
+        for parameter in function.parameters:
+            self._declare(parameter, parameter.name.identifier,
+                          parameter.mutable, True)
+
+        self._visit_block(function.block.body)
+
+        self._resolution.add_frame(self._frame)
+        frame, self._frame = self._frame, None
+        return frame
+
+    def visit(self, node: Node) -> None:
+        match node:
+            case Block():
+                self._visit_block(node.body)
+            case VariableDeclaration():
+                self._visit_variable_declaration(node)
+            case Assignment():
+                self._visit_assignment(node)
+            case ReturnStatement():
+                self._visit_optional(node.value)
+            case IfStatement():
+                self._visit_if_statement(node)
+            case WhileStatement():
+                self._visit_while_statement(node)
+            case MatchStatement():
+                self._visit_match_statement(node)
+            case FnCall():
+                for argument in node.arguments:
+                    self.visit(argument)
+            case NewStruct():
+                for assignment in node.assignments:
+                    self.visit(assignment.value)
+            case Name():
+                self._reference(node)
+            case Access():
+                self.visit(node.parent)
+            case BinaryOperation() | BoolOperation() | Compare():
+                self.visit(node.left)
+                self.visit(node.right)
+            case UnaryOperation():
+                self.visit(node.operand)
+            case Cast() | IsCompare():
+                self.visit(node.value)
+            case Constant():
+                pass
+            case ErrorStatement():
+                # Source skipped by recovering parser
+                pass
+            case _:
+                raise TypeError(f"Cannot resolve node {type(node).__name__}")
+
+    # endregion
+
+    # region Private Methods
+
+    def _visit_optional(self, node: Optional[Node]) -> None:
+        if node is not None:
+            self.visit(node)
+
+    def _visit_block(self, body: list[Node], binder: Matcher = None) -> None:
+        self._scopes.append({})
+        saved_slot = self._next_slot
+
+        if binder is not None:
+            self._declare(binder, binder.name.identifier, False, True)
+
+        for statement in body:
+            self.visit(statement)
+
+        self._next_slot = saved_slot
+        self._scopes.pop()
+
+    def _visit_variable_declaration(self, node: VariableDeclaration) -> None:
+        self._visit_optional(node.value)
+        self._declare(node, node.name.identifier, node.mutable,
+                      node.value is not None)
+
+    def _visit_assignment(self, node: Assignment) -> None:
+        self.visit(node.value)
+
+        root = node.access
+        while isinstance(root, Access):
+            root = root.parent
+
+        variable = self._reference(root)
+
+        if variable.slot.mutable:
+            return
+
+        # Immutable variables may only be initialized once,
+        # and only if they were declared without value
+        if isinstance(node.access, Access) or variable.initialized \
+                or id(variable) in self._assigned \
+                or variable.loop_depth != self._loop_depth:
+            raise ImmutableAssignmentError(root.identifier, node.location)
+
+        self._assigned.add(id(variable))
+
+    def _visit_if_statement(self, node: IfStatement) -> None:
+        self.visit(node.condition)
+        self._visit_branches([node.block, node.else_block])
+
+    def _visit_while_statement(self, node: WhileStatement) -> None:
+        self.visit(node.condition)
+
+        self._loop_depth += 1
+        self.visit(node.block)
+        self._loop_depth -= 1
+
+    def _visit_match_statement(self, node: MatchStatement) -> None:
+        self.visit(node.expression)
+        self._visit_branches(node.matchers)
+
+    def _visit_branches(self, branches: list[Optional[Block | Matcher]]
+                        ) -> None:
+        before = self._assigned
+        after = set()
+
+        for branch in branches:
+            self._assigned = set(before)
+
+            if isinstance(branch, Matcher):
+                self._visit_block(branch.block.body, branch)
+            elif branch is not None:
+                self.visit(branch)
+
+            after |= self._assigned
+
+        self._assigned = before | after
+
+    def _declare(self, node: Binder, name: str, mutable: bool,
+                 initialized: bool) -> None:
+        slot = Slot(self._next_slot, name, mutable, node)
+        self._next_slot += 1
+
+        self._frame.slots.append(slot)
+        self._frame.size = max(self._frame.size, self._next_slot)
+
+        self._scopes[-1][name] = _Variable(slot, self._loop_depth,
+                                           initialized)
+        self._resolution.bind(node, slot)
+
+    def _reference(self, name: Name) -> _Variable:
+        for scope in reversed(self._scopes):
+            if (variable := scope.get(name.identifier)) is not None:
+                self._resolution.bind(name, variable.slot)
+                return variable
+
+        raise UndefinedVariableError(name.identifier, name.location)
+
+    # endregion
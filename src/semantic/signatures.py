@@ -0,0 +1,198 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.parser.ast.declaration.function_declaration import FunctionDeclaration
+from src.parser.ast.expressions.binary_operation_type import \
+    EBinaryOperationType
+from src.parser.ast.expressions.bool_operation_type import EBoolOperationType
+from src.parser.ast.expressions.compare_type import ECompareType
+from src.parser.ast.expressions.unary_operation_type import EUnaryOperationType
+from src.semantic.types import ResolvedType, BuiltinType, integer_types, \
+    numeric_types, is_convertible
+
+
+@dataclass(frozen=True)
+class Signature:
+    """
+    Function or operator signature.
+    Builtin signatures have no declaration.
+    """
+    name: str
+    parameters: tuple[ResolvedType, ...]
+    return_type: ResolvedType
+    declaration: Optional[FunctionDeclaration] = field(
+        default=None, compare=False, hash=False, repr=False
+    )
+
+    def __str__(self) -> str:
+        parameters = ", ".join(str(p) for p in self.parameters)
+        return f"{self.name}({parameters}) -> {self.return_type}"
+
+    @property
+    def is_builtin(self) -> bool:
+        """
+        Indicates if signature belongs to builtin function or operator
+        :return: True if signature is builtin, False otherwise
+        """
+        return self.declaration is None
+
+
+# region Operators
+
+binary_operators = {
+    EBinaryOperationType.Add: "__add",
+    EBinaryOperationType.Sub: "__sub",
+    EBinaryOperationType.Multiply: "__mul",
+    EBinaryOperationType.Divide: "__div"
+}
+
+compare_operators = {
+    ECompareType.Equal: "__eq",
+    ECompareType.NotEqual: "__ne",
+    ECompareType.Less: "__lt",
+    ECompareType.Greater: "__gt"
+}
+
+bool_operators = {
+    EBoolOperationType.And: "__and",
+    EBoolOperationType.Or: "__or"
+}
+
+unary_operators = {
+    EUnaryOperationType.Minus: "__neg",
+    EUnaryOperationType.Negate: "__not"
+}
+
+operator_symbols = {
+    "__add": "+",
+    "__sub": "-",
+    "__mul": "*",
+    "__div": "/",
+    "__eq": "==",
+    "__ne": "!=",
+    "__lt": "<",
+    "__gt": ">",
+    "__and": "&&",
+    "__or": "||",
+    "__neg": "-",
+    "__not": "!"
+}
+
+equality_operators = ("__eq", "__ne")
+
+
+# endregion
+
+# region Builtin Signatures
+
+def _builtin_signatures() -> list[Signature]:
+    signatures = []
+
+    # Arithmetic returns type of first argument
+    for name in binary_operators.values():
+        for left in integer_types:
+            for right in integer_types:
+                signatures.append(Signature(name, (left, right), left))
+
+        for right in numeric_types:
+            signatures.append(
+                Signature(name, (BuiltinType.F32, right), BuiltinType.F32)
+            )
+
+    signatures.append(
+        Signature("__add", (BuiltinType.Str, BuiltinType.Str), BuiltinType.Str)
+    )
+
+    # Relations
+    for name in ("__lt", "__gt"):
+        for left in numeric_types:
+            for right in numeric_types:
+                signatures.append(
+                    Signature(name, (left, right), BuiltinType.Bool)
+                )
+
+    for name in equality_operators:
+        for left in numeric_types:
+            for right in numeric_types:
+                signatures.append(
+                    Signature(name, (left, right), BuiltinType.Bool)
+                )
+
+        for typ in (BuiltinType.Bool, BuiltinType.Str):
+            signatures.append(Signature(name, (typ, typ), BuiltinType.Bool))
+
+    # Boolean operations
+    for name in bool_operators.values():
+        signatures.append(
+            Signature(name, (BuiltinType.Bool, BuiltinType.Bool),
+                      BuiltinType.Bool)
+        )
+
+    # Unary operations
+    for typ in numeric_types:
+        signatures.append(Signature("__neg", (typ,), typ))
+
+    signatures.append(
+        Signature("__not", (BuiltinType.Bool,), BuiltinType.Bool)
+    )
+
+    # I/O and panic
+    for name in ("print", "println", "writeln", "panic"):
+        signatures.append(
+            Signature(name, (BuiltinType.Str,), BuiltinType.Void)
+        )
+
+    signatures.append(Signature("flush", (), BuiltinType.Void))
+
+    for typ in (*numeric_types, BuiltinType.Str):
+        signatures.append(Signature(f"read{typ.value}", (), typ))
+
+    return signatures
+
+
+builtin_signatures = _builtin_signatures()
+
+
+# endregion
+
+# region Functions
+
+def select_overload(candidates: list[Signature],
+                    arguments: tuple[ResolvedType, ...]
+                    ) -> Optional[Signature]:
+    """
+    Selects overload matching argument types.
+    Exact match is preferred; otherwise later arguments are converted before
+    earlier ones, preferring conversion to the type of the first argument.
+    On tie the earliest candidate wins.
+    :param candidates: overloads of single name
+    :param arguments: types of arguments
+    :return: selected overload or None if no overload is applicable
+    """
+    best = None
+    best_key = None
+
+    for index, candidate in enumerate(candidates):
+        if len(candidate.parameters) != len(arguments):
+            continue
+
+        if not all(is_convertible(argument, parameter)
+                   for argument, parameter
+                   in zip(arguments, candidate.parameters)):
+            continue
+
+        key = (
+            tuple(argument != parameter for argument, parameter
+                  in zip(arguments, candidate.parameters)),
+            tuple(parameter != arguments[0]
+                  for parameter in candidate.parameters),
+            index
+        )
+
+        if best_key is None or key < best_key:
+            best = candidate
+            best_key = key
+
+    return best
+
+# endregion
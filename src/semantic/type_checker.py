@@ -0,0 +1,575 @@
+from hashlib import blake2b
+from typing import Optional
+
+from src.common.location import Location
+from src.interface.ivisitor import IVisitor
+from src.parser.ast.access import Access
+from src.parser.ast.cast import Cast
+from src.parser.ast.constant import Constant
+from src.parser.ast.declaration.declaration_index import type_path
+from src.parser.ast.declaration.function_declaration import FunctionDeclaration
+from src.parser.ast.expressions.binary_operation import BinaryOperation
+from src.parser.ast.expressions.bool_operation import BoolOperation
+from src.parser.ast.expressions.compare import Compare
+from src.parser.ast.expressions.unary_operation import UnaryOperation
+from src.parser.ast.is_compare import IsCompare
+from src.parser.ast.module import Module
+from src.parser.ast.name import Name
+from src.parser.ast.node import Node
+from src.parser.ast.statements.assignment import Assignment
+from src.parser.ast.statements.block import Block
+from src.parser.ast.statements.fn_call import FnCall
+from src.parser.ast.statements.if_statement import IfStatement
+from src.parser.ast.statements.match_statement import MatchStatement
+from src.parser.ast.statements.new_struct_statement import NewStruct
+from src.parser.ast.statements.return_statement import ReturnStatement
+from src.parser.ast.statements.variable_declaration import VariableDeclaration
+from src.parser.ast.statements.while_statement import WhileStatement
+from src.parser.ast.traversal import fingerprint, walk
+from src.parser.ast.declaration.struct_declaration import StructDeclaration
+from src.semantic.errors import TypeMismatchError, TypeInferenceError, \
+    UndefinedFunctionError, UndefinedOperationError, InvalidCastError, \
+    UndefinedFieldError
+from src.semantic.overloads import OverloadTable, InlineCache, ArgumentTypes
+from src.semantic.registry import TypeRegistry
+from src.semantic.resolver import Resolution
+from src.semantic.signatures import Signature, builtin_signatures, \
+    binary_operators, compare_operators, bool_operators, unary_operators, \
+    operator_symbols, equality_operators
+from src.semantic.types import ResolvedType, BuiltinType, UserType, \
+    is_convertible, is_castable, literal_type
+
+type CallTarget = Signature | InlineCache
+type CachedTarget = Signature | tuple[str, Optional[ArgumentTypes]]
+type CacheKey = tuple[str, str]
+type CacheEntry = tuple[list[tuple[int, ResolvedType]],
+                        list[tuple[int, CachedTarget]]]
+type Dependency = tuple[bytes, set[str]]
+
+# Number of per-function results kept by default
+CACHE_CAPACITY = 16_384
+
+
+class TypeTable:
+    """
+    Side table with resolved types of expressions and variable binders
+    """
+
+    # region Dunder Methods
+
+    def __init__(self):
+        self._types: dict[int, ResolvedType] = {}
+        self._signatures: dict[int, Signature] = {}
+        self._targets: dict[int, CallTarget] = {}
+
+    # endregion
+
+    # region Methods
+
+    def type_of(self, node: Node) -> ResolvedType:
+        """
+        Resolved type of expression or variable binder
+        :param node: expression, parameter, declaration or matcher
+        :return: resolved type
+        """
+        return self._types[id(node)]
+
+    def has(self, node: Node) -> bool:
+        """
+        Checks if node has resolved type
+        :param node: node
+        :return: True if node has type, False otherwise
+        """
+        return id(node) in self._types
+
+    def set(self, node: Node, typ: ResolvedType) -> None:
+        self._types[id(node)] = typ
+
+    def signature(self, function: FunctionDeclaration) -> Signature:
+        """
+        Signature of user function
+        :param function: function declaration
+        :return: signature of function
+        """
+        return self._signatures[id(function)]
+
+    def set_signature(self, function: FunctionDeclaration,
+                      signature: Signature) -> None:
+        self._signatures[id(function)] = signature
+
+    def target(self, node: Node) -> CallTarget:
+        """
+        Target bound to function call or operation.
+        Inline cache is bound when target depends on runtime variants.
+        :param node: function call or operation
+        :return: overload signature or inline cache
+        """
+        return self._targets[id(node)]
+
+    def has_target(self, node: Node) -> bool:
+        """
+        Checks if node has bound target
+        :param node: node
+        :return: True if node has target, False otherwise
+        """
+        return id(node) in self._targets
+
+    def bind(self, node: Node, target: CallTarget) -> None:
+        self._targets[id(node)] = target
+
+    # endregion
+
+
+class TypeCache:
+    """
+    Cache of per-function type checking results.
+    Entries are keyed by structural hash of function and of the declarations
+    it may depend on, so they survive reparsing of unchanged code.
+    Least recently used entries are dropped when cache is full.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, capacity: int = CACHE_CAPACITY):
+        """
+        Creates new type cache
+        :param capacity: maximum number of entries
+        """
+        self._entries: dict[CacheKey, CacheEntry] = {}
+        self._capacity = capacity
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # endregion
+
+    # region Methods
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        # Entry is moved to end, dict order is order of use
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._entries[key] = entry
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        return entry
+
+    def put(self, key: CacheKey, entry: CacheEntry) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = entry
+
+        if len(self._entries) > self._capacity:
+            del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    # endregion
+
+
+class TypeChecker(IVisitor[Node]):
+    """
+    Static type checker with type inference.
+    Annotates every expression and variable binder with its type.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, cache: TypeCache = None):
+        """
+        Creates new type checker
+        :param cache: cache of per-function results shared between runs
+        """
+        self._cache = cache if cache is not None else TypeCache()
+        self._table = TypeTable()
+        self._registry: Optional[TypeRegistry] = None
+        self._resolution: Optional[Resolution] = None
+        self._overloads = OverloadTable()
+        self._module: Optional[Module] = None
+        self._dependencies: dict[str, Dependency] = {}
+        self._return_type: Optional[ResolvedType] = None
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def cache(self) -> TypeCache:
+        """
+        Cache of per-function results
+        :return: type cache
+        """
+        return self._cache
+
+    @property
+    def registry(self) -> TypeRegistry:
+        """
+        Registry of user types of last checked module
+        :return: type registry
+        """
+        return self._registry
+
+    @property
+    def overloads(self) -> OverloadTable:
+        """
+        Overload table of last checked module
+        :return: overload table
+        """
+        return self._overloads
+
+    # endregion
+
+    # region Methods
+
+    def check(self, module: Module, resolution: Resolution) -> TypeTable:
+        """
+        Checks types of module
+        :param module: module to check
+        :param resolution: variable resolution of module
+        :return: table of resolved types
+        """
+        self._table = TypeTable()
+        self._registry = TypeRegistry(module)
+        self._resolution = resolution
+        self._overloads = OverloadTable()
+        self._module = module
+        self._dependencies = {}
+
+        for function in module.function_declarations:
+            signature = self._signature(function)
+            self._table.set_signature(function, signature)
+            self._overloads.add(signature)
+
+        for signature in builtin_signatures:
+            self._overloads.add(signature)
+
+        for function in module.function_declarations:
+            self._check_function(function)
+
+        return self._table
+
+    def visit(self, node: Node) -> Optional[ResolvedType]:
+        match node:
+            case Block():
+                for statement in node.body:
+                    self.visit(statement)
+            case VariableDeclaration():
+                self._visit_variable_declaration(node)
+            case Assignment():
+                target = self.visit(node.access)
+                self._expect(self.visit(node.value), target,
+                             node.value.location)
+            case ReturnStatement():
+                self._visit_return_statement(node)
+            case IfStatement():
+                self._expect(self.visit(node.condition), BuiltinType.Bool,
+                             node.condition.location)
+                self.visit(node.block)
+                if node.else_block is not None:
+                    self.visit(node.else_block)
+            case WhileStatement():
+                self._expect(self.visit(node.condition), BuiltinType.Bool,
+                             node.condition.location)
+                self.visit(node.block)
+            case MatchStatement():
+                self._visit_match_statement(node)
+            case FnCall():
+                return self._visit_fn_call(node)
+            case NewStruct():
+                return self._visit_new_struct(node)
+            case Name():
+                slot = self._resolution.slot(node)
+                return self._set(node, self._table.type_of(slot.declaration))
+            case Access():
+                parent = self.visit(node.parent)
+                return self._set(node, self._registry.field(parent, node.name))
+            case BinaryOperation():
+                return self._visit_operation(
+                    node, binary_operators[node.op], node.left, node.right
+                )
+            case Compare():
+                return self._visit_operation(
+                    node, compare_operators[node.op], node.left, node.right
+                )
+            case BoolOperation():
+                return self._visit_operation(
+                    node, bool_operators[node.op], node.left, node.right
+                )
+            case UnaryOperation():
+                return self._visit_operation(
+                    node, unary_operators[node.op], node.operand
+                )
+            case Cast():
+                return self._visit_cast(node)
+            case IsCompare():
+                return self._visit_is_compare(node)
+            case Constant():
+                return self._set(node, literal_type(node.value))
+            case _:
+                raise TypeError(f"Cannot check node {type(node).__name__}")
+
+        return None
+
+    # endregion
+
+    # region Private Methods (Functions)
+
+    def _signature(self, function: FunctionDeclaration) -> Signature:
+        parameters = tuple(
+            self._registry.resolve(parameter.declared_type)
+            for parameter in function.parameters
+        )
+        return_type = self._registry.resolve(function.return_type) \
+            if function.return_type is not None else BuiltinType.Void
+
+        return Signature(function.name.identifier, parameters, return_type,
+                         function)
+
+    def _check_function(self, function: FunctionDeclaration) -> None:
+        identifiers = set()
+        key = (fingerprint(function, identifiers),
+               self._dependency_key(identifiers))
+
+        if (entry := self._cache.get(key)) is not None:
+            self._restore(function, entry)
+            return
+
+        signature = self._table.signature(function)
+        self._return_type = signature.return_type
+
+        for parameter, typ in zip(function.parameters, signature.parameters):
+            self._table.set(parameter, typ)
+
+        self.visit(function.block)
+
+        self._cache.put(key, self._store(function))
+
+    def _store(self, function: FunctionDeclaration) -> CacheEntry:
+        types = []
+        targets = []
+
+        for index, node in enumerate(walk(function)):
+            if self._table.has(node):
+                types.append((index, self._table.type_of(node)))
+
+            if self._table.has_target(node):
+                target = self._table.target(node)
+
+                # User signatures refer to declarations of current tree
+                if isinstance(target, InlineCache):
+                    targets.append((index, (target.name, None)))
+                elif not target.is_builtin:
+                    targets.append((index, (target.name, target.parameters)))
+                else:
+                    targets.append((index, target))
+
+        return types, targets
+
+    def _restore(self, function: FunctionDeclaration,
+                 entry: CacheEntry) -> None:
+        types, targets = entry
+        nodes = list(walk(function))
+
+        for index, typ in types:
+            self._table.set(nodes[index], typ)
+
+        for index, target in targets:
+            if isinstance(target, tuple):
+                name, parameters = target
+                target = self._overloads.exact(name, parameters) \
+                    if parameters is not None \
+                    else InlineCache(name, self._overloads)
+
+            self._table.bind(nodes[index], target)
+
+    def _dependency_key(self, identifiers: set[str]) -> str:
+        # Hash of declarations reachable from names used in function, so
+        # editing unrelated declarations keeps its entry valid
+        pending = identifiers | _operator_names
+        names = set()
+
+        while pending:
+            name = pending.pop()
+            names.add(name)
+            pending |= self._dependency(name)[1] - names
+
+        digest = blake2b(digest_size=16)
+        for name in sorted(names):
+            digest.update(self._dependency(name)[0])
+
+        return digest.hexdigest()
+
+    def _dependency(self, name: str) -> Dependency:
+        if (dependency := self._dependencies.get(name)) is not None:
+            return dependency
+
+        parts = [name]
+        names = set()
+
+        # Undeclared name is part of key too, declaring it changes key
+        for declaration in self._module.index.declarations(name):
+            if isinstance(declaration, FunctionDeclaration):
+                parts.append(str(self._table.signature(declaration)))
+                for parameter in declaration.parameters:
+                    names.add(type_path(parameter.declared_type)[0])
+                if declaration.return_type is not None:
+                    names.add(type_path(declaration.return_type)[0])
+            else:
+                parts.append(fingerprint(declaration, names))
+
+        dependency = self._dependencies[name] = \
+            ("\0".join(parts).encode() + b"\1", names)
+        return dependency
+
+    # endregion
+
+    # region Private Methods (Statements)
+
+    def _visit_variable_declaration(self, node: VariableDeclaration) -> None:
+        declared = self._registry.resolve(node.declared_type) \
+            if node.declared_type is not None else None
+        value = self.visit(node.value) if node.value is not None else None
+
+        if declared is None and value is None:
+            raise TypeInferenceError(node.name.identifier, node.location)
+
+        if value is not None:
+            self._expect(value, declared if declared is not None else value,
+                         node.value.location)
+
+        self._table.set(node, declared if declared is not None else value)
+
+    def _visit_return_statement(self, node: ReturnStatement) -> None:
+        if node.value is None:
+            if self._return_type != BuiltinType.Void:
+                raise TypeMismatchError(self._return_type, BuiltinType.Void,
+                                        node.location)
+            return
+
+        if self._return_type == BuiltinType.Void:
+            raise TypeMismatchError(BuiltinType.Void, self.visit(node.value),
+                                    node.value.location)
+
+        self._expect(self.visit(node.value), self._return_type,
+                     node.value.location)
+
+    def _visit_match_statement(self, node: MatchStatement) -> None:
+        typ = self.visit(node.expression)
+
+        if not isinstance(typ, UserType):
+            raise TypeMismatchError("enum", typ, node.expression.location)
+
+        for matcher in node.matchers:
+            checked = self._registry.resolve(matcher.checked_type)
+
+            if not is_castable(typ, checked):
+                raise TypeMismatchError(typ, checked,
+                                        matcher.checked_type.location)
+
+            self._table.set(matcher, checked)
+            self.visit(matcher.block)
+
+    # endregion
+
+    # region Private Methods (Expressions)
+
+    def _visit_fn_call(self, node: FnCall) -> ResolvedType:
+        arguments = tuple(self.visit(argument) for argument in node.arguments)
+        name = node.name.identifier
+
+        if (signature := self._overloads.resolve(name, arguments)) is not None:
+            self._table.bind(node, signature)
+            return self._set(node, signature.return_type)
+
+        # Target selected at runtime by variants of arguments
+        candidates = self._overloads.candidates(name, arguments)
+        return_types = {candidate.return_type for candidate in candidates}
+
+        if len(return_types) != 1:
+            raise UndefinedFunctionError(name, arguments, node.location)
+
+        self._table.bind(node, InlineCache(name, self._overloads))
+        return self._set(node, return_types.pop())
+
+    def _visit_new_struct(self, node: NewStruct) -> ResolvedType:
+        typ = self._registry.resolve(node.variant)
+
+        if not isinstance(self._registry.declaration(typ), StructDeclaration):
+            raise TypeMismatchError("struct", typ, node.variant.location)
+
+        for assignment in node.assignments:
+            if not isinstance(assignment.access, Name):
+                raise UndefinedFieldError(typ,
+                                          assignment.access.name.identifier,
+                                          assignment.access.location)
+
+            field = self._registry.field(typ, assignment.access)
+            self._expect(self.visit(assignment.value), field,
+                         assignment.value.location)
+
+        return self._set(node, typ)
+
+    def _visit_operation(self, node: Node, name: str,
+                         *operands: Node) -> ResolvedType:
+        types = tuple(self.visit(operand) for operand in operands)
+
+        if (signature := self._overloads.resolve(name, types)) is not None:
+            self._table.bind(node, signature)
+            return self._set(node, signature.return_type)
+
+        # Structural equality of user types
+        if name in equality_operators and \
+                all(isinstance(typ, UserType) for typ in types) and \
+                is_castable(*types):
+            self._table.bind(node, Signature(name, types, BuiltinType.Bool))
+            return self._set(node, BuiltinType.Bool)
+
+        raise UndefinedOperationError(operator_symbols[name], types,
+                                      node.location)
+
+    def _visit_cast(self, node: Cast) -> ResolvedType:
+        source = self.visit(node.value)
+        target = self._registry.resolve(node.to_type)
+
+        if not is_castable(source, target):
+            raise InvalidCastError(source, target, node.location)
+
+        return self._set(node, target)
+
+    def _visit_is_compare(self, node: IsCompare) -> ResolvedType:
+        source = self.visit(node.value)
+        target = self._registry.resolve(node.is_type)
+
+        if not isinstance(source, UserType) or \
+                not is_castable(source, target):
+            raise InvalidCastError(source, target, node.location)
+
+        return self._set(node, BuiltinType.Bool)
+
+    # endregion
+
+    # region Private Methods (Helpers)
+
+    def _set(self, node: Node, typ: ResolvedType) -> ResolvedType:
+        self._table.set(node, typ)
+        return typ
+
+    @staticmethod
+    def _expect(source: ResolvedType, target: ResolvedType,
+                location: Location) -> None:
+        if source == BuiltinType.Void or not is_convertible(source, target):
+            raise TypeMismatchError(target, source, location)
+
+    # endregion
+
+
+# region Helpers
+
+_operator_names = set(operator_symbols)
+
+# endregion
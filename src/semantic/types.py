@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class BuiltinType(Enum):
+    """
+    Enum class that represents builtin types of the language
+    """
+
+    I16 = "i16"
+    I32 = "i32"
+    I64 = "i64"
+    U16 = "u16"
+    U32 = "u32"
+    U64 = "u64"
+    F32 = "f32"
+    Bool = "bool"
+    Str = "str"
+    Void = "void"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass(frozen=True)
+class UserType:
+    """
+    Struct, enum or enum variant identified by its variant path
+    """
+    path: tuple[str, ...]
+
+    def __str__(self) -> str:
+        return "::".join(self.path)
+
+    def is_variant_of(self, other: 'UserType') -> bool:
+        """
+        Checks if type is (possibly nested) variant of other type
+        :param other: enum type
+        :return: True if type is variant of other type, False otherwise
+        """
+        return len(self.path) > len(other.path) and \
+            self.path[:len(other.path)] == other.path
+
+
+type ResolvedType = BuiltinType | UserType
+
+# region Builtin Types
+
+integer_types = (
+    BuiltinType.I16,
+    BuiltinType.I32,
+    BuiltinType.I64,
+    BuiltinType.U16,
+    BuiltinType.U32,
+    BuiltinType.U64
+)
+
+numeric_types = integer_types + (BuiltinType.F32,)
+
+integer_ranges = {
+    BuiltinType.I16: (-2 ** 15, 2 ** 15 - 1),
+    BuiltinType.I32: (-2 ** 31, 2 ** 31 - 1),
+    BuiltinType.I64: (-2 ** 63, 2 ** 63 - 1),
+    BuiltinType.U16: (0, 2 ** 16 - 1),
+    BuiltinType.U32: (0, 2 ** 32 - 1),
+    BuiltinType.U64: (0, 2 ** 64 - 1)
+}
+
+builtin_types = {
+    builtin.value: builtin
+    for builtin in BuiltinType
+    if builtin != BuiltinType.Void
+}
+
+# Conversions performed automatically by the interpreter (see docs)
+conversions = {
+    **{
+        integer: {*numeric_types, BuiltinType.Bool, BuiltinType.Str}
+        for integer in integer_types
+    },
+    BuiltinType.F32: {*numeric_types, BuiltinType.Bool, BuiltinType.Str},
+    BuiltinType.Bool: {BuiltinType.Bool, BuiltinType.Str},
+    BuiltinType.Str: {BuiltinType.Bool, BuiltinType.Str},
+    BuiltinType.Void: set()
+}
+
+
+# endregion
+
+# region Functions
+
+def is_convertible(source: ResolvedType, target: ResolvedType) -> bool:
+    """
+    Checks if value of source type can be implicitly converted to target type
+    :param source: type of value
+    :param target: expected type
+    :return: True if conversion is possible, False otherwise
+    """
+    if source == target:
+        return True
+
+    if isinstance(source, BuiltinType) and isinstance(target, BuiltinType):
+        return target in conversions[source]
+
+    if isinstance(source, UserType) and isinstance(target, UserType):
+        return source.is_variant_of(target)
+
+    return False
+
+
+def is_castable(source: ResolvedType, target: ResolvedType) -> bool:
+    """
+    Checks if value of source type can be explicitly cast to target type
+    :param source: type of value
+    :param target: type to cast to
+    :return: True if cast is possible, False otherwise
+    """
+    if isinstance(source, UserType) and isinstance(target, UserType):
+        return target.is_variant_of(source) or is_convertible(source, target)
+
+    return is_convertible(source, target)
+
+
+def literal_type(value: int | float | bool | str) -> BuiltinType:
+    """
+    Infers type of literal
+    :param value: literal value
+    :return: inferred type
+    """
+    match value:
+        case bool():
+            return BuiltinType.Bool
+        case int():
+            for integer in (BuiltinType.I32, BuiltinType.I64):
+                low, high = integer_ranges[integer]
+                if low <= value <= high:
+                    return integer
+            return BuiltinType.U64
+        case float():
+            return BuiltinType.F32
+        case str():
+            return BuiltinType.Str
+
+    raise TypeError(f"Unsupported literal {value!r}")
+
+# endregion
@@ -0,0 +1,16 @@
+"""
+Runs language server on standard streams.
+
+Usage: python -m src.server
+"""
+import sys
+
+from src.server.server import LanguageServer
+
+# Request loop shares interpreter lock with analysis worker, shorter
+# switch interval lets it resume sooner after blocking on output
+SWITCH_INTERVAL = 0.001
+
+if __name__ == "__main__":
+    sys.setswitchinterval(SWITCH_INTERVAL)
+    sys.exit(LanguageServer(sys.stdin.buffer, sys.stdout.buffer).serve())
@@ -0,0 +1,177 @@
+import subprocess
+import sys
+import threading
+import time
+from queue import Queue, Empty
+from typing import BinaryIO, Optional
+
+from src.server.protocol import read_body, decode_body, write_message
+
+
+class ResponseError(Exception):
+    def __init__(self, code: int, message: str):
+        self.code = code
+        self.message = message
+
+        super().__init__(self.message)
+
+
+class LanguageClient:
+    """
+    Minimal LSP client for scripting language server in tests and benchmarks.
+    Messages are read on separate thread, so notifications sent by server
+    do not block pending requests.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO,
+                 process: subprocess.Popen = None):
+        self._reader = reader
+        self._writer = writer
+        self._process = process
+        self._next_id = 0
+
+        # Writing must not block reader, server may wait for its output
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._responses: dict[int, tuple[dict, float]] = {}
+        self._events: dict[int, threading.Event] = {}
+        self._notifications: Queue[dict] = Queue()
+
+        self._thread = threading.Thread(target=self._read, daemon=True)
+        self._thread.start()
+
+    # endregion
+
+    # region Methods
+
+    @staticmethod
+    def spawn(arguments: list[str] = None) -> 'LanguageClient':
+        """
+        Starts server in child process and connects to its standard streams
+        :param arguments: command line, python -m src.server if omitted
+        :return: connected client
+        """
+        process = subprocess.Popen(
+            arguments or [sys.executable, "-m", "src.server"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        return LanguageClient(process.stdout, process.stdin, process)
+
+    def request(self, method: str, params: dict = None,
+                timeout: float = None) -> object:
+        """
+        Sends request and waits for its result
+        :param method: method name
+        :param params: request parameters
+        :param timeout: seconds to wait, forever if None
+        :return: result of request
+        """
+        return self.timed_request(method, params, timeout)[0]
+
+    def timed_request(self, method: str, params: dict = None,
+                      timeout: float = None) -> tuple[object, float]:
+        """
+        Sends request and measures time until its response is received
+        :param method: method name
+        :param params: request parameters
+        :param timeout: seconds to wait, forever if None
+        :return: result of request and seconds from sending request to
+            reading whole response, decoding of response is not included
+        """
+        with self._lock:
+            identifier = self._next_id
+            self._next_id += 1
+            event = self._events[identifier] = threading.Event()
+
+        start = time.perf_counter()
+        self._send({
+            "jsonrpc": "2.0", "id": identifier, "method": method,
+            "params": params or {}
+        })
+
+        if not event.wait(timeout):
+            raise TimeoutError(f"No response to {method}")
+
+        with self._lock:
+            del self._events[identifier]
+            response, received = self._responses.pop(identifier)
+
+        if (error := response.get("error")) is not None:
+            raise ResponseError(error["code"], error["message"])
+
+        return response.get("result"), received - start
+
+    def notify(self, method: str, params: dict = None) -> None:
+        """
+        Sends notification
+        :param method: method name
+        :param params: notification parameters
+        """
+        self._send({
+            "jsonrpc": "2.0", "method": method, "params": params or {}
+        })
+
+    def notification(self, method: str, timeout: float = None) -> dict:
+        """
+        Waits for next notification of method, others are dropped
+        :param method: method name
+        :param timeout: seconds to wait, forever if None
+        :return: notification parameters
+        """
+        while True:
+            try:
+                message = self._notifications.get(timeout=timeout)
+            except Empty:
+                raise TimeoutError(f"No {method} notification")
+
+            if message is None:
+                raise EOFError("Server closed connection")
+
+            if message.get("method") == method:
+                return message.get("params")
+
+    def close(self, timeout: float = 10) -> Optional[int]:
+        """
+        Shuts server down
+        :param timeout: seconds to wait for server process
+        :return: exit code of server process, None if not spawned
+        """
+        self.request("shutdown", timeout=timeout)
+        self.notify("exit")
+        self._writer.close()
+
+        if self._process is None:
+            return None
+
+        return self._process.wait(timeout)
+
+    # endregion
+
+    # region Private Methods
+
+    def _send(self, message: dict) -> None:
+        with self._write_lock:
+            write_message(self._writer, message)
+
+    def _read(self) -> None:
+        while (body := read_body(self._reader)) is not None:
+            received = time.perf_counter()
+            message = decode_body(body)
+
+            if "method" in message:
+                self._notifications.put(message)
+                continue
+
+            with self._lock:
+                identifier = message.get("id")
+                if (event := self._events.get(identifier)) is None:
+                    continue
+                self._responses[identifier] = message, received
+
+            event.set()
+
+        self._notifications.put(None)
+
+    # endregion
@@ -0,0 +1,91 @@
+import re
+from typing import Optional
+
+from src.semantic.type_checker import TypeCache
+from src.server.protocol import to_code_points
+from src.server.snapshot import Snapshot
+
+_NEWLINE = re.compile("\n")
+
+
+class Document:
+    """
+    Text of document opened by client with its cached analysis.
+    Characters of edits are UTF-16 code units by default, or code points
+    as counted by lexer if client agreed to utf-32 encoding.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, uri: str, text: str, version: int,
+                 utf16: bool = True):
+        self.uri = uri
+        self.version = version
+        self.utf16 = utf16
+        self._text = text
+        self._lines: Optional[list[int]] = None
+
+        # Latest finished analysis, may be older than text
+        self.snapshot: Optional[Snapshot] = None
+        self.cache = TypeCache()
+
+        # Requests received before first analysis
+        self.waiting: list[dict] = []
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    # endregion
+
+    # region Methods
+
+    def offset(self, line: int, character: int) -> int:
+        """
+        Index in text of LSP position, clamped to the text
+        :param line: zero-based line
+        :param character: zero-based character in line, in encoding of
+            document
+        :return: index in text
+        """
+        if self._lines is None:
+            self._lines = [0] + [match.end() for match
+                                 in _NEWLINE.finditer(self._text)]
+
+        if line >= len(self._lines):
+            return len(self._text)
+
+        begin = self._lines[line]
+        end = self._lines[line + 1] - 1 if line + 1 < len(self._lines) \
+            else len(self._text)
+
+        if self.utf16 and not self._text.isascii():
+            character = to_code_points(self._text[begin:end], character)
+
+        return min(begin + character, end)
+
+    def apply(self, changes: list[dict], version: int) -> None:
+        """
+        Applies content changes of didChange notification in order
+        :param changes: whole text or range replacements
+        :param version: version of document after changes
+        """
+        for change in changes:
+            if (edited := change.get("range")) is None:
+                self._text = change["text"]
+            else:
+                start, end = edited["start"], edited["end"]
+                begin = self.offset(start["line"], start["character"])
+                end = self.offset(end["line"], end["character"])
+                self._text = self._text[:begin] + change["text"] \
+                    + self._text[end:]
+
+            self._lines = None
+
+        self.version = version
+
+    # endregion
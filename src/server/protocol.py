@@ -0,0 +1,245 @@
+"""
+Base protocol of Language Server Protocol.
+Messages are JSON-RPC objects framed with Content-Length header.
+"""
+import json
+import re
+from typing import BinaryIO, Optional
+
+from src.common.location import Location
+from src.common.position import Position
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+SERVER_NOT_INITIALIZED = -32002
+
+# Characters outside of basic multilingual plane, two UTF-16 code units
+_ASTRAL = re.compile("[\U00010000-\U0010FFFF]")
+
+
+class ProtocolError(Exception):
+    def __init__(self, message: str):
+        self.message = message
+
+        super().__init__(self.message)
+
+
+# region Framing
+
+def read_message(stream: BinaryIO) -> Optional[dict]:
+    """
+    Reads one message from stream
+    :param stream: input stream
+    :return: decoded message, None at end of stream
+    """
+    if (body := read_body(stream)) is None:
+        return None
+
+    return decode_body(body)
+
+
+def read_body(stream: BinaryIO) -> Optional[bytes]:
+    """
+    Reads body of one message from stream without decoding it
+    :param stream: input stream
+    :return: message body, None at end of stream
+    """
+    length = None
+
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+
+        line = line.strip()
+        if not line:
+            break
+
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            # Validated after whole header, so next message stays framed
+            length = value.strip()
+
+    if length is None:
+        raise ProtocolError("Missing Content-Length header")
+    if not length.isdigit():
+        raise ProtocolError("Invalid Content-Length header")
+
+    length = int(length)
+
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+
+    return body
+
+
+def decode_body(body: bytes) -> dict:
+    """
+    Decodes JSON body of message
+    :param body: message body
+    :return: decoded message
+    """
+    try:
+        return json.loads(body)
+    except ValueError:
+        raise ProtocolError("Message is not valid JSON")
+
+
+def encode_message(message: dict) -> bytes:
+    """
+    Frames message with header
+    :param message: JSON-RPC message
+    :return: bytes to write
+    """
+    body = json.dumps(message, separators=(",", ":")).encode()
+    return b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+
+
+def encode_response(identifier: int | str, result: bytes) -> bytes:
+    """
+    Frames response with result encoded beforehand
+    :param identifier: id of request
+    :param result: JSON of result
+    :return: bytes to write
+    """
+    body = b'{"jsonrpc":"2.0","id":%s,"result":%s}' \
+        % (json.dumps(identifier).encode(), result)
+    return b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+
+
+def write_message(stream: BinaryIO, message: dict | bytes) -> None:
+    """
+    Writes one message to stream and flushes it
+    :param stream: output stream
+    :param message: JSON-RPC message or already framed message
+    """
+    stream.write(message if isinstance(message, bytes)
+                 else encode_message(message))
+    stream.flush()
+
+# endregion
+
+# region Conversion
+
+class Columns:
+    """
+    Converts characters of LSP positions between UTF-16 code units used
+    by default by LSP and code points counted by lexer.
+    Only lines with characters outside of basic multilingual plane are
+    kept, in other lines both counts are equal.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, text: str, utf16: bool = True):
+        self._lines: dict[int, str] = {}
+
+        if utf16 and not text.isascii() and _ASTRAL.search(text):
+            self._lines = {
+                number: line for number, line
+                in enumerate(text.split("\n"), start=1)
+                if _ASTRAL.search(line)
+            }
+
+    # endregion
+
+    # region Methods
+
+    def units(self, line: int, count: int) -> int:
+        """
+        Length in LSP characters of beginning of line
+        :param line: one-based line
+        :param count: code points at beginning of line
+        :return: LSP characters
+        """
+        if (text := self._lines.get(line)) is None:
+            return count
+
+        return to_units(text, count)
+
+    def code_points(self, line: int, units: int) -> int:
+        """
+        Length in code points of beginning of line
+        :param line: one-based line
+        :param units: LSP characters at beginning of line
+        :return: code points
+        """
+        if (text := self._lines.get(line)) is None:
+            return units
+
+        return to_code_points(text, units)
+
+    # endregion
+
+
+def to_units(text: str, count: int) -> int:
+    """
+    UTF-16 code units of first code points of text
+    :param text: line of text
+    :param count: code points
+    :return: code units
+    """
+    return count + len(_ASTRAL.findall(text, 0, count))
+
+
+def to_code_points(text: str, units: int) -> int:
+    """
+    Code points of first UTF-16 code units of text, code unit in middle
+    of character is counted as whole character
+    :param text: line of text
+    :param units: code units, may exceed length of text
+    :return: code points
+    """
+    count = 0
+
+    for character in text:
+        if units <= 0:
+            break
+
+        units -= 2 if character > "\uffff" else 1
+        count += 1
+
+    return count + max(units, 0)
+
+
+def to_range(location: Location, columns: Columns = None) -> dict:
+    """
+    LSP range of location.
+    Lines and characters of LSP are zero-based and range end is exclusive,
+    while location end points at last character.
+    :param location: source location
+    :param columns: columns of document, code points are kept if omitted
+    :return: range object
+    """
+    begin, end = location.begin, location.end
+    begin_column, end_column = begin.column - 1, end.column
+
+    if columns is not None:
+        begin_column = columns.units(begin.line, begin_column)
+        end_column = columns.units(end.line, end_column)
+
+    return {
+        "start": {"line": begin.line - 1, "character": begin_column},
+        "end": {"line": end.line - 1, "character": end_column}
+    }
+
+
+def to_position(position: dict, columns: Columns = None) -> Position:
+    """
+    Source position of LSP position
+    :param position: position object
+    :param columns: columns of document, code points are kept if omitted
+    :return: position of character after cursor
+    """
+    line, character = position["line"] + 1, position["character"]
+
+    if columns is not None:
+        character = columns.code_points(line, character)
+
+    return Position(line, character + 1)
+
+# endregion
@@ -0,0 +1,348 @@
+import gc
+import threading
+import time
+from operator import itemgetter
+from typing import BinaryIO, Callable, Optional
+
+from src.server.document import Document
+from src.server.protocol import read_message, write_message, to_range, \
+    encode_response, \
+    to_position, ProtocolError, PARSE_ERROR, METHOD_NOT_FOUND, \
+    INVALID_PARAMS, INTERNAL_ERROR, SERVER_NOT_INITIALIZED
+from src.server.snapshot import Snapshot
+
+# Seconds without edits before document is analysed
+DEBOUNCE = 0.2
+
+# LSP text document sync kind
+INCREMENTAL_SYNC = 2
+
+type Handler = Callable[[Snapshot, dict], object]
+
+
+class LanguageServer:
+    """
+    Language server of FHLL speaking LSP over byte streams.
+    Request loop only edits document text and reads cached snapshots,
+    documents are parsed and checked by background worker once edits
+    settle. Requests are answered from latest finished snapshot, even if
+    newer edits are still being analysed.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO,
+                 debounce: float = DEBOUNCE):
+        self._reader = reader
+        self._writer = writer
+        self._debounce = debounce
+
+        self._documents: dict[str, Document] = {}
+        self._initialized = False
+        # LSP counts characters in UTF-16 code units unless agreed otherwise
+        self._utf16 = True
+        self._shutdown = False
+        self._running = False
+
+        # Guards documents, pending analyses and waiting requests
+        self._condition = threading.Condition()
+        self._pending: dict[str, float] = {}
+        self._write_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._work, daemon=True)
+
+        self._requests: dict[str, Callable[[dict], object]] = {
+            "initialize": self._initialize,
+            "shutdown": self._shutdown_request
+        }
+        self._document_requests: dict[str, Handler] = {
+            "textDocument/documentSymbol": self._document_symbol,
+            "textDocument/definition": self._definition
+        }
+        self._notifications: dict[str, Callable[[dict], None]] = {
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didClose": self._did_close
+        }
+
+    # endregion
+
+    # region Methods
+
+    def serve(self) -> int:
+        """
+        Handles messages until exit notification or end of input
+        :return: process exit code, 0 after orderly shutdown
+        """
+        self._running = True
+        self._worker.start()
+
+        try:
+            while True:
+                try:
+                    message = read_message(self._reader)
+                except ProtocolError as error:
+                    self._respond_error(None, PARSE_ERROR, error.message)
+                    continue
+
+                if message is None or message.get("method") == "exit":
+                    break
+
+                self._dispatch(message)
+        finally:
+            with self._condition:
+                self._running = False
+                self._condition.notify()
+            self._worker.join()
+
+        return 0 if self._shutdown else 1
+
+    # endregion
+
+    # region Dispatch
+
+    def _dispatch(self, message: dict) -> None:
+        method = message.get("method")
+        params = message.get("params") or {}
+
+        if "id" not in message:
+            if self._initialized and method in self._notifications:
+                self._notifications[method](params)
+            return
+
+        identifier = message["id"]
+        if not self._initialized and method != "initialize":
+            self._respond_error(identifier, SERVER_NOT_INITIALIZED,
+                                "Server is not initialized")
+            return
+
+        if method in self._requests:
+            self._respond(identifier, self._requests[method](params))
+        elif method in self._document_requests:
+            self._document_request(message, params)
+        else:
+            self._respond_error(identifier, METHOD_NOT_FOUND,
+                                f"Unknown method {method}")
+
+    def _document_request(self, message: dict, params: dict) -> None:
+        uri = params.get("textDocument", {}).get("uri")
+
+        with self._condition:
+            if (document := self._documents.get(uri)) is None:
+                self._respond_error(message["id"], INVALID_PARAMS,
+                                    f"Document {uri} is not open")
+                return
+
+            # First analysis is still running, worker answers later
+            if (snapshot := document.snapshot) is None:
+                document.waiting.append(message)
+                return
+
+        self._answer(document, snapshot, message)
+
+    def _answer(self, document: Document, snapshot: Snapshot,
+                message: dict) -> None:
+        if snapshot is None:
+            self._respond_error(message["id"], INTERNAL_ERROR,
+                                f"Document {document.uri} was not analysed")
+            return
+
+        handler = self._document_requests[message["method"]]
+
+        try:
+            result = handler(snapshot, message.get("params") or {})
+        except (KeyError, TypeError, ValueError) as error:
+            self._respond_error(message["id"], INVALID_PARAMS, str(error))
+            return
+
+        if message["method"] == "textDocument/definition":
+            result = [{"uri": document.uri,
+                       "range": to_range(location, snapshot.columns)}
+                      for location in result]
+
+        if isinstance(result, bytes):
+            self._send(encode_response(message["id"], result))
+        else:
+            self._respond(message["id"], result)
+
+    # endregion
+
+    # region Requests
+
+    def _initialize(self, params: dict) -> dict:
+        self._initialized = True
+        capabilities = {
+            "textDocumentSync": {
+                "openClose": True,
+                "change": INCREMENTAL_SYNC
+            },
+            "documentSymbolProvider": True,
+            "definitionProvider": True
+        }
+
+        # Characters are counted in code points by lexer, without utf-32
+        # they are converted from and to default UTF-16 code units
+        encodings = params.get("capabilities", {}) \
+            .get("general", {}).get("positionEncodings", [])
+        if "utf-32" in encodings:
+            capabilities["positionEncoding"] = "utf-32"
+            self._utf16 = False
+
+        return {
+            "capabilities": capabilities,
+            "serverInfo": {"name": "fhll"}
+        }
+
+    def _shutdown_request(self, _: dict) -> None:
+        self._shutdown = True
+
+    @staticmethod
+    def _document_symbol(snapshot: Snapshot, _: dict) -> bytes:
+        return snapshot.symbols_json()
+
+    @staticmethod
+    def _definition(snapshot: Snapshot, params: dict) -> list:
+        return snapshot.definition(to_position(params["position"],
+                                               snapshot.columns))
+
+    # endregion
+
+    # region Notifications
+
+    def _did_open(self, params: dict) -> None:
+        item = params["textDocument"]
+
+        with self._condition:
+            self._documents[item["uri"]] = Document(
+                item["uri"], item["text"], item.get("version", 0),
+                self._utf16
+            )
+            self._schedule(item["uri"])
+
+    def _did_change(self, params: dict) -> None:
+        item = params["textDocument"]
+
+        with self._condition:
+            if (document := self._documents.get(item["uri"])) is None:
+                return
+
+            document.apply(params["contentChanges"],
+                           item.get("version", document.version + 1))
+            self._schedule(item["uri"])
+
+    def _did_close(self, params: dict) -> None:
+        uri = params["textDocument"]["uri"]
+
+        with self._condition:
+            document = self._documents.pop(uri, None)
+            self._pending.pop(uri, None)
+
+        if document is not None:
+            for message in document.waiting:
+                self._respond(message["id"], None)
+            self._notify("textDocument/publishDiagnostics",
+                         {"uri": uri, "diagnostics": []})
+
+    def _schedule(self, uri: str) -> None:
+        # Every edit postpones analysis of document
+        self._pending[uri] = time.monotonic() + self._debounce
+        self._condition.notify()
+
+    # endregion
+
+    # region Worker
+
+    def _work(self) -> None:
+        while (task := self._next_task()) is not None:
+            document, text, version = task
+
+            try:
+                self._analyse(document, text, version)
+            except Exception as error:
+                # Bug in analysis must not stop the worker
+                self._notify("window/logMessage", {
+                    "type": 1,
+                    "message": f"Analysis of {document.uri} failed: {error!r}"
+                })
+                self._release(document, None)
+
+    def _next_task(self) -> Optional[tuple[Document, str, int]]:
+        with self._condition:
+            while self._running:
+                if not self._pending:
+                    self._condition.wait()
+                    continue
+
+                uri, deadline = min(self._pending.items(),
+                                    key=itemgetter(1))
+                if (delay := deadline - time.monotonic()) > 0:
+                    self._condition.wait(delay)
+                    continue
+
+                del self._pending[uri]
+                document = self._documents[uri]
+                return document, document.text, document.version
+
+        return None
+
+    def _analyse(self, document: Document, text: str, version: int) -> None:
+        previous = document.snapshot
+
+        # Edits may cancel each other, unchanged text is not parsed again
+        if previous is not None and previous.text == text:
+            snapshot = previous
+        else:
+            # Full collections over syntax tree of long document would
+            # pause request loop for seconds, snapshots are long-lived
+            # and mostly free of cycles, so they are kept out of collector
+            gc.disable()
+            try:
+                snapshot = Snapshot.build(text, version, document.cache,
+                                          document.utf16)
+            finally:
+                gc.freeze()
+                gc.enable()
+
+            snapshot.symbols_json()
+
+        self._release(document, snapshot)
+
+        if snapshot is not previous:
+            self._notify("textDocument/publishDiagnostics", {
+                "uri": document.uri,
+                "version": version,
+                "diagnostics": snapshot.lsp_diagnostics()
+            })
+
+    def _release(self, document: Document,
+                 snapshot: Optional[Snapshot]) -> None:
+        with self._condition:
+            if snapshot is not None:
+                document.snapshot = snapshot
+            waiting, document.waiting = document.waiting, []
+
+        for message in waiting:
+            self._answer(document, snapshot, message)
+
+    # endregion
+
+    # region Output
+
+    def _send(self, message: dict | bytes) -> None:
+        with self._write_lock:
+            write_message(self._writer, message)
+
+    def _respond(self, identifier: int | str, result: object) -> None:
+        self._send({"jsonrpc": "2.0", "id": identifier, "result": result})
+
+    def _respond_error(self, identifier: Optional[int | str], code: int,
+                       message: str) -> None:
+        self._send({
+            "jsonrpc": "2.0",
+            "id": identifier,
+            "error": {"code": code, "message": message}
+        })
+
+    def _notify(self, method: str, params: dict) -> None:
+        self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    # endregion
@@ -0,0 +1,341 @@
+import json
+from bisect import bisect_right
+from typing import Optional
+
+from src.common.location import Location
+from src.common.position import Position
+from src.lexer.errors import LexerException, error_position
+from src.lexer.lexer import Lexer
+from src.lexer.token import Token
+from src.lexer.token_kind import TokenKind
+from src.parser.ast.access import Access
+from src.parser.ast.common import Type
+from src.parser.ast.declaration.declaration_index import type_path
+from src.parser.ast.declaration.enum_declaration import EnumDeclaration
+from src.parser.ast.declaration.field_declaration import FieldDeclaration
+from src.parser.ast.declaration.function_declaration import FunctionDeclaration
+from src.parser.ast.declaration.parameter import Parameter
+from src.parser.ast.declaration.struct_declaration import StructDeclaration
+from src.parser.ast.module import Module
+from src.parser.ast.name import Name
+from src.parser.ast.statements.fn_call import FnCall
+from src.parser.ast.statements.matcher import Matcher
+from src.parser.ast.statements.new_struct_statement import NewStruct
+from src.parser.ast.statements.variable_declaration import VariableDeclaration
+from src.parser.ast.traversal import walk
+from src.parser.ast.variant_access import VariantAccess
+from src.parser.errors import ParserException
+from src.parser.parser import Parser
+from src.semantic.errors import SemanticException
+from src.semantic.resolver import Resolution, Resolver
+from src.semantic.type_checker import TypeCache, TypeChecker
+from src.server.protocol import Columns, to_range
+from src.utils.buffer import StreamBuffer
+
+type Diagnostic = LexerException | ParserException | SemanticException
+
+# Symbol kinds of LSP
+FUNCTION_SYMBOL = 12
+STRUCT_SYMBOL = 23
+ENUM_SYMBOL = 10
+ENUM_MEMBER_SYMBOL = 22
+FIELD_SYMBOL = 8
+
+ERROR_SEVERITY = 1
+
+
+class _RecordingLexer:
+    """
+    Lexer proxy which keeps tokens read by parser
+    """
+
+    def __init__(self, lexer: Lexer):
+        self._lexer = lexer
+        self.symbols = lexer.symbols
+        self.tokens: list[Token] = []
+
+    def get_next_token(self) -> Token:
+        token = self._lexer.get_next_token()
+        self.tokens.append(token)
+        return token
+
+
+class Snapshot:
+    """
+    Tokens, syntax tree and diagnostics of one version of document.
+    Snapshot is immutable once built, so it can be read by request loop
+    while next one is built in background.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, text: str, version: int, tokens: list[Token],
+                 module: Module, resolution: Resolution,
+                 diagnostics: list[Diagnostic], columns: Columns = None):
+        self.text = text
+        self.version = version
+        self.tokens = tokens
+        self.module = module
+        self.resolution = resolution
+        self.diagnostics = diagnostics
+        self.columns = columns if columns is not None else Columns(text)
+
+        self._begins = [(token.location.begin.line,
+                         token.location.begin.column) for token in tokens]
+        self._definitions = self._index_definitions()
+        self._symbols: Optional[list[dict]] = None
+        self._symbols_json: Optional[bytes] = None
+
+    # endregion
+
+    # region Methods
+
+    @staticmethod
+    def build(text: str, version: int, cache: TypeCache = None,
+              utf16: bool = True) -> 'Snapshot':
+        """
+        Parses and checks document, errors are collected as diagnostics
+        :param text: document text
+        :param version: document version
+        :param cache: type cache of document shared between versions
+        :param utf16: whether LSP characters are UTF-16 code units
+        :return: new snapshot
+        """
+        lexer = _RecordingLexer(
+            Lexer(StreamBuffer.from_str(text), skip_comments=True)
+        )
+        parser = Parser(lexer, recover=True)
+        module = parser.parse()
+        diagnostics: list[Diagnostic] = list(parser.diagnostics)
+
+        # Functions are resolved separately, one error does not hide
+        # definitions in the rest of module
+        resolution = Resolution()
+        resolver = Resolver(resolution)
+        resolved = True
+
+        for function in module.function_declarations:
+            try:
+                resolver.resolve_function(function)
+            except SemanticException as exception:
+                diagnostics.append(exception)
+                resolved = False
+
+        # Types are checked only in module free of other errors
+        if not diagnostics and resolved:
+            try:
+                TypeChecker(cache).check(module, resolution)
+            except SemanticException as exception:
+                diagnostics.append(exception)
+
+        return Snapshot(text, version, lexer.tokens, module, resolution,
+                        diagnostics, Columns(text, utf16))
+
+    def token_at(self, position: Position) -> Optional[Token]:
+        """
+        Token containing position
+        :param position: position of character
+        :return: token, None if character is not part of token
+        """
+        index = bisect_right(self._begins, (position.line, position.column))
+        if index == 0:
+            return None
+
+        token = self.tokens[index - 1]
+        end = token.location.end
+        if (position.line, position.column) > (end.line, end.column):
+            return None
+
+        return token
+
+    def definition(self, position: Position) -> list[Location]:
+        """
+        Declarations of identifier under cursor
+        :param position: position of character after cursor
+        :return: locations of declared names, overloads of function call
+        """
+        token = self.token_at(position)
+
+        # Cursor right after identifier still points at it
+        if (token is None or token.kind != TokenKind.Identifier) \
+                and position.column > 1:
+            token = self.token_at(Position(position.line,
+                                           position.column - 1))
+
+        if token is None or token.kind != TokenKind.Identifier:
+            return []
+
+        begin = token.location.begin
+        return self._definitions.get((begin.line, begin.column), [])
+
+    def symbols(self) -> list[dict]:
+        """
+        Declarations of module as LSP document symbols, built once
+        :return: hierarchy of document symbols
+        """
+        if self._symbols is None:
+            module, columns = self.module, self.columns
+            self._symbols = sorted(
+                [_function_symbol(function, columns)
+                 for function in module.function_declarations]
+                + [_struct_symbol(struct, STRUCT_SYMBOL, columns)
+                   for struct in module.struct_declarations]
+                + [_enum_symbol(enum, columns)
+                   for enum in module.enum_declarations],
+                key=lambda symbol: (symbol["range"]["start"]["line"],
+                                    symbol["range"]["start"]["character"])
+            )
+
+        return self._symbols
+
+    def symbols_json(self) -> bytes:
+        """
+        Document symbols encoded as JSON array, built once.
+        Symbols are encoded one by one, encoding of whole list of long
+        document would hold interpreter lock for long time.
+        :return: encoded symbols
+        """
+        if self._symbols_json is None:
+            self._symbols_json = b"[" + b",".join(
+                json.dumps(symbol, separators=(",", ":")).encode()
+                for symbol in self.symbols()
+            ) + b"]"
+
+        return self._symbols_json
+
+    def lsp_diagnostics(self) -> list[dict]:
+        """
+        Diagnostics as LSP objects
+        :return: list of diagnostics
+        """
+        return [{
+            "range": to_range(_location_of(diagnostic), self.columns),
+            "severity": ERROR_SEVERITY,
+            "source": "fhll",
+            "message": diagnostic.message
+        } for diagnostic in self.diagnostics]
+
+    # endregion
+
+    # region Private Methods
+
+    def _index_definitions(self) -> dict[tuple[int, int], list[Location]]:
+        module = self.module
+        index = module.index
+
+        # Walk is pre-order, names with special meaning are indexed by
+        # their parent before walk reaches them
+        definitions: dict[tuple[int, int], list[Location]] = {}
+
+        def define(name: Name, locations: list[Location]) -> None:
+            begin = name.location.begin
+            definitions.setdefault((begin.line, begin.column), locations)
+
+        for node in walk(module):
+            match node:
+                case FunctionDeclaration() | StructDeclaration() \
+                        | EnumDeclaration() | FieldDeclaration() \
+                        | Parameter() | VariableDeclaration() | Matcher():
+                    define(node.name, [node.name.location])
+                case FnCall():
+                    define(node.name, [
+                        function.name.location for function
+                        in index.functions(node.name.identifier)
+                    ])
+                case Access():
+                    # Field of struct, its type is not known to parser
+                    define(node.name, [])
+                case VariantAccess():
+                    variant = index.variant(node)
+                    define(node.name, [variant.name.location]
+                           if variant else [])
+                case NewStruct():
+                    for assignment in node.assignments:
+                        if isinstance(assignment.access, Name):
+                            define(assignment.access, [])
+                case Name():
+                    try:
+                        binder = self.resolution.slot(node).declaration
+                        define(node, [binder.name.location])
+                    except KeyError:
+                        declared = index.type(node.identifier)
+                        define(node, [declared.name.location]
+                               if declared else [])
+
+        return definitions
+
+    # endregion
+
+
+# region Helpers
+
+def _location_of(diagnostic: Diagnostic) -> Location:
+    # Parser and some lexer errors store only position
+    if (location := getattr(diagnostic, "location", None)) is not None:
+        return location
+
+    return Location.at(error_position(diagnostic))
+
+
+def _type_name(declared_type: Type) -> str:
+    if isinstance(declared_type, VariantAccess):
+        return "::".join(type_path(declared_type))
+
+    return declared_type.identifier
+
+
+def _symbol(name: Name, kind: int, location: Location, columns: Columns,
+            children: list[dict] = None, detail: str = None) -> dict:
+    symbol = {
+        "name": name.identifier,
+        "kind": kind,
+        "range": to_range(location, columns),
+        "selectionRange": to_range(name.location, columns)
+    }
+
+    if detail is not None:
+        symbol["detail"] = detail
+
+    if children is not None:
+        symbol["children"] = children
+
+    return symbol
+
+
+def _function_symbol(function: FunctionDeclaration, columns: Columns
+                     ) -> dict:
+    parameters = ", ".join(
+        f"{'mut ' if parameter.mutable else ''}{parameter.name.identifier}: "
+        f"{_type_name(parameter.declared_type)}"
+        for parameter in function.parameters
+    )
+    detail = f"({parameters})"
+
+    if function.return_type is not None:
+        detail += f" -> {_type_name(function.return_type)}"
+
+    # Location of declaration ends with signature, symbol covers body
+    location = Location(function.location.begin, function.block.location.end)
+
+    return _symbol(function.name, FUNCTION_SYMBOL, location, columns,
+                   detail=detail)
+
+
+def _struct_symbol(struct: StructDeclaration, kind: int,
+                   columns: Columns) -> dict:
+    return _symbol(struct.name, kind, struct.location, columns, [
+        _symbol(field.name, FIELD_SYMBOL, field.location, columns,
+                detail=_type_name(field.declared_type))
+        for field in struct.fields
+    ])
+
+
+def _enum_symbol(enum: EnumDeclaration, columns: Columns) -> dict:
+    return _symbol(enum.name, ENUM_SYMBOL, enum.location, columns, [
+        _enum_symbol(variant, columns)
+        if isinstance(variant, EnumDeclaration)
+        else _struct_symbol(variant, ENUM_MEMBER_SYMBOL, columns)
+        for variant in enum.variants
+    ])
+
+# endregion
@@ -1,7 +1,12 @@
 from io import StringIO, TextIOWrapper
-from typing import TextIO, BinaryIO
+from typing import TextIO, BinaryIO, Optional
 
 from src.common.position import Position
+from src.utils.char_class import TABLE, char_class
+from src.utils.span import Span
+
+# Number of characters read from stream at once
+CHUNK_SIZE = 64 * 1024
 
 
 class StreamBuffer:
@@ -10,6 +15,8 @@ class StreamBuffer:
     - enforces same "\n" newlines
     - automatically calculates line number and column
     - detects and indicates eof
+    - reads stream in chunks, runs of characters of same class are read
+      at once, with table lookups only if chunk is ASCII
     """
 
     # region Dunder methods
@@ -23,9 +30,14 @@ class StreamBuffer:
         self._line = 1
         self._column = 1
         self._char = None
-        self._previous_position = None
+        self._previous: Optional[tuple[int, int]] = None
         self._eof = False
 
+        # Current character is chunk[index - 1]
+        self._chunk = ""
+        self._index = 0
+        self._ascii = True
+
     def __iter__(self):
         return self
 
@@ -73,7 +85,10 @@ class StreamBuffer:
         Previous character position in buffer
         :return: previous position in buffer
         """
-        return self._previous_position
+        if self._previous is None:
+            return None
+
+        return Position(*self._previous)
 
     @property
     def eof(self) -> bool:
@@ -144,16 +159,14 @@ class StreamBuffer:
         Returns "" if end of file is reached.
         :return: next character read from input stream
         """
-        if not self._stream.readable():
-            raise RuntimeError("Stream is not readable")
-
-        char = self._stream.read(1)
-        position = self.position
-
-        if char == "":
+        if self._index >= len(self._chunk) and not self._read_chunk():
             self._eof = True
-            self._previous_position = position
-            return char
+            self._previous = (self._line, self._column)
+            return ""
+
+        char = self._chunk[self._index]
+        self._index += 1
+        self._previous = (self._line, self._column)
 
         if self._char is not None:
             self._column += 1
@@ -163,8 +176,108 @@ class StreamBuffer:
             self._column = 1
 
         self._char = char
-        self._previous_position = position
 
         return char
 
+    def peek(self) -> str:
+        """
+        Character after last read character, without reading it.
+        Returns "" if there is no next character.
+        :return: next character
+        """
+        if self._char is None or self._eof:
+            return ""
+
+        if self._index >= len(self._chunk):
+            if not (following := self._stream.read(CHUNK_SIZE)):
+                return ""
+
+            # Last read character stays in chunk
+            self._chunk = self._chunk[self._index - 1:] + following
+            self._index = 1
+            self._ascii = self._chunk.isascii()
+
+        return self._chunk[self._index]
+
+    def read_while(self, classes: int, limit: int = None) -> str:
+        """
+        Reads run of characters belonging to any of given classes, starting
+        with last read character.
+        Afterwards, last read character is first character after the run.
+        :param classes: bit flags of character classes (see char_class)
+        :param limit: maximum length of run
+        :return: read run, empty if last character does not belong to classes
+        """
+        source, begin, end = self._read_run(classes, limit)
+        return source[begin:end]
+
+    def read_span(self, classes: int, limit: int = None) -> Span:
+        """
+        Reads run of characters like read_while, without copying them
+        until span is converted to string
+        :param classes: bit flags of character classes (see char_class)
+        :param limit: maximum length of run
+        :return: span of read run
+        """
+        return Span(*self._read_run(classes, limit))
+
+    # endregion
+
+    # region Private Methods
+
+    def _read_chunk(self) -> bool:
+        if not self._stream.readable():
+            raise RuntimeError("Stream is not readable")
+
+        self._chunk = self._stream.read(CHUNK_SIZE)
+        self._index = 0
+        self._ascii = self._chunk.isascii()
+
+        return self._chunk != ""
+
+    def _read_run(self, classes: int, limit: Optional[int]
+                  ) -> tuple[str, int, int]:
+        char = self._char
+        if self._eof or char is None or not classes & (
+                TABLE[ord(char)] if char < "\u0100" else char_class(char)):
+            return "", 0, 0
+
+        chunk = self._chunk
+        begin = self._index - 1
+        end = begin + 1
+        stop = len(chunk) if limit is None else min(len(chunk), begin + limit)
+
+        if self._ascii:
+            while end < stop and TABLE[ord(chunk[end])] & classes:
+                end += 1
+        else:
+            while end < stop and char_class(chunk[end]) & classes:
+                end += 1
+
+        self._skip(chunk, begin, end)
+
+        # Run may continue in next chunk
+        if end < len(chunk) or end - begin == limit or self._eof:
+            return chunk, begin, end
+
+        run = chunk[begin:end] + self.read_while(
+            classes, limit - (end - begin) if limit is not None else None
+        )
+        return run, 0, len(run)
+
+    def _skip(self, chunk: str, begin: int, end: int) -> None:
+        # Moves to last character of run, then reads character after it
+        last = end - 1
+
+        if last > begin:
+            if (newlines := chunk.count("\n", begin, last)) > 0:
+                self._line += newlines
+                self._column = last - chunk.rindex("\n", begin, last)
+            else:
+                self._column += last - begin
+
+        self._char = chunk[last]
+        self._index = end
+        self.read_next_char()
+
     # endregion
@@ -0,0 +1,60 @@
+"""
+Character classes of lexer as bit flags.
+Classes of first 256 code points are precomputed, other characters are
+classified with Unicode string methods.
+"""
+
+WHITESPACE = 1
+IDENTIFIER_START = 2
+IDENTIFIER = 4
+DECIMAL = 8
+
+# Character which may appear in string literal without escaping
+STRING = 16
+
+# Character which does not end comment
+COMMENT = 32
+
+
+def classify(char: str) -> int:
+    """
+    Computes classes of character using Unicode properties
+    :param char: single character
+    :return: bit flags of classes
+    """
+    classes = 0
+
+    if char.isspace():
+        classes |= WHITESPACE
+
+    if char.isalpha() or char == "_":
+        classes |= IDENTIFIER_START
+
+    if char.isalnum() or char == "_":
+        classes |= IDENTIFIER
+
+    if char.isdecimal():
+        classes |= DECIMAL
+
+    if char != "\"" and char != "\\":
+        classes |= STRING
+
+    if char != "\n":
+        classes |= COMMENT
+
+    return classes
+
+
+TABLE = tuple(classify(chr(code)) for code in range(256))
+
+
+def char_class(char: str) -> int:
+    """
+    Classes of character, looked up in table when possible
+    :param char: single character
+    :return: bit flags of classes
+    """
+    if char < "\u0100":
+        return TABLE[ord(char)]
+
+    return classify(char)
@@ -0,0 +1,31 @@
+class Span:
+    """
+    Characters of source text between begin and end.
+    Text is sliced only when span is converted to string.
+    """
+
+    __slots__ = ("source", "begin", "end")
+
+    # region Dunder Methods
+
+    def __init__(self, source: str, begin: int, end: int):
+        """
+        Creates new span
+        :param source: text containing span
+        :param begin: index of first character
+        :param end: index after last character
+        """
+        self.source = source
+        self.begin = begin
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.end - self.begin
+
+    def __str__(self) -> str:
+        return self.source[self.begin:self.end]
+
+    def __repr__(self) -> str:
+        return f"Span({str(self)!r})"
+
+    # endregion
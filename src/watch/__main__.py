@@ -0,0 +1,28 @@
+"""
+Watches source tree and recompiles changed files.
+
+Usage: python -m src.watch [root] [--interval SECONDS] [--cycles N]
+"""
+import argparse
+import sys
+
+from src.watch.watcher import Watcher
+
+
+def main(arguments: list[str]) -> None:
+    parser = argparse.ArgumentParser(prog="src.watch")
+    parser.add_argument("root", nargs="?", default=".")
+    parser.add_argument("--interval", type=float, default=0.5,
+                        help="seconds between polls")
+    parser.add_argument("--cycles", type=int,
+                        help="number of polls, unlimited if omitted")
+    options = parser.parse_args(arguments)
+
+    try:
+        Watcher(options.root).watch(options.interval, options.cycles)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,310 @@
+import os
+import time
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from typing import Optional
+
+from src.common.position import Position
+from src.lexer.errors import LexerException, error_position
+from src.lexer.lexer import Lexer
+from src.lexer.token import Token
+from src.lexer.token_kind import TokenKind
+from src.parser.ast.module import Module
+from src.parser.errors import ParserException
+from src.parser.parser import Parser
+from src.semantic.errors import SemanticException
+from src.semantic.resolver import Resolver
+from src.semantic.type_checker import TypeCache, TypeChecker
+from src.utils.buffer import StreamBuffer
+
+EXTENSION = ".fhll"
+
+
+class InternalError(Exception):
+    """
+    Unexpected failure of compiler on file, reported as its diagnostic
+    """
+
+    def __init__(self, exception: Exception):
+        super().__init__(exception)
+        self.message = f"Internal error: {type(exception).__name__}: " \
+                       f"{exception}"
+        self.position = Position(1, 1)
+
+
+type Diagnostic = LexerException | ParserException | SemanticException \
+    | InternalError
+
+
+class _TokenReplay:
+    """
+    Lexer replaying tokens lexed beforehand, so lexing and parsing are
+    timed separately
+    """
+
+    def __init__(self, tokens: list[Token], lexer: Lexer):
+        self._tokens = tokens
+        self._index = 0
+        self.symbols = lexer.symbols
+
+    def get_next_token(self) -> Token:
+        # Last token is EOF, it is repeated as by lexer
+        token = self._tokens[self._index]
+        self._index = min(self._index + 1, len(self._tokens) - 1)
+        return token
+
+
+@dataclass
+class WatchedFile:
+    """
+    Cached compilation of one source file, module is None if compiler
+    failed on first version of file
+    """
+    path: str
+    stat: tuple[int, int]
+    digest: bytes
+    module: Optional[Module]
+    diagnostics: list[Diagnostic]
+
+
+@dataclass
+class CycleTimings:
+    """
+    Seconds spent in stages of one cycle
+    """
+    scan: float = 0
+    read: float = 0
+    lex: float = 0
+    parse: float = 0
+    check: float = 0
+
+    @property
+    def total(self) -> float:
+        return self.scan + self.read + self.lex + self.parse + self.check
+
+
+@dataclass
+class CycleReport:
+    """
+    Files affected by one cycle, paths are relative to watched root
+    """
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    timings: CycleTimings = field(default_factory=CycleTimings)
+
+    @property
+    def compiled(self) -> list[str]:
+        return self.added + self.changed
+
+    @property
+    def modified(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+class Watcher:
+    """
+    Polls source tree and recompiles files whose content changed.
+    Files with unchanged size and modification time are not read at all,
+    others are hashed and compiled again only if their hash changed.
+    Type checking results of unchanged functions are reused through type
+    cache shared by all files.
+    """
+
+    # region Dunder Methods
+
+    def __init__(self, root: str, extension: str = EXTENSION):
+        self._root = root
+        self._extension = extension
+        self._files: dict[str, WatchedFile] = {}
+        self._cache = TypeCache()
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def files(self) -> dict[str, WatchedFile]:
+        """
+        Compiled files by path relative to root
+        :return: watched files
+        """
+        return self._files
+
+    @property
+    def cache(self) -> TypeCache:
+        return self._cache
+
+    # endregion
+
+    # region Methods
+
+    def cycle(self) -> CycleReport:
+        """
+        Detects changes since last cycle and compiles changed files
+        :return: report of cycle
+        """
+        report = CycleReport()
+        timings = report.timings
+
+        start = time.perf_counter()
+        found = self._scan()
+        timings.scan = time.perf_counter() - start
+
+        for path in sorted(self._files.keys() - found.keys()):
+            del self._files[path]
+            report.removed.append(path)
+
+        for path, stat in sorted(found.items()):
+            cached = self._files.get(path)
+            if cached is not None and cached.stat == stat:
+                report.unchanged += 1
+                continue
+
+            start = time.perf_counter()
+            try:
+                with open(os.path.join(self._root, path), "rb") as file:
+                    content = file.read()
+            except OSError:
+                # Removed between scan and read, noticed in next cycle
+                continue
+            digest = blake2b(content, digest_size=16).digest()
+            timings.read += time.perf_counter() - start
+
+            # Touched file keeps its compilation
+            if cached is not None and cached.digest == digest:
+                cached.stat = stat
+                report.unchanged += 1
+                continue
+
+            try:
+                module, diagnostics = self._compile(content, timings)
+            except Exception as exception:
+                # One file must not end watching, previous module is kept
+                module = cached.module if cached is not None else None
+                diagnostics = [InternalError(exception)]
+
+            self._files[path] = WatchedFile(path, stat, digest, module,
+                                            diagnostics)
+            (report.added if cached is None else report.changed).append(path)
+
+        return report
+
+    def watch(self, interval: float = 0.5,
+              cycles: Optional[int] = None) -> None:
+        """
+        Runs cycles until interrupted, prints report of each cycle which
+        found changes
+        :param interval: seconds between cycles
+        :param cycles: number of cycles to run, unlimited if None
+        """
+        count = 0
+
+        while cycles is None or count < cycles:
+            report = self.cycle()
+            if count == 0 or report.modified:
+                print(self.format(report), flush=True)
+
+            count += 1
+            if cycles is None or count < cycles:
+                time.sleep(interval)
+
+    def format(self, report: CycleReport) -> str:
+        """
+        Human readable report with diagnostics of compiled files
+        :param report: report of cycle
+        :return: report text
+        """
+        timings = report.timings
+        errors = sum(len(watched.diagnostics)
+                     for watched in self._files.values())
+        lines = [
+            f"[{time.strftime('%H:%M:%S')}] "
+            f"{len(report.added)} added, {len(report.changed)} changed, "
+            f"{len(report.removed)} removed, {report.unchanged} unchanged, "
+            f"{errors} errors",
+            f"  scan {timings.scan * 1000:.1f} ms, "
+            f"read {timings.read * 1000:.1f} ms, "
+            f"lex {timings.lex * 1000:.1f} ms, "
+            f"parse {timings.parse * 1000:.1f} ms, "
+            f"check {timings.check * 1000:.1f} ms, "
+            f"total {timings.total * 1000:.1f} ms"
+        ]
+
+        for path in report.compiled:
+            for diagnostic in self._files[path].diagnostics:
+                position = error_position(diagnostic)
+                lines.append(f"  {path}:{position.line}:{position.column}: "
+                             f"{diagnostic.message}")
+
+        return "\n".join(lines)
+
+    # endregion
+
+    # region Private Methods
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        found = {}
+        directories = [self._root]
+
+        while directories:
+            directory = directories.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+
+                if entry.is_dir():
+                    directories.append(entry.path)
+                elif entry.name.endswith(self._extension):
+                    stat = entry.stat()
+                    path = os.path.relpath(entry.path, self._root)
+                    found[path] = (stat.st_mtime_ns, stat.st_size)
+
+        return found
+
+    def _compile(self, content: bytes, timings: CycleTimings
+                 ) -> tuple[Module, list[Diagnostic]]:
+        diagnostics: list[Diagnostic] = []
+
+        start = time.perf_counter()
+        lexer = Lexer(StreamBuffer.from_str(content.decode(errors="replace")),
+                      skip_comments=True)
+        tokens = []
+        while True:
+            try:
+                tokens.append(token := lexer.get_next_token())
+            except LexerException as exception:
+                # Lexer advances on error, lexing goes on from next char
+                diagnostics.append(exception)
+                continue
+
+            if token.kind == TokenKind.EOF:
+                break
+        timings.lex += time.perf_counter() - start
+
+        start = time.perf_counter()
+        parser = Parser(_TokenReplay(tokens, lexer), recover=True)
+        module = parser.parse()
+        diagnostics.extend(parser.diagnostics)
+        timings.parse += time.perf_counter() - start
+
+        if diagnostics:
+            return module, diagnostics
+
+        start = time.perf_counter()
+        try:
+            resolution = Resolver().resolve(module)
+            TypeChecker(self._cache).check(module, resolution)
+        except SemanticException as exception:
+            diagnostics.append(exception)
+        timings.check += time.perf_counter() - start
+
+        return module, diagnostics
+
+    # endregion
@@ -0,0 +1,53 @@
+from src.common.symbols import SymbolTable
+from src.parser.ast.traversal import walk
+from src.parser.ast.name import Name
+from tests.lexer.test_lexer import create_lexer
+from tests.parser.test_parser import create_parser
+
+
+def test_intern():
+    symbols = SymbolTable()
+
+    first = symbols.intern("value")
+    second = symbols.intern("other")
+
+    assert symbols.intern("value") == first
+    assert first != second
+    assert symbols.name(second) == "other"
+    assert len(symbols) == 2
+
+
+def test_lookup():
+    symbols = SymbolTable()
+    symbols.intern("value")
+
+    assert symbols.lookup("value") == 0
+    assert symbols.lookup("missing") is None
+    assert "missing" not in symbols
+    assert len(symbols) == 1
+
+
+def test_lexer_interns_identifiers():
+    lexer = create_lexer("alpha beta alpha")
+    tokens = [lexer.get_next_token() for _ in range(3)]
+
+    assert tokens[0].symbol == tokens[2].symbol
+    assert tokens[0].symbol != tokens[1].symbol
+    assert tokens[0].value is tokens[2].value
+    assert lexer.symbols.name(tokens[1].symbol) == "beta"
+
+
+def test_names_share_symbols():
+    module = create_parser("""
+    fn square(x: i64) -> i64 {
+        return x * x;
+    }
+    """).parse()
+
+    names = [node for node in walk(module) if isinstance(node, Name)
+             and node.identifier == "x"]
+
+    assert len(names) == 3
+    assert len({name.symbol for name in names}) == 1
+    assert module.symbols.name(names[0].symbol) == "x"
+    assert "i64" in module.symbols
@@ -0,0 +1,169 @@
+import pytest
+
+from src.flags import Flags
+from src.interpreter.budget import CHECK_INTERVAL
+from src.interpreter.errors import BudgetExceededPanic
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.streams import MemorySink
+from tests.parser.test_parser import create_parser
+
+
+def create_interpreter(program: str, flags: Flags) -> Interpreter:
+    module = create_parser(program).parse()
+    return Interpreter(module, flags, MemorySink())
+
+
+LOOP = """
+fn main() -> i64 {
+    mut let i = 0;
+    while (i < 100) {
+        i = i + 1;
+    }
+    return i;
+}
+"""
+
+INFINITE_LOOP = """
+fn main() {
+    mut let i = 0;
+    while (true) {
+        i = i + 1;
+    }
+}
+"""
+
+RECURSION = """
+fn count(n: i64) -> i64 {
+    if (n == 0) {
+        return 0;
+    }
+    return 1 + count(n - 1);
+}
+
+fn main() -> i64 {
+    return count(50);
+}
+"""
+
+
+def test_budget__unlimited():
+    interpreter = create_interpreter(LOOP, Flags())
+
+    assert interpreter.run() == 100
+    assert not interpreter.budget.limited
+    assert interpreter.budget.steps == 101
+
+
+def test_budget__steps_within_limit():
+    # Entry call and 100 back-edges
+    interpreter = create_interpreter(LOOP, Flags(maximum_steps=101))
+
+    assert interpreter.run() == 100
+
+
+def test_budget__steps_exceeded_in_loop():
+    interpreter = create_interpreter(LOOP, Flags(maximum_steps=50))
+
+    with pytest.raises(BudgetExceededPanic) as info:
+        interpreter.run()
+
+    assert info.value.resource == "steps"
+    assert info.value.limit == 50
+    assert info.value.used == 51
+    assert info.value.location.begin.line == 4
+
+
+def test_budget__steps_exceeded_in_calls():
+    interpreter = create_interpreter(RECURSION, Flags(maximum_steps=10))
+
+    with pytest.raises(BudgetExceededPanic) as info:
+        interpreter.run()
+
+    assert info.value.resource == "steps"
+    assert info.value.location is not None
+
+
+def test_budget__time_exceeded():
+    interpreter = create_interpreter(INFINITE_LOOP,
+                                     Flags(maximum_time=0.05))
+
+    with pytest.raises(BudgetExceededPanic) as info:
+        interpreter.run()
+
+    assert info.value.resource == "time"
+    assert info.value.used >= 0.05
+    assert info.value.location.begin.line == 4
+
+
+def test_budget__time_checked_at_interval():
+    interpreter = create_interpreter(INFINITE_LOOP,
+                                     Flags(maximum_time=0.0))
+
+    with pytest.raises(BudgetExceededPanic):
+        interpreter.run()
+
+    assert interpreter.budget.steps == CHECK_INTERVAL
+
+
+def test_budget__allocated_strings():
+    interpreter = create_interpreter("""
+    fn main() {
+        mut let text = "";
+        while (true) {
+            text = text + "0123456789";
+        }
+    }
+    """, Flags(maximum_allocated_bytes=100_000))
+
+    with pytest.raises(BudgetExceededPanic) as info:
+        interpreter.run()
+
+    assert info.value.resource == "allocated bytes"
+    assert info.value.used > 100_000
+
+
+def test_budget__allocated_between_checkpoints():
+    interpreter = create_interpreter("""
+    fn main() {
+        mut let text = "0123456789";
+        mut let i = 0;
+        while (i < 20) {
+            text = text + text;
+            i = i + 1;
+        }
+    }
+    """, Flags(maximum_allocated_bytes=1_000_000))
+
+    with pytest.raises(BudgetExceededPanic) as info:
+        interpreter.run()
+
+    assert info.value.resource == "allocated bytes"
+    assert interpreter.budget.steps < CHECK_INTERVAL
+    assert interpreter.budget.allocated < 2_000_000
+
+
+def test_budget__allocated_structs():
+    interpreter = create_interpreter("""
+    struct Point {
+        x: i64;
+        y: i64;
+    }
+
+    fn main() {
+        while (true) {
+            let point = Point { x = 1; y = 2; };
+        }
+    }
+    """, Flags(maximum_allocated_bytes=10_000))
+
+    with pytest.raises(BudgetExceededPanic) as info:
+        interpreter.run()
+
+    assert info.value.resource == "allocated bytes"
+    assert interpreter.budget.allocated > 10_000
+
+
+def test_budget__message():
+    panic = BudgetExceededPanic("steps", 10, 11)
+
+    assert str(panic.message) == "Execution budget exceeded: steps (11 > 10)"
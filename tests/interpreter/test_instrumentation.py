@@ -0,0 +1,80 @@
+import io
+
+from src.interpreter.instrumentation import InstrumentedInterpreter, \
+    Instrumentation
+from src.parser.ast.expressions.binary_operation import BinaryOperation
+from src.parser.ast.module import Module
+from src.parser.ast.statements.fn_call import FnCall
+from src.parser.ast.statements.while_statement import WhileStatement
+from tests.parser.test_parser import create_parser
+
+PROGRAM = """
+fn twice(x: i32) -> i32 {
+    return x + x;
+}
+
+fn main() {
+    mut let i = 0;
+    while (i < 10) {
+        i = i + 1;
+    }
+    println(twice(i) as str);
+}
+"""
+
+
+def run(instrumentation: Instrumentation = None
+        ) -> tuple[Module, InstrumentedInterpreter, str]:
+    module = create_parser(PROGRAM).parse()
+    stdout = io.StringIO()
+    interpreter = InstrumentedInterpreter(module, stdout=stdout,
+                                          instrumentation=instrumentation)
+    interpreter.run()
+
+    return module, interpreter, stdout.getvalue()
+
+
+def test_instrumentation__counts():
+    module, interpreter, output = run()
+    declaration, loop, call = module.function_declarations[1].block.body
+    instrumentation = interpreter.instrumentation
+
+    assert output == "20\n"
+    assert instrumentation.statistics(declaration).count == 1
+    assert instrumentation.statistics(loop).count == 1
+    assert instrumentation.statistics(loop.condition).count == 11
+    assert instrumentation.statistics(loop.block.body[0]).count == 10
+    assert instrumentation.statistics(call).count == 1
+
+
+def test_instrumentation__cumulative_time():
+    module, interpreter, _ = run()
+    loop = module.function_declarations[1].block.body[1]
+    statistics = interpreter.instrumentation.statistics(loop)
+    body = interpreter.instrumentation.statistics(loop.block.body[0])
+
+    assert statistics.time >= body.time > 0
+
+
+def test_instrumentation__hottest():
+    _, interpreter, _ = run()
+
+    (hottest,) = interpreter.instrumentation.hottest(WhileStatement, 1)
+
+    assert isinstance(hottest.node, WhileStatement)
+    assert "WhileStatement 8:5" in interpreter.instrumentation.report()
+
+
+def test_instrumentation__hooks():
+    instrumentation = Instrumentation()
+    entered = []
+    exited = []
+    instrumentation.on_enter(BinaryOperation, entered.append)
+    instrumentation.on_exit(FnCall, lambda node, elapsed: exited.append(
+        (node.name.identifier, elapsed >= 0)
+    ))
+
+    run(instrumentation)
+
+    assert len(entered) == 10 + 1
+    assert exited == [("twice", True), ("println", True)]
@@ -0,0 +1,396 @@
+import io
+
+import pytest
+
+from src.flags import Flags
+from src.interface.isink import ISink
+from src.interpreter.errors import PanicException, IntegerOverflowPanic, \
+    DivisionByZeroPanic, InvalidCastPanic, EntryPointException, \
+    UninitializedVariablePanic
+from src.interpreter.interpreter import Interpreter
+from tests.parser.test_parser import create_parser
+
+
+# region Utilities
+
+def run(program: str, flags: Flags = None, stdin: str = "",
+        stdout: ISink = None) -> str:
+    output = io.StringIO()
+    module = create_parser(program).parse()
+    Interpreter(module, flags, stdout if stdout is not None else output,
+                io.StringIO(stdin)).run()
+
+    return output.getvalue()
+
+
+# endregion
+
+# region Statements
+
+@pytest.mark.parametrize("specialised", [True, False])
+def test_interpreter__while_loop(specialised: bool):
+    output = run("""
+    fn main() {
+        mut let i = 0;
+        mut let sum: i64 = 0;
+        while (i < 10) {
+            sum = sum + i * i;
+            i = i + 1;
+        }
+        println(sum as str);
+    }
+    """, Flags(specialised_operators=specialised))
+
+    assert output == "285\n"
+
+
+def test_interpreter__recursion():
+    output = run("""
+    fn factorial(n: i64) -> i64 {
+        if (n < 2) {
+            return 1;
+        }
+        return n * factorial(n - 1);
+    }
+
+    fn main() {
+        println(factorial(20) as str);
+    }
+    """)
+
+    assert output == "2432902008176640000\n"
+
+
+def test_interpreter__if_else():
+    output = run("""
+    fn sign(x: i32) -> str {
+        if (x < 0) {
+            return "negative";
+        } else {
+            if (x == 0) {
+                return "zero";
+            }
+        }
+        return "positive";
+    }
+
+    fn main() {
+        println(sign(-3));
+        println(sign(0));
+        println(sign(3));
+    }
+    """)
+
+    assert output == "negative\nzero\npositive\n"
+
+
+def test_interpreter__short_circuit():
+    output = run("""
+    fn side() -> bool {
+        println("called");
+        return true;
+    }
+
+    fn main() {
+        let a = false && side();
+        let b = true || side();
+        println((a || b) as str);
+    }
+    """)
+
+    assert output == "true\n"
+
+
+def test_interpreter__user_operator():
+    output = run("""
+    fn __mul(x: str, y: i32) -> str {
+        mut let result = "";
+        mut let i = 0;
+        while (i < y) {
+            result = result + x;
+            i = i + 1;
+        }
+        return result;
+    }
+
+    fn main() {
+        println("ab" * 3);
+    }
+    """)
+
+    assert output == "ababab\n"
+
+
+def test_interpreter__read():
+    output = run("""
+    fn main() {
+        let a = readi32();
+        let b = readi32();
+        println((a + b) as str);
+    }
+    """, stdin="20\n22\n")
+
+    assert output == "42\n"
+
+
+# endregion
+
+# region Structs
+
+def test_interpreter__struct_value_semantics():
+    output = run("""
+    struct Point { x: i32; y: i32; }
+
+    fn move(p: Point) -> Point {
+        mut let moved = p;
+        moved.x = moved.x + 10;
+        return moved;
+    }
+
+    fn main() {
+        mut let a = Point { x = 1; y = 2; };
+        let b = a;
+        let c = move(a);
+        a.y = 5;
+        println(a.x as str + " " + a.y as str);
+        println(b.x as str + " " + b.y as str);
+        println(c.x as str + " " + c.y as str);
+    }
+    """)
+
+    assert output == "1 5\n1 2\n11 2\n"
+
+
+@pytest.mark.parametrize("copy_on_write", [True, False])
+def test_interpreter__nested_struct_value_semantics(copy_on_write: bool):
+    output = run("""
+    struct Inner { value: i32; }
+    struct Outer { inner: Inner; other: Inner; }
+
+    fn bump(mut o: Outer, n: i32) -> Outer {
+        if (n == 0) {
+            return o;
+        }
+        o.inner.value = o.inner.value + 1;
+        return bump(o, n - 1);
+    }
+
+    fn main() {
+        mut let a = Outer { };
+        let b = bump(a, 3);
+        a.other.value = 7;
+        let c = a;
+        a.other.value = 8;
+        println(a.inner.value as str + " " + a.other.value as str);
+        println(b.inner.value as str + " " + b.other.value as str);
+        println(c.inner.value as str + " " + c.other.value as str);
+    }
+    """, Flags(copy_on_write=copy_on_write))
+
+    assert output == "0 8\n3 0\n0 7\n"
+
+
+def test_interpreter__nested_struct_defaults():
+    output = run("""
+    struct Inner { value: f32; }
+    struct Outer { inner: Inner; name: str; }
+
+    fn main() {
+        mut let o = Outer { name = "o"; };
+        o.inner.value = 1.5;
+        println(o.name + " " + o.inner.value as str);
+    }
+    """)
+
+    assert output == "o 1.5\n"
+
+
+# endregion
+
+# region Enums
+
+ENTITY = """
+enum Entity {
+    struct Player { name: str; };
+    struct Animal { legs: i32; };
+}
+"""
+
+
+def test_interpreter__match():
+    output = run(ENTITY + """
+    fn describe(e: Entity) -> str {
+        match (e) {
+            Entity::Animal a => {
+                return "animal with " + a.legs as str + " legs";
+            };
+            Entity::Player p => {
+                return "player " + p.name;
+            };
+        }
+        return "unknown";
+    }
+
+    fn main() {
+        println(describe(Entity::Player { name = "Bob"; }));
+        println(describe(Entity::Animal { legs = 4; }));
+    }
+    """)
+
+    assert output == "player Bob\nanimal with 4 legs\n"
+
+
+def test_interpreter__is_and_cast():
+    output = run(ENTITY + """
+    fn main() {
+        let e: Entity = Entity::Player { name = "Bob"; };
+        println((e is Entity::Player) as str);
+        println((e is Entity::Animal) as str);
+        let p = e as Entity::Player;
+        println(p.name);
+    }
+    """)
+
+    assert output == "true\nfalse\nBob\n"
+
+
+def test_interpreter__invalid_variant_cast():
+    with pytest.raises(InvalidCastPanic):
+        run(ENTITY + """
+        fn main() {
+            let e: Entity = Entity::Player { name = "Bob"; };
+            let a = e as Entity::Animal;
+        }
+        """)
+
+
+def test_interpreter__variant_dispatch():
+    output = run(ENTITY + """
+    fn describe(p: Entity::Player) -> str { return "player"; }
+    fn describe(a: Entity::Animal) -> str { return "animal"; }
+
+    fn main() {
+        mut let e: Entity = Entity::Player { name = "Bob"; };
+        println(describe(e));
+        e = Entity::Animal { legs = 2; };
+        println(describe(e));
+    }
+    """)
+
+    assert output == "player\nanimal\n"
+
+
+# endregion
+
+# region Panics
+
+@pytest.mark.parametrize("specialised", [True, False])
+def test_interpreter__overflow_panics(specialised: bool):
+    with pytest.raises(IntegerOverflowPanic) as info:
+        run("""
+        fn main() {
+            let a: i16 = 30000;
+            let b: i16 = a + a;
+        }
+        """, Flags(specialised_operators=specialised))
+
+    assert info.value.location.begin.line == 4
+
+
+def test_interpreter__division_by_zero():
+    with pytest.raises(DivisionByZeroPanic):
+        run("""
+        fn main() {
+            let zero = 0;
+            let a = 1 / zero;
+        }
+        """)
+
+
+def test_interpreter__panic_location():
+    with pytest.raises(PanicException) as info:
+        run("""
+        fn main() {
+            println("before");
+            panic("failed");
+        }
+        """)
+
+    assert info.value.message == "failed"
+    assert info.value.location.begin.line == 4
+
+
+def test_interpreter__missing_entry_point():
+    with pytest.raises(EntryPointException):
+        run("fn helper() { }")
+
+
+@pytest.mark.parametrize("statement", [
+    "if (h.entity is Entity::Player) { }",
+    "match (h.entity) { Entity::Player p => { }; }",
+    "let p = h.entity as Entity::Player;"
+])
+def test_interpreter__uninitialized_enum_field(statement: str):
+    with pytest.raises(UninitializedVariablePanic) as info:
+        run(ENTITY + """
+        struct Holder { entity: Entity; }
+
+        fn main() {
+            let h = Holder { };
+            """ + statement + """
+        }
+        """)
+
+    assert info.value.name == "h.entity"
+
+
+# endregion
+
+# region Nested Enums
+
+NESTED = """
+enum Entity {
+    struct Player { };
+    enum Animal {
+        struct Dog { };
+        struct Cat { };
+    };
+}
+
+fn describe(e: Entity) -> str {
+    match (e) {
+        Entity::Animal::Cat c => { return "cat"; };
+        Entity::Animal a => { return "animal"; };
+        Entity e => { return "entity"; };
+    }
+    return "none";
+}
+"""
+
+
+def test_interpreter__match_nested_variants():
+    output = run(NESTED + """
+    fn main() {
+        println(describe(Entity::Player { }));
+        println(describe(Entity::Animal::Dog { }));
+        println(describe(Entity::Animal::Cat { }));
+    }
+    """)
+
+    assert output == "entity\nanimal\ncat\n"
+
+
+def test_interpreter__is_nested_variant():
+    output = run(NESTED + """
+    fn main() {
+        let d: Entity = Entity::Animal::Dog { };
+        println((d is Entity::Animal) as str);
+        println((d is Entity::Animal::Cat) as str);
+        println((d is Entity) as str);
+        let a = d as Entity::Animal;
+    }
+    """)
+
+    assert output == "true\nfalse\ntrue\n"
+
+# endregion
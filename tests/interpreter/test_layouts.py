@@ -0,0 +1,99 @@
+from src.interpreter.layouts import Layouts
+from src.interpreter.values import StructValue
+from src.semantic.analyzer import analyze
+from src.semantic.types import BuiltinType, UserType
+from tests.parser.test_parser import create_parser
+
+PROGRAM = """
+struct Inner { value: f32; flag: bool; }
+struct Outer { name: str; inner: Inner; count: i32; }
+enum Shape {
+    struct Circle { radius: f32; };
+}
+struct Holder { shape: Shape; }
+"""
+
+INNER = UserType(("Inner",))
+OUTER = UserType(("Outer",))
+
+
+def create_layouts(program: str = PROGRAM) -> Layouts:
+    module = create_parser(program).parse()
+    return Layouts(analyze(module).registry)
+
+
+def test_layout__field_indices():
+    layout = create_layouts().layout(OUTER)
+
+    assert layout.names == ("name", "inner", "count")
+    assert layout.index("count") == 2
+    assert layout.types == (BuiltinType.Str, INNER, BuiltinType.I32)
+    assert layout.nested == (1,)
+
+
+def test_layout__memoized():
+    layouts = create_layouts()
+
+    assert layouts.layout(OUTER) is layouts.layout(OUTER)
+    assert layouts.layout(OUTER).template[1].layout is \
+        layouts.layout(INNER)
+
+
+def test_layout__default_instance():
+    instance = create_layouts().layout(OUTER).instance()
+
+    assert instance.values[0] == ""
+    assert instance.values[2] == 0
+    assert instance.field("inner").values == [0.0, False]
+
+
+def test_layout__instance_shares_nested_template():
+    layout = create_layouts().layout(OUTER)
+
+    first = layout.instance()
+    second = layout.instance()
+
+    assert first.values is not second.values
+    assert first.values[1] is second.values[1]
+    assert first.values[1].shared
+    assert not first.shared
+
+
+def test_layout__enum_field_default():
+    layouts = create_layouts()
+
+    instance = layouts.layout(UserType(("Holder",))).instance()
+
+    assert instance.values == [None]
+    assert layouts.default(UserType(("Shape",))) is None
+
+
+def test_struct_value__copy_nested():
+    layout = create_layouts().layout(OUTER)
+    original = layout.instance()
+
+    copied = original.copy()
+    copied.values[1].values[1] = True
+
+    assert isinstance(copied, StructValue)
+    assert original.values[1].values[1] is False
+    assert copied != original
+
+
+def test_struct_value__share():
+    instance = create_layouts().layout(INNER).instance()
+
+    assert instance.share() is instance
+    assert instance.shared
+
+
+def test_struct_value__clone():
+    original = create_layouts().layout(OUTER).instance()
+    original.values[1] = original.values[1].clone()
+
+    cloned = original.clone()
+
+    assert not cloned.shared
+    assert cloned.values is not original.values
+    assert cloned.values[1] is original.values[1]
+    assert original.values[1].shared
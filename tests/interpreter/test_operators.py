@@ -0,0 +1,111 @@
+import pytest
+
+from src.interpreter.errors import IntegerOverflowPanic, DivisionByZeroPanic
+from src.interpreter.operators import apply, convert, handlers, \
+    specialised_handler, wrap_integer
+from src.semantic.signatures import Signature
+from src.semantic.types import BuiltinType, numeric_types
+
+I16 = BuiltinType.I16
+I32 = BuiltinType.I32
+U16 = BuiltinType.U16
+F32 = BuiltinType.F32
+
+
+# region Conversions
+
+@pytest.mark.parametrize("value, source, target, expected", [
+    (70000, I32, I16, 4464),
+    (-1, I32, U16, 65535),
+    (3.9, F32, I32, 3),
+    (-3.9, F32, I32, -3),
+    (2, I32, F32, 2.0),
+    (0, I32, BuiltinType.Bool, False),
+    ("", BuiltinType.Str, BuiltinType.Bool, False),
+    (True, BuiltinType.Bool, BuiltinType.Str, "true"),
+    (1.5, F32, BuiltinType.Str, "1.5"),
+])
+def test_convert(value, source, target, expected):
+    assert convert(value, source, target) == expected
+
+
+def test_wrap_integer():
+    assert wrap_integer(32768, I16) == -32768
+    assert wrap_integer(-32769, I16) == 32767
+
+
+# endregion
+
+# region Generic Operations
+
+def test_apply__division_truncates():
+    signature = Signature("__div", (I32, I32), I32)
+
+    assert apply(signature, (-7, 2)) == -3
+    assert apply(signature, (7, -2)) == -3
+
+
+def test_apply__division_by_zero():
+    with pytest.raises(DivisionByZeroPanic):
+        apply(Signature("__div", (I32, I32), I32), (1, 0))
+
+
+def test_apply__overflow():
+    with pytest.raises(IntegerOverflowPanic):
+        apply(Signature("__mul", (I16, I16), I16), (300, 300))
+
+
+# endregion
+
+# region Specialised Operations
+
+def test_specialised_handler__converts_operands():
+    signature = Signature("__add", (I32, I32), I32)
+    handler = specialised_handler(signature, (I32, F32))
+
+    assert handler(1, 2.7) == 3
+
+
+def test_specialised_handler__rejects_user_signature():
+    signature = Signature("__add", (I32, I32), I32, declaration=object())
+
+    assert specialised_handler(signature, (I32, I32)) is None
+
+
+def test_specialised_handler__rejects_other_signature():
+    signature = Signature("__add", (F32, F32), F32)
+
+    assert specialised_handler(signature, (I32, I32)) is None
+
+
+def test_specialised_handler__overflow():
+    handler = specialised_handler(Signature("__neg", (I16,), I16), (I16,))
+
+    with pytest.raises(IntegerOverflowPanic):
+        handler(-32768)
+
+
+@pytest.mark.parametrize("name", ["__add", "__sub", "__mul", "__div",
+                                  "__lt", "__gt", "__eq", "__ne"])
+def test_specialised_handler__matches_generic(name: str):
+    samples = {typ: (-3, 7) if typ != BuiltinType.F32 else (-2.5, 4.0)
+               for typ in numeric_types}
+
+    for left in numeric_types:
+        for right in numeric_types:
+            signature, handler = handlers[(name, left, right)]
+            for a in samples[left]:
+                for b in samples[right]:
+                    arguments = (convert(a, left, signature.parameters[0]),
+                                 convert(b, right, signature.parameters[1]))
+
+                    try:
+                        expected = apply(signature, arguments)
+                    except IntegerOverflowPanic:
+                        with pytest.raises(IntegerOverflowPanic):
+                            handler(a, b)
+                        continue
+
+                    assert handler(a, b) == expected
+
+# endregion
@@ -0,0 +1,100 @@
+import io
+
+import pytest
+
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.profiler import Profiler, Profile, ProfileFrame, Sample
+from tests.parser.test_parser import create_parser
+
+MAIN = ProfileFrame("main()", 10, 5)
+LOOP = ProfileFrame("loop(i32)", 3, 9)
+LEAF = ProfileFrame("leaf()", 7, 5)
+
+
+def create_profile() -> Profile:
+    return Profile([
+        Sample((MAIN, LOOP), 0.3, 0.2),
+        Sample((MAIN, LOOP), 0.3, 0.2),
+        Sample((MAIN, LOOP, LEAF), 0.2, 0.1),
+        Sample((MAIN,), 0.2, 0.1),
+    ])
+
+
+def test_profile__functions():
+    functions = create_profile().functions()
+
+    assert list(functions) == ["loop(i32)", "leaf()", "main()"]
+    assert functions["loop(i32)"] == pytest.approx((0.6, 0.8))
+    assert functions["main()"][1] == pytest.approx(1.0)
+
+
+def test_profile__cpu_time():
+    profile = create_profile()
+
+    assert profile.total(cpu=True) == pytest.approx(0.6)
+    assert profile.functions(cpu=True)["leaf()"] == (0.1, 0.1)
+
+
+def test_profile__statements():
+    statements = create_profile().statements()
+
+    assert list(statements)[0] == LOOP
+    assert statements[LOOP] == pytest.approx(0.6)
+
+
+def test_profile__flat():
+    report = create_profile().flat()
+
+    assert "loop(i32)" in report
+    assert "loop(i32) 3:9" in report
+
+
+def test_profile__tree():
+    lines = create_profile().tree().splitlines()
+
+    assert lines[0].endswith("main()")
+    assert lines[1].endswith("  loop(i32)")
+    assert lines[2].endswith("    leaf()")
+
+
+def test_profile__collapsed():
+    collapsed = create_profile().collapsed().splitlines()
+
+    assert collapsed == [
+        "main() 1",
+        "main();loop(i32) 2",
+        "main();loop(i32);leaf() 1",
+    ]
+
+
+def test_profile__collapsed_lines():
+    collapsed = create_profile().collapsed(lines=True)
+
+    assert "main() 10:5;loop(i32) 3:9 2" in collapsed
+
+
+def test_profiler__samples_interpreter():
+    program = """
+    fn spin(n: i32) -> i32 {
+        mut let i = 0;
+        while (i < n) {
+            i = i + 1;
+        }
+        return i;
+    }
+
+    fn main() {
+        println(spin(30000) as str);
+    }
+    """
+    interpreter = Interpreter(create_parser(program).parse(),
+                              stdout=io.StringIO())
+    profiler = Profiler(interpreter, interval=0.001)
+
+    profiler.run()
+    samples = profiler.profile.samples
+
+    assert samples
+    assert all(sample.stack[0].function == "main()" for sample in samples)
+    assert any(sample.stack[-1].function == "spin(i32)"
+               for sample in samples)
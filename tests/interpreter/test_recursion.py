@@ -0,0 +1,105 @@
+import pytest
+
+from src.flags import Flags
+from src.interpreter.errors import RecursionDepthPanic
+from tests.interpreter.test_interpreter import run
+
+
+SUM = """
+fn sum(n: i64) -> i64 {
+    if (n == 0) {
+        return 0;
+    }
+    return n + sum(n - 1);
+}
+
+fn sum_tail(n: i64, total: i64) -> i64 {
+    if (n == 0) {
+        return total;
+    }
+    return sum_tail(n - 1, total + n);
+}
+"""
+
+
+def test_recursion__deeper_than_python_limit():
+    output = run(SUM + """
+    fn main() { println(sum(5000) as str); }
+    """)
+
+    assert output == "12502500\n"
+
+
+def test_recursion__depth_limited_by_flags():
+    with pytest.raises(RecursionDepthPanic) as info:
+        run(SUM + """
+        fn main() { println(sum(100) as str); }
+        """, Flags(maximum_recursion_depth=50))
+
+    assert info.value.location is not None
+
+
+def test_recursion__tail_calls_do_not_nest():
+    output = run(SUM + """
+    fn main() { println(sum_tail(100000, 0) as str); }
+    """, Flags(maximum_recursion_depth=10))
+
+    assert output == "5000050000\n"
+
+
+def test_recursion__converted_result_is_not_tail_call():
+    with pytest.raises(RecursionDepthPanic):
+        run("""
+        fn count(n: i32) -> i64 {
+            if (n == 0) {
+                return 0;
+            }
+            return small(n - 1);
+        }
+
+        fn small(n: i32) -> i32 {
+            return count(n) as i32;
+        }
+
+        fn main() { println(count(100) as str); }
+        """, Flags(maximum_recursion_depth=20))
+
+
+def test_recursion__mutual_tail_calls():
+    output = run("""
+    fn even(n: i32) -> bool {
+        if (n == 0) {
+            return true;
+        }
+        return odd(n - 1);
+    }
+
+    fn odd(n: i32) -> bool {
+        if (n == 0) {
+            return false;
+        }
+        return even(n - 1);
+    }
+
+    fn main() { println(even(10001) as str); }
+    """, Flags(maximum_recursion_depth=10))
+
+    assert output == "false\n"
+
+
+def test_recursion__ackermann():
+    output = run("""
+    fn ackermann(m: i32, n: i32) -> i32 {
+        if (m == 0) {
+            return n + 1;
+        }
+        if (n == 0) {
+            return ackermann(m - 1, 1);
+        }
+        return ackermann(m - 1, ackermann(m, n - 1));
+    }
+
+    fn main() { println(ackermann(2, 3) as str); }
+    """)
+
+    assert output == "9\n"
@@ -0,0 +1,89 @@
+import io
+
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.operators import apply, specialised_handler
+from src.interpreter.rope import Rope, concat, FLAT_LIMIT
+from src.semantic.signatures import Signature
+from src.semantic.types import BuiltinType
+from tests.parser.test_parser import create_parser
+
+STR = BuiltinType.Str
+LARGE = "x" * FLAT_LIMIT
+
+
+def test_concat__short_strings_stay_flat():
+    assert concat("ab", "cd") == "abcd"
+    assert type(concat("ab", "cd")) is str
+
+
+def test_concat__large_strings_build_rope():
+    result = concat(LARGE, "y")
+
+    assert isinstance(result, Rope)
+    assert len(result) == FLAT_LIMIT + 1
+    assert str(result) == LARGE + "y"
+
+
+def test_rope__append_shares_buffer():
+    first = concat(LARGE, "a")
+    second = concat(first, "b")
+    third = concat(second, "c")
+
+    assert str(third) == LARGE + "abc"
+    assert str(first) == LARGE + "a"
+    assert str(second) == LARGE + "ab"
+
+
+def test_rope__branching_appends():
+    base = concat(LARGE, "a")
+    left = concat(base, "l")
+    right = concat(base, "r")
+
+    assert str(left) == LARGE + "al"
+    assert str(right) == LARGE + "ar"
+    assert str(base) == LARGE + "a"
+
+
+def test_rope__concat_ropes():
+    left = concat(LARGE, "a")
+    right = concat(LARGE, "b")
+
+    assert str(concat(left, right)) == LARGE + "a" + LARGE + "b"
+    assert str(concat("c", left)) == "c" + LARGE + "a"
+
+
+def test_rope__equality():
+    rope = concat(LARGE, "a")
+
+    assert rope == LARGE + "a"
+    assert LARGE + "a" == rope
+    assert rope != LARGE + "b"
+    assert rope != ""
+    assert hash(rope) == hash(LARGE + "a")
+
+
+def test_operators__string_add():
+    signature = Signature("__add", (STR, STR), STR)
+    handler = specialised_handler(signature, (STR, BuiltinType.I32))
+
+    assert isinstance(apply(signature, (LARGE, "a")), Rope)
+    assert handler("x = ", 5) == "x = 5"
+
+
+def test_interpreter__builds_large_string():
+    program = """
+    fn main() {
+        mut let text = "";
+        mut let i = 0;
+        while (i < 5000) {
+            text = text + "ab";
+            i = i + 1;
+        }
+        println((text == "") as str);
+        print(text);
+    }
+    """
+    stdout = io.StringIO()
+    Interpreter(create_parser(program).parse(), stdout=stdout).run()
+
+    assert stdout.getvalue() == "false\n" + "ab" * 5000
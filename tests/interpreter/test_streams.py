@@ -0,0 +1,183 @@
+import pytest
+
+from src.interface.isink import ISink
+from src.interpreter.errors import PanicException, InvalidInputPanic
+from src.interpreter.streams import MemorySink, MemorySource, OutputBuffer, \
+    InputBuffer, StreamSource
+from tests.interpreter.test_interpreter import run
+
+
+class CountingSink(ISink):
+    def __init__(self):
+        self.writes: list[str] = []
+        self.flushes = 0
+
+    def write(self, text: str) -> None:
+        self.writes.append(text)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+class InteractiveStream:
+    """
+    Stream of terminal, only lines typed so far can be read
+    """
+
+    def __init__(self, lines: list[str]):
+        self.lines = lines
+
+    def read(self, size: int = -1) -> str:
+        raise AssertionError("read blocks until chunk is filled")
+
+    def readline(self, size: int = -1) -> str:
+        assert self.lines, "readline blocks until next line is typed"
+        return self.lines.pop(0)
+
+
+# region Output Buffer
+
+def test_output_buffer__batches_writes():
+    sink = CountingSink()
+    output = OutputBuffer(sink, threshold=100)
+
+    for _ in range(10):
+        output.write("line\n")
+
+    assert sink.writes == []
+
+    output.flush()
+
+    assert sink.writes == ["line\n" * 10]
+    assert sink.flushes == 1
+
+
+def test_output_buffer__flushes_at_threshold():
+    sink = CountingSink()
+    output = OutputBuffer(sink, threshold=8)
+
+    output.write("abcd")
+    output.write("efgh")
+    output.write("ij")
+
+    assert sink.writes == ["abcdefgh"]
+
+
+# endregion
+
+# region Input Buffer
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1024])
+def test_input_buffer__tokens(chunk_size: int):
+    buffer = InputBuffer(MemorySource("12 345\n  -6\n7"), chunk_size)
+
+    tokens = [buffer.read_token() for _ in range(5)]
+
+    assert tokens == ["12", "345", "-6", "7", None]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1024])
+def test_input_buffer__lines(chunk_size: int):
+    buffer = InputBuffer(MemorySource("first\n\nthird"), chunk_size)
+
+    lines = [buffer.read_line() for _ in range(4)]
+
+    assert lines == ["first", "", "third", None]
+
+
+def test_input_buffer__before_read():
+    calls = []
+    buffer = InputBuffer(MemorySource("1 2"), 1024,
+                         lambda: calls.append(True))
+
+    buffer.read_token()
+    buffer.read_token()
+
+    assert len(calls) == 2
+
+
+def test_input_buffer__interactive_stream():
+    stream = InteractiveStream(["12 3\n", "4\n"])
+    buffer = InputBuffer(StreamSource(stream), 64 * 1024)
+
+    assert buffer.read_token() == "12"
+    assert buffer.read_token() == "3"
+    assert stream.lines == ["4\n"]
+    assert buffer.read_line() == ""
+    assert buffer.read_token() == "4"
+
+
+# endregion
+
+# region Interpreter
+
+def test_interpreter__output_flushed_at_exit():
+    sink = CountingSink()
+
+    run("""
+    fn main() {
+        mut let i = 0;
+        while (i < 100) {
+            println(i as str);
+            i = i + 1;
+        }
+    }
+    """, stdout=sink)
+
+    assert len(sink.writes) == 1
+    assert sink.writes[0].splitlines() == [str(i) for i in range(100)]
+
+
+def test_interpreter__explicit_flush():
+    sink = CountingSink()
+
+    run("""
+    fn main() {
+        print("a");
+        flush();
+        print("b");
+    }
+    """, stdout=sink)
+
+    assert sink.writes == ["a", "b"]
+
+
+def test_interpreter__output_flushed_on_panic():
+    sink = MemorySink()
+
+    with pytest.raises(PanicException):
+        run("""
+        fn main() {
+            println("before");
+            panic("failed");
+        }
+        """, stdout=sink)
+
+    assert sink.getvalue() == "before\n"
+
+
+def test_interpreter__read_tokens():
+    sink = MemorySink()
+
+    run("""
+    fn main() {
+        let a = readi32();
+        let b = readu16();
+        let c = readf32();
+        println((a + b) as str + " " + c as str);
+    }
+    """, stdin="40 2\n1.5", stdout=sink)
+
+    assert sink.getvalue() == "42 1.5\n"
+
+
+def test_interpreter__read_invalid():
+    with pytest.raises(InvalidInputPanic):
+        run("fn main() { let a = readu16(); }", stdin="-1")
+
+
+def test_interpreter__read_past_end():
+    with pytest.raises(InvalidInputPanic):
+        run("fn main() { let a = readi32(); }")
+
+# endregion
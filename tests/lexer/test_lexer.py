@@ -13,7 +13,9 @@ from src.common.location import Location
 from src.common.position import Position
 from src.lexer.token import Token
 from src.lexer.token_kind import TokenKind
+from src.lexer.trivia import Trivia, TriviaKind
 from src.utils.buffer import StreamBuffer
+from src.utils.span import Span
 
 
 # region Helpers
@@ -68,6 +70,17 @@ def test_create_iterating():
     assert iterator.eof
 
 
+def test_build_invalid_char():
+    lexer = create_lexer("@a")
+
+    token = lexer.get_next_token()
+
+    assert token.kind == TokenKind.Invalid
+    assert token.value == "@"
+    assert token.location == Location(Position(1, 1), Position(1, 1))
+    assert lexer.get_next_token().value == "a"
+
+
 # endregion
 
 # region Build identifier or keyword
@@ -97,6 +110,16 @@ def test_try_build_too_long_identifier():
         lexer.get_next_token()
 
 
+def test_too_long_identifier_is_skipped():
+    lexer = create_lexer("a" * 400 + " b")
+
+    with pytest.raises(IdentifierTooLongException) as info:
+        lexer.get_next_token()
+
+    assert info.value.location == Location(Position(1, 1), Position(1, 400))
+    assert lexer.get_next_token().value == "b"
+
+
 @pytest.mark.parametrize(
     "lexer, expected",
     (
@@ -276,6 +299,17 @@ def test_try_build_too_long_string():
         lexer.get_next_token()
 
 
+def test_too_long_string_is_skipped():
+    lexer = create_lexer("\"" + "a\\\"" * 100 + "\" b")
+
+    with pytest.raises(StringTooLongException) as info:
+        lexer.get_next_token()
+
+    assert info.value.location.end == Position(1, 302)
+    assert lexer.get_next_token().value == "b"
+    assert lexer.get_next_token().kind == TokenKind.EOF
+
+
 def test_build_string_exact_length():
     lexer = create_lexer("\"" + "a" * 128 + "\"")
     token = lexer.get_next_token()
@@ -484,3 +518,130 @@ def test_lex_fn():
     assert tokens[11].kind == TokenKind.EOF
 
 # endregion
+
+# region Character classes
+
+def test_lex_unicode_identifier_positions():
+    lexer = create_lexer("zażółć = \"gęślą\" + jaźń;")
+    tokens = [token for token in lexer]
+
+    assert tokens[0] == Token(TokenKind.Identifier,
+                              Location(Position(1, 1), Position(1, 6)),
+                              "zażółć")
+    assert tokens[2] == Token(TokenKind.String,
+                              Location(Position(1, 10), Position(1, 16)),
+                              "gęślą")
+    assert tokens[4] == Token(TokenKind.Identifier,
+                              Location(Position(1, 20), Position(1, 23)),
+                              "jaźń")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64 * 1024])
+def test_lex_across_chunks(monkeypatch, chunk_size: int):
+    monkeypatch.setattr("src.utils.buffer.CHUNK_SIZE", chunk_size)
+    content = "fn name_1(\n  x: i64) {\n  // note ą\n  \"a\\tb\" 0.25 12;\n}"
+
+    tokens = [(token.kind, token.value, token.location.begin)
+              for token in create_lexer(content)]
+
+    assert tokens[1] == (TokenKind.Identifier, "name_1", Position(1, 4))
+    assert tokens[3] == (TokenKind.Identifier, "x", Position(2, 3))
+    assert tokens[8] == (TokenKind.Comment, " note ą", Position(3, 3))
+    assert tokens[9] == (TokenKind.String, "a\tb", Position(4, 3))
+    assert tokens[10] == (TokenKind.Float, 0.25, Position(4, 10))
+    assert tokens[11] == (TokenKind.Integer, 12, Position(4, 15))
+    assert tokens[-1][0] == TokenKind.EOF
+
+
+def test_lex_identifier_too_long_unicode():
+    lexer = create_lexer("ż" * 129)
+
+    with pytest.raises(IdentifierTooLongException):
+        lexer.get_next_token()
+
+# endregion
+
+
+# region Lazy values
+
+def test_lex_string_without_escapes_is_span():
+    token = create_lexer("\"plain text\"").get_next_token()
+
+    assert isinstance(token._value, Span)
+    assert token.value == "plain text"
+
+
+def test_lex_string_with_escapes():
+    token = create_lexer("\"a\\nb\\\"c\"").get_next_token()
+
+    assert token.value == "a\nb\"c"
+
+
+def test_lex_comment_is_span():
+    token = create_lexer("// note\nx").get_next_token()
+
+    assert isinstance(token._value, Span)
+    assert token.value == " note"
+
+# endregion
+
+
+# region Trivia
+
+def create_trivia_lexer(string: str, trivia: Trivia = None) -> Lexer:
+    return Lexer(StreamBuffer.from_str(string), skip_comments=True,
+                 trivia=trivia)
+
+
+def test_skip_comments():
+    lexer = create_trivia_lexer("a // first\n/ b // last")
+    kinds = [token.kind for token in lexer]
+
+    assert kinds == [TokenKind.Identifier, TokenKind.Divide,
+                     TokenKind.Identifier, TokenKind.EOF]
+    assert lexer.trivia is None
+
+
+def test_skip_empty_comment_at_end():
+    lexer = create_trivia_lexer("x //")
+
+    assert lexer.get_next_token().kind == TokenKind.Identifier
+    assert lexer.get_next_token().kind == TokenKind.EOF
+
+
+def test_trivia_records_whitespace_and_comments():
+    trivia = Trivia()
+    lexer = create_trivia_lexer("a  // note\n  b", trivia)
+    tokens = [token for token in lexer]
+
+    assert [token.kind for token in tokens] == [
+        TokenKind.Identifier, TokenKind.Identifier, TokenKind.EOF
+    ]
+    assert [(entry.kind, entry.text, entry.location) for entry in trivia] == [
+        (TriviaKind.Whitespace, "  ",
+         Location(Position(1, 2), Position(1, 3))),
+        (TriviaKind.Comment, " note",
+         Location(Position(1, 4), Position(1, 10))),
+        (TriviaKind.Whitespace, "\n  ",
+         Location(Position(1, 11), Position(2, 2)))
+    ]
+
+
+def test_trivia_between():
+    trivia = Trivia()
+    lexer = create_trivia_lexer(
+        "// one\nfn f() {}\n// two\n// three\nfn g() {}", trivia
+    )
+    tokens = [token for token in lexer]
+    previous, following = tokens[5], tokens[6]
+
+    comments = [entry.text for entry in trivia.between(
+        previous.location.end, following.location.begin
+    ) if entry.kind == TriviaKind.Comment]
+
+    assert comments == [" two", " three"]
+    assert [entry.text for entry in trivia.comments] == [
+        " one", " two", " three"
+    ]
+
+# endregion
@@ -4,6 +4,7 @@ from src.common.location import Location
 from src.common.position import Position
 from src.lexer.token import Token
 from src.lexer.token_kind import TokenKind
+from src.utils.span import Span
 
 
 @pytest.fixture
@@ -66,3 +67,15 @@ def test_identifier_token_eq(identifier):
 def test_token_invalid_eq_type(identifier):
     with pytest.raises(NotImplementedError):
         assert identifier == TokenKind.Identifier
+
+
+def test_token_span_value():
+    source = "// comment"
+    token = Token(TokenKind.Comment, Location(Position(1, 1), Position(1, 10)),
+                  Span(source, 3, 10))
+
+    assert token.value == "comment"
+    assert type(token.value) is str
+    assert token == Token(TokenKind.Comment,
+                          Location(Position(1, 1), Position(1, 10)),
+                          "comment")
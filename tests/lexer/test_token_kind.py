@@ -0,0 +1,35 @@
+from src.lexer.token_kind import TokenKind
+from src.lexer.token_kind_set import TokenKindSet
+
+
+def test_token_kind_codes():
+    codes = [kind.code for kind in TokenKind]
+
+    assert codes == list(range(len(TokenKind)))
+    assert TokenKind.U16.mask == 1
+    assert TokenKind.Str.value == "str"
+
+
+def test_token_kind_set_membership():
+    kinds = TokenKindSet(TokenKind.Plus, TokenKind.Minus)
+
+    assert TokenKind.Plus in kinds
+    assert TokenKind.Minus in kinds
+    assert TokenKind.Multiply not in kinds
+    assert len(kinds) == 2
+    assert list(kinds) == [TokenKind.Plus, TokenKind.Minus]
+
+
+def test_token_kind_set_union():
+    kinds = TokenKindSet(TokenKind.Plus) | TokenKind.EOF
+
+    assert kinds == TokenKindSet(TokenKind.EOF, TokenKind.Plus)
+    assert TokenKind.EOF in kinds
+    assert repr(kinds) == "TokenKindSet(Plus, EOF)"
+
+
+def test_token_kind_set_empty():
+    kinds = TokenKindSet()
+
+    assert len(kinds) == 0
+    assert TokenKind.EOF not in kinds
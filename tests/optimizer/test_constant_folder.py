@@ -0,0 +1,237 @@
+import pytest
+
+from src.flags import Flags
+from src.interpreter.errors import IntegerOverflowPanic, DivisionByZeroPanic
+from src.optimizer.constant_folder import ConstantFolder
+from src.parser.ast.constant import Constant
+from src.parser.ast.expressions.binary_operation import BinaryOperation
+from src.parser.ast.expressions.bool_operation import BoolOperation
+from src.parser.ast.expressions.unary_operation import UnaryOperation
+from src.parser.ast.module import Module
+from src.parser.ast.name import Name
+from src.parser.ast.statements.block import Block
+from src.semantic.analyzer import Analysis, analyze
+from src.semantic.types import BuiltinType
+from tests.interpreter.test_interpreter import run
+from tests.parser.test_parser import create_parser
+from tests.semantic.test_type_checker import body
+
+
+# region Utilities
+
+def fold(program: str) -> tuple[Module, Analysis, ConstantFolder]:
+    module = create_parser(program).parse()
+    analysis = analyze(module)
+    folder = ConstantFolder(analysis)
+    folder.fold()
+
+    return module, analysis, folder
+
+
+# endregion
+
+# region Expressions
+
+@pytest.mark.parametrize("expression, expected, typ", [
+    ("1 + 2 * 3", 7, BuiltinType.I32),
+    ("-(4 - 10)", 6, BuiltinType.I32),
+    ("7 / 2", 3, BuiltinType.I32),
+    ("-7 / 2", -3, BuiltinType.I32),
+    ("1 + 2.5", 3, BuiltinType.I32),
+    ("2.5 + 1", 3.5, BuiltinType.F32),
+    ("1 < 2", True, BuiltinType.Bool),
+    ("1 == 1 && 2 > 3", False, BuiltinType.Bool),
+    ("!false", True, BuiltinType.Bool),
+    ("\"a\" + \"b\"", "ab", BuiltinType.Str),
+    ("70000 as i16", 4464, BuiltinType.I16),
+    ("12 as str", "12", BuiltinType.Str),
+])
+def test_fold__expressions(expression: str, expected, typ):
+    module, analysis, _ = fold(f"fn main() {{ let a = {expression}; }}")
+
+    value = body(module)[0].value
+
+    assert isinstance(value, Constant)
+    assert value.value == expected
+    assert analysis.types.type_of(value) == typ
+
+
+def test_fold__partial():
+    module, _, folder = fold("""
+    fn main(x: i32) {
+        let a = x + 2 * 3;
+    }
+    """)
+
+    value = body(module)[0].value
+
+    assert isinstance(value, BinaryOperation)
+    assert isinstance(value.left, Name)
+    assert value.right.value == 6
+    assert folder.folded == 1
+
+
+def test_fold__short_circuit():
+    module, _, _ = fold("""
+    fn main(x: bool) {
+        let a = false && x;
+        let b = true && x;
+        let c = true || x;
+    }
+    """)
+
+    first, second, third = body(module)
+
+    assert first.value.value is False
+    assert isinstance(second.value, Name)
+    assert third.value.value is True
+
+
+def test_fold__bool_operation_keeps_conversion():
+    module, _, _ = fold("""
+    fn main(x: i32) {
+        let a = true && x;
+    }
+    """)
+
+    assert isinstance(body(module)[0].value, BoolOperation)
+
+
+@pytest.mark.parametrize("expression", [
+    "(30000 as i16) + (30000 as i16)",
+    "-(-32768 as i16)",
+    "1 / 0",
+    "2147483647 * 2",
+])
+def test_fold__keeps_panicking_operations(expression: str):
+    module, _, _ = fold(f"fn main() {{ let a = {expression}; }}")
+
+    value = body(module)[0].value
+
+    assert isinstance(value, (BinaryOperation, UnaryOperation))
+
+
+def test_fold__user_operator_not_folded():
+    module, _, _ = fold("""
+    fn __add(x: i32, y: i32) -> i32 { return 0; }
+    fn main() { let a = 1 + 2; }
+    """)
+
+    assert isinstance(body(module, 1)[0].value, BinaryOperation)
+
+
+# endregion
+
+# region Statements
+
+def test_fold__if_true_replaced_with_block():
+    module, _, folder = fold("""
+    fn main() {
+        if (1 < 2) {
+            println("yes");
+        } else {
+            println("no");
+        }
+    }
+    """)
+
+    (statement,) = body(module)
+
+    assert isinstance(statement, Block)
+    assert statement.body[0].arguments[0].value == "yes"
+    assert folder.eliminated == 1
+
+
+def test_fold__if_false_removed():
+    module, _, _ = fold("""
+    fn main() {
+        if (0) {
+            println("yes");
+        }
+        println("after");
+    }
+    """)
+
+    (statement,) = body(module)
+
+    assert statement.arguments[0].value == "after"
+
+
+def test_fold__if_false_replaced_with_else():
+    module, _, _ = fold("""
+    fn main() {
+        if (false) { println("yes"); } else { println("no"); }
+    }
+    """)
+
+    (statement,) = body(module)
+
+    assert statement.body[0].arguments[0].value == "no"
+
+
+def test_fold__while_false_removed():
+    module, _, _ = fold("""
+    fn main() {
+        while (1 > 2) { println("never"); }
+    }
+    """)
+
+    assert body(module) == []
+
+
+def test_fold__nested_blocks():
+    module, _, _ = fold("""
+    fn main(x: bool) {
+        while (x) {
+            if (true) {
+                let a = 2 + 2;
+            }
+        }
+    }
+    """)
+
+    (loop,) = body(module)
+    (block,) = loop.block.body
+
+    assert block.body[0].value.value == 4
+
+
+# endregion
+
+# region Execution
+
+@pytest.mark.parametrize("folding", [True, False])
+def test_interpreter__folding_preserves_semantics(folding: bool):
+    output = run("""
+    fn main() {
+        let a: i16 = 100 * 3 + 5;
+        let b = (70000 as i16) / 2;
+        mut let c = 0;
+        if (a > 300) {
+            c = a - 300;
+        }
+        println(a as str + " " + b as str + " " + c as str);
+    }
+    """, Flags(constant_folding=folding))
+
+    assert output == "305 2232 5\n"
+
+
+@pytest.mark.parametrize("folding", [True, False])
+def test_interpreter__folding_keeps_panics(folding: bool):
+    with pytest.raises(IntegerOverflowPanic) as info:
+        run("""
+        fn main() {
+            println("start");
+            let a = (30000 as i16) + (30000 as i16);
+        }
+        """, Flags(constant_folding=folding))
+
+    assert info.value.location.begin.line == 4
+
+
+def test_interpreter__folding_keeps_division_by_zero():
+    with pytest.raises(DivisionByZeroPanic):
+        run("fn main() { let a = 1 / 0; }")
+
+# endregion
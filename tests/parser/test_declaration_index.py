@@ -0,0 +1,138 @@
+from src.parser.ast.declaration.declaration_index import type_path
+from src.parser.ast.declaration.enum_declaration import EnumDeclaration
+from src.parser.ast.declaration.function_declaration import \
+    FunctionDeclaration
+from src.parser.ast.declaration.struct_declaration import StructDeclaration
+from tests.parser.test_parser import create_parser
+
+
+def parse(program: str):
+    return create_parser(program).parse()
+
+
+# region Declaration Index
+
+def test_declaration_index__names():
+    module = parse("""struct Point { x: i64; }
+enum Shape { struct Circle { r: f32; }; }
+fn area(p: Point) {}
+""")
+    index = module.index
+
+    assert "Point" in index
+    assert "Missing" not in index
+    assert index.type("Point") is module.struct_declarations[0]
+    assert index.type("Shape") is module.enum_declarations[0]
+    assert index.declarations("area") == module.function_declarations
+    assert index.functions("Point") == []
+    assert index.type("Missing") is None
+
+
+def test_declaration_index__overloads():
+    module = parse("""fn f(a: i64) {}
+fn f(a: f32) {}
+fn f(a: i64, b: Shape::Circle) {}
+fn f(b: i64) {}
+""")
+    index = module.index
+    first, second, third, fourth = module.function_declarations
+
+    assert index.functions("f") == [first, second, third, fourth]
+    assert list(index.overloads("f")) == [
+        (("i64",),), (("f32",),), (("i64",), ("Shape", "Circle"))
+    ]
+    assert index.overload("f", (("i64",),)) == [first, fourth]
+    assert index.overload("f", (("bool",),)) == []
+    assert index.overloads("g") == {}
+
+
+def test_declaration_index__variants():
+    module = parse("""enum Shape {
+    struct Circle { r: f32; };
+    enum Polygon { struct Square { a: f32; }; };
+}
+fn main() { let s: Shape::Polygon::Square = Shape::Polygon::Square {}; }
+""")
+    index = module.index
+    shape = module.enum_declarations[0]
+    square = shape.variants[1].variants[0]
+    declaration = module.function_declarations[0].block.body[0]
+
+    assert type_path(declaration.declared_type) == \
+        ("Shape", "Polygon", "Square")
+    assert index.variant(declaration.declared_type) is square
+    assert index.type(("Shape", "Circle")) is shape.variants[0]
+    assert index.type(("Shape", "Square")) is None
+
+
+def test_declaration_index__built_once():
+    module = parse("fn main() {}")
+
+    assert module.index is module.index
+
+
+def test_declaration_index__add_declaration():
+    module = parse("fn f(a: i64) {}")
+    index = module.index
+    added = parse("fn f(a: f32) {} struct Point {}")
+
+    module.add_declaration(added.function_declarations[0])
+    module.add_declaration(added.struct_declarations[0])
+
+    assert module.index is index
+    assert len(index.functions("f")) == 2
+    assert index.overload("f", (("f32",),)) == added.function_declarations
+    assert index.type("Point") is added.struct_declarations[0]
+    assert isinstance(module.struct_declarations[0], StructDeclaration)
+
+
+def test_declaration_index__appended():
+    module = parse("enum A {}")
+    assert module.index.type("B") is None
+
+    module.enum_declarations.extend(parse("enum B { struct C {}; }")
+                                    .enum_declarations)
+
+    assert isinstance(module.index.type(("B", "C")), StructDeclaration)
+    assert isinstance(module.index.type("A"), EnumDeclaration)
+
+
+def test_declaration_index__rebuilt():
+    module = parse("fn f() {} fn g() {}")
+    assert len(module.index.declarations("g")) == 1
+
+    module.function_declarations = parse("fn g() {}").function_declarations
+    assert module.index.functions("f") == []
+    assert len(module.index.functions("g")) == 1
+
+    module.function_declarations.pop()
+    assert "g" not in module.index
+
+
+def test_declaration_index__replaced_in_place():
+    module = parse("fn f() {} fn g() {}")
+    h, k = parse("fn h() {} fn k() {}").function_declarations
+    assert module.index.functions("f")
+
+    module.function_declarations[0] = h
+    module.invalidate_index()
+    assert module.index.functions("f") == []
+    assert module.index.functions("h") == [h]
+
+    # Same length after removal and append
+    module.function_declarations.pop()
+    module.function_declarations.append(k)
+    assert "g" not in module.index
+    assert module.index.functions("k") == [k]
+
+
+def test_declaration_index__equality():
+    module = parse("fn f() {}")
+    other = parse("fn f() {}")
+    module.index
+
+    assert module == other
+    assert "_index" not in repr(module)
+    assert isinstance(other.function_declarations[0], FunctionDeclaration)
+
+# endregion
@@ -5,10 +5,10 @@ from src.utils.buffer import StreamBuffer
 
 # region Utilities
 
-def create_parser(content: str) -> Parser:
+def create_parser(content: str, recover: bool = False) -> Parser:
     buffer = StreamBuffer.from_str(content)
-    lexer = Lexer(buffer)
-    parser = Parser(lexer)
+    lexer = Lexer(buffer, skip_comments=True)
+    parser = Parser(lexer, recover)
 
     return parser
 
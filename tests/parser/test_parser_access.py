@@ -191,6 +191,20 @@ def test_parse_type__builtin():
     assert builtin_type.location == expected.location
 
 
+@pytest.mark.parametrize("builtin", [
+    "u16", "u32", "u64", "i16", "i32", "i64", "f32", "bool", "str"
+])
+def test_parse_type__all_builtins(builtin: str):
+    parser = create_parser(builtin)
+
+    builtin_type = parser.parse_type()
+
+    assert builtin_type == Name(
+        identifier=builtin,
+        location=Location(Position(1, 1), Position(1, len(builtin)))
+    )
+
+
 def test_parse_type__name():
     parser = create_parser("Sword")
 
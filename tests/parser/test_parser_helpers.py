@@ -2,6 +2,7 @@ import pytest
 
 from src.common.position import Position
 from src.lexer.token_kind import TokenKind
+from src.lexer.token_kind_set import TokenKindSet
 from src.parser.errors import SyntaxExpectedTokenException, SyntaxException
 from tests.parser.test_parser import create_parser
 
@@ -97,6 +98,17 @@ def test_consume_if__many_not_matching():
     assert token is None
 
 
+def test_consume_if__set_matching():
+    parser = create_parser("- 7")
+    kinds = TokenKindSet(TokenKind.Plus, TokenKind.Minus)
+
+    token = parser.consume_if(kinds)
+
+    assert token is not None
+    assert token.kind == TokenKind.Minus
+    assert parser.consume_if(kinds) is None
+
+
 # endregion
 
 # region Expect
@@ -177,4 +189,13 @@ def test_expect__match_missing():
     with pytest.raises(SyntaxExpectedTokenException):
         parser.expect([TokenKind.Mut, TokenKind.Identifier])
 
+
+def test_expect__set_missing():
+    parser = create_parser("fn main()")
+
+    with pytest.raises(SyntaxExpectedTokenException) as info:
+        parser.expect(TokenKindSet(TokenKind.Mut, TokenKind.Identifier))
+
+    assert info.value.expected == [TokenKind.Mut, TokenKind.Identifier]
+
 # endregion
@@ -230,3 +230,22 @@ def test_parser_parse__function():
     assert module == expected
 
 # endregion
+
+
+# region Parse Program - Comments
+def test_parser_parse__comments():
+    program = """
+    // Adds numbers
+    fn add(a: i64, b: i64) -> i64 { // inline
+        // before return
+        return a / b; //
+    }
+    // trailing"""
+
+    module = create_parser(program).parse()
+
+    assert [function.name.identifier
+            for function in module.function_declarations] == ["add"]
+    assert len(module.function_declarations[0].block.body) == 1
+
+# endregion
@@ -0,0 +1,187 @@
+import pytest
+
+from src.common.location import Location
+from src.common.position import Position
+from src.lexer.errors import IntegerLeadingZerosException, \
+    ExpectingCharException, InvalidEscapeSequenceException, \
+    StringTooLongException, IdentifierTooLongException
+from src.parser.ast.statements.error_statement import ErrorStatement
+from src.parser.ast.statements.variable_declaration import VariableDeclaration
+from src.parser.errors import ExpressionExpectedError, \
+    SemicolonExpectedError, UnexpectedTokenError, BraceExpectedError, \
+    TypeExpectedError
+from tests.parser.test_parser import create_parser
+
+
+# region Parse Program - Recovery
+
+def test_parser_recovery__disabled_raises():
+    parser = create_parser("fn main() { let a = ; }")
+
+    with pytest.raises(ExpressionExpectedError):
+        parser.parse()
+
+    assert parser.recover is False
+
+
+def test_parser_recovery__valid_program():
+    parser = create_parser("fn main() { let a = 1; }", recover=True)
+    module = parser.parse()
+
+    assert parser.diagnostics == []
+    assert module.errors == []
+    assert len(module.function_declarations) == 1
+
+
+def test_parser_recovery__many_errors_in_one_pass():
+    program = """fn a() { let x = ; let y = 2; }
+fn b() -> i64 { return 1 }
+fn c() { let z = 1 + ; }
+"""
+    parser = create_parser(program, recover=True)
+    module = parser.parse()
+
+    assert [type(error) for error in parser.diagnostics] == [
+        ExpressionExpectedError,
+        SemicolonExpectedError,
+        ExpressionExpectedError
+    ]
+    assert [function.name.identifier
+            for function in module.function_declarations] == ["a", "b", "c"]
+
+
+def test_parser_recovery__synchronise_at_semicolon():
+    parser = create_parser("fn a() { let x = ; let y = 2; }", recover=True)
+    body = parser.parse().function_declarations[0].block.body
+
+    assert body[0] == ErrorStatement(
+        message="Expression expected",
+        location=Location(Position(1, 16), Position(1, 18))
+    )
+    assert isinstance(body[1], VariableDeclaration)
+    assert body[1].name.identifier == "y"
+
+
+def test_parser_recovery__error_statement_spans_skipped_tokens():
+    parser = create_parser("fn a() { @ foo(1); }", recover=True)
+    body = parser.parse().function_declarations[0].block.body
+
+    assert isinstance(parser.diagnostics[0], UnexpectedTokenError)
+    assert body == [
+        ErrorStatement(
+            message="Unexpected token",
+            location=Location(Position(1, 10), Position(1, 17))
+        )
+    ]
+
+
+def test_parser_recovery__synchronise_at_brace():
+    parser = create_parser("fn a() { foo(1) } fn b() {}", recover=True)
+    module = parser.parse()
+
+    assert isinstance(parser.diagnostics[0], SemicolonExpectedError)
+    assert len(module.function_declarations) == 2
+    assert isinstance(module.function_declarations[0].block.body[-1],
+                      ErrorStatement)
+
+
+def test_parser_recovery__unclosed_block():
+    program = """fn a() { let x = 1;
+fn b() {}"""
+    parser = create_parser(program, recover=True)
+    module = parser.parse()
+
+    assert [type(error) for error in parser.diagnostics] == [
+        BraceExpectedError
+    ]
+    assert parser.diagnostics[0].position == Position(2, 1)
+    assert module.function_declarations[0].block.location.end \
+        == Position(1, 18)
+    assert len(module.function_declarations) == 2
+
+
+def test_parser_recovery__top_level_error():
+    program = "let x = 1; struct S { a: i64; } fn main() {}"
+    parser = create_parser(program, recover=True)
+    module = parser.parse()
+
+    assert module.errors == [
+        ErrorStatement(
+            message="Unexpected token",
+            location=Location(Position(1, 1), Position(1, 10))
+        )
+    ]
+    assert len(module.struct_declarations) == 1
+    assert len(module.function_declarations) == 1
+
+
+def test_parser_recovery__lexer_error():
+    parser = create_parser("fn a() { let x = 007; }", recover=True)
+    module = parser.parse()
+
+    assert isinstance(parser.diagnostics[0], IntegerLeadingZerosException)
+    assert len(module.function_declarations) == 1
+
+
+@pytest.mark.parametrize("statement, column", [
+    ("let x = + 1;", 18),
+    ("return * q.a;", 17),
+    ("let x = == 1;", 18),
+    ("let x = 1 || ;", 21)
+])
+def test_parser_recovery__missing_left_operand(statement: str, column: int):
+    parser = create_parser(f"fn a() {{ {statement} }} fn b() {{}}",
+                           recover=True)
+    module = parser.parse()
+
+    assert [type(error) for error in parser.diagnostics] == [
+        ExpressionExpectedError
+    ]
+    assert parser.diagnostics[0].position == Position(1, column)
+    assert len(module.function_declarations) == 2
+
+
+def test_parser_recovery__missing_parameter_type():
+    parser = create_parser("fn f(a: ) {} fn g() {}", recover=True)
+    module = parser.parse()
+
+    assert [type(error) for error in parser.diagnostics] == [
+        TypeExpectedError
+    ]
+    assert parser.diagnostics[0].position == Position(1, 7)
+    assert [function.name.identifier
+            for function in module.function_declarations] == ["g"]
+
+
+@pytest.mark.parametrize("statement, error", [
+    ("let s = \"" + "a" * 20_000 + "\";", StringTooLongException),
+    ("let " + "x" * 400 + " = 1;", IdentifierTooLongException)
+])
+def test_parser_recovery__one_error_per_too_long_token(statement: str,
+                                                       error: type):
+    parser = create_parser(f"fn a() {{ {statement} }} fn b() {{}}",
+                           recover=True)
+    module = parser.parse()
+
+    assert [type(error) for error in parser.diagnostics] == [error]
+    assert len(module.function_declarations) == 2
+
+
+def test_parser_recovery__expecting_char_error():
+    parser = create_parser(
+        "fn a() { let b: bool = true & false; }", recover=True
+    )
+    module = parser.parse()
+
+    assert isinstance(parser.diagnostics[0], ExpectingCharException)
+    assert len(module.function_declarations) == 1
+
+
+def test_parser_recovery__invalid_escape_error():
+    parser = create_parser('fn a() { let s: str = "a\\q"; }', recover=True)
+    module = parser.parse()
+
+    assert isinstance(parser.diagnostics[0], InvalidEscapeSequenceException)
+    assert len(module.function_declarations) == 1
+
+# endregion
@@ -78,6 +78,16 @@ def test_parse_statements_list__missing_semicolon():
         parser.parse_statements_list()
 
 
+def test_parse_statements_list__block_statements():
+    parser = create_parser("let a; if (a) { } while (a) { } { }")
+
+    statements = parser.parse_statements_list()
+
+    assert [type(statement) for statement in statements] == [
+        VariableDeclaration, IfStatement, WhileStatement, Block
+    ]
+
+
 # endregion
 
 # region Parse Statement
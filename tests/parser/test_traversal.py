@@ -0,0 +1,46 @@
+from src.parser.ast.constant import Constant
+from src.parser.ast.expressions.binary_operation import BinaryOperation
+from src.parser.ast.name import Name
+from src.parser.ast.traversal import children, walk, fingerprint
+from tests.parser.test_parser import create_parser
+
+
+# region Walk
+
+def test_children__field_order():
+    expression = create_parser("a + 1").parse_expression()
+
+    nodes = list(children(expression))
+
+    assert isinstance(nodes[0], Name)
+    assert isinstance(nodes[1], Constant)
+
+
+def test_walk__pre_order():
+    expression = create_parser("a + 1 * b").parse_expression()
+
+    nodes = list(walk(expression))
+
+    assert [type(node) for node in nodes] == [
+        BinaryOperation, Name, BinaryOperation, Constant, Name
+    ]
+
+
+# endregion
+
+# region Fingerprint
+
+def test_fingerprint__ignores_location():
+    first = create_parser("fn f() { let a = 1; }").parse()
+    second = create_parser("\n\n  fn f() {\n let a = 1;\n }").parse()
+
+    assert fingerprint(first) == fingerprint(second)
+
+
+def test_fingerprint__detects_change():
+    first = create_parser("fn f() { let a = 1; }").parse()
+    second = create_parser("fn f() { let a = 1.0; }").parse()
+
+    assert fingerprint(first) != fingerprint(second)
+
+# endregion
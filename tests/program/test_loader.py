@@ -0,0 +1,139 @@
+import io
+import os
+
+import pytest
+
+from src.interpreter.interpreter import Interpreter
+from src.program.loader import ProgramLoader
+from src.semantic.analyzer import analyze
+
+MAIN = """fn main() {
+    let p = Point { x = 2; y = 3; };
+    println(area(p) as str);
+}
+"""
+
+SHAPES = """struct Point { x: i64; y: i64; }
+
+fn area(p: Point) -> i64 {
+    return scale(p.x * p.y);
+}
+"""
+
+UTILS = """fn scale(value: i64) -> i64 {
+    return value * 10;
+}
+"""
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "geometry").mkdir()
+    (tmp_path / "main.fhll").write_text(MAIN)
+    (tmp_path / "geometry" / "shapes.fhll").write_text(SHAPES)
+    (tmp_path / "utils.fhll").write_text(UTILS)
+    (tmp_path / "readme.txt").write_text("fn")
+
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_loader_modules(tree, workers: int):
+    program = ProgramLoader(workers).load(str(tree))
+
+    assert list(program.modules) == ["geometry.shapes", "main", "utils"]
+    module = program.modules["geometry.shapes"]
+    assert module.name == "geometry.shapes"
+    assert module.path == os.path.join(str(tree), "geometry",
+                                       "shapes.fhll")
+    assert program.diagnostics == []
+
+
+def test_loader_module_graph(tree):
+    program = ProgramLoader(1).load(str(tree))
+
+    assert program.dependencies == {
+        "geometry.shapes": {"utils"},
+        "main": {"geometry.shapes"},
+        "utils": set()
+    }
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_loader_merged_symbols(tree, workers: int):
+    program = ProgramLoader(workers).load(str(tree))
+    main = program.modules["main"]
+    shapes = program.modules["geometry.shapes"]
+
+    call = main.function_declarations[0].block.body[1].arguments[0] \
+        .value.name
+    declared = shapes.function_declarations[0].name
+
+    assert main.symbols is shapes.symbols is program.symbols
+    assert call.symbol == declared.symbol
+    assert call.identifier is declared.identifier
+
+
+def test_loader_cross_file_references_resolve(tree):
+    program = ProgramLoader(2).load(str(tree))
+    module = program.module()
+    stdout = io.StringIO()
+
+    analyze(module)
+    Interpreter(module, stdout=stdout).run()
+
+    assert stdout.getvalue() == "60\n"
+
+
+def test_loader_parses_file_once(tree):
+    os.symlink(tree / "utils.fhll", tree / "alias.fhll")
+    loader = ProgramLoader(1)
+
+    first = loader.load(str(tree))
+    second = loader.load(str(tree))
+
+    assert loader.parsed == 3
+    assert "alias" not in first.modules
+    assert second.modules["utils"] is not first.modules["utils"]
+    assert second.modules["utils"] == first.modules["utils"]
+
+
+def test_loader_programs_do_not_share_modules(tree):
+    loader = ProgramLoader(1)
+
+    first = loader.load(str(tree))
+    second = loader.load(str(tree / "geometry"))
+
+    assert loader.parsed == 3
+    assert first.modules["geometry.shapes"].name == "geometry.shapes"
+    assert second.modules["shapes"].name == "shapes"
+    assert first.modules["geometry.shapes"].symbols is first.symbols
+
+
+def test_loader_diagnostics(tree):
+    (tree / "broken.fhll").write_text("fn f() { let a = 1 }")
+    (tree / "other.fhll").write_text("struct Point { z: i64; }")
+
+    program = ProgramLoader(1).load(str(tree))
+
+    assert [str(diagnostic).replace(str(tree) + os.sep, "")
+            for diagnostic in program.diagnostics] == [
+        "broken.fhll:1:20: Semicolon expected",
+        "other.fhll:1:8: Type 'Point' is already declared in module "
+        "'geometry.shapes'"
+    ]
+
+
+def test_loader_module_name_collision(tree):
+    (tree / "geometry.shapes.fhll").write_text("fn other() {}")
+
+    program = ProgramLoader(1).load(str(tree))
+
+    # Paths are loaded in order, "." sorts before separator
+    assert program.modules["geometry.shapes"].path == \
+        str(tree / "geometry.shapes.fhll")
+    assert [str(diagnostic).replace(str(tree) + os.sep, "")
+            for diagnostic in program.diagnostics] == [
+        f"geometry{os.sep}shapes.fhll:1:1: Module 'geometry.shapes' is "
+        "already loaded from 'geometry.shapes.fhll'"
+    ]
@@ -0,0 +1,218 @@
+import pytest
+
+from src.parser.ast.module import Module
+from src.semantic.errors import DuplicateOverloadError, UndefinedFunctionError
+from src.semantic.overloads import OverloadTable, InlineCache
+from src.semantic.resolver import Resolver
+from src.semantic.signatures import Signature, builtin_signatures
+from src.semantic.type_checker import TypeChecker, TypeTable, TypeCache
+from src.semantic.types import BuiltinType, UserType
+from tests.parser.test_parser import create_parser
+from tests.semantic.test_type_checker import body
+
+I32 = BuiltinType.I32
+F32 = BuiltinType.F32
+STR = BuiltinType.Str
+
+
+# region Utilities
+
+def check(program: str, cache: TypeCache = None
+          ) -> tuple[Module, TypeTable, TypeChecker]:
+    module = create_parser(program).parse()
+    resolution = Resolver().resolve(module)
+    checker = TypeChecker(cache)
+    table = checker.check(module, resolution)
+
+    return module, table, checker
+
+
+# endregion
+
+# region Overload Table
+
+def test_overload_table__exact():
+    table = OverloadTable(builtin_signatures)
+
+    signature = table.resolve("__add", (I32, I32))
+
+    assert signature == Signature("__add", (I32, I32), I32)
+    assert table.exact("__add", (I32, I32)) is signature
+
+
+def test_overload_table__conversion_memoized():
+    table = OverloadTable(builtin_signatures)
+
+    first = table.resolve("__add", (I32, F32))
+    second = table.resolve("__add", (I32, F32))
+
+    assert first == Signature("__add", (I32, I32), I32)
+    assert first is second
+    assert table.exact("__add", (I32, F32)) is None
+
+
+def test_overload_table__unknown_name():
+    table = OverloadTable(builtin_signatures)
+
+    assert table.resolve("unknown", ()) is None
+    assert "unknown" not in table
+
+
+def test_overload_table__user_shadows_builtin():
+    user = Signature("__add", (STR, STR), I32, declaration=object())
+    table = OverloadTable([user, *builtin_signatures])
+
+    assert table.resolve("__add", (STR, STR)) is user
+    assert table.overloads("__add").count(user) == 1
+
+
+def test_overload_table__add_invalidates_memoized():
+    table = OverloadTable([Signature("f", (F32,), F32)])
+    assert table.resolve("f", (I32,)).parameters == (F32,)
+
+    table.add(Signature("f", (I32,), I32, declaration=object()))
+
+    assert table.resolve("f", (I32,)).parameters == (I32,)
+
+
+# endregion
+
+# region Inline Cache
+
+def test_inline_cache__lookup():
+    player = UserType(("Entity", "Player"))
+    animal = UserType(("Entity", "Animal"))
+    table = OverloadTable([
+        Signature("f", (player,), I32),
+        Signature("f", (animal,), I32)
+    ])
+    cache = InlineCache("f", table)
+
+    assert cache.lookup((player,)).parameters == (player,)
+    assert cache.lookup((animal,)).parameters == (animal,)
+    assert cache.lookup((player,)).parameters == (player,)
+    assert len(cache) == 2
+
+
+def test_inline_cache__miss():
+    cache = InlineCache("f", OverloadTable())
+
+    assert cache.lookup((I32,)) is None
+
+
+# endregion
+
+# region Duplicates
+
+def test_checker__duplicate_overload():
+    with pytest.raises(DuplicateOverloadError):
+        check("""
+        fn square(x: i32) -> i32 { return x * x; }
+        fn square(x: i32) -> i32 { return x; }
+        """)
+
+
+def test_checker__overload_only_by_return_value():
+    with pytest.raises(DuplicateOverloadError) as info:
+        check("""
+        fn square(x: i32) -> i32 { return x * x; }
+        fn square(x: i32) -> f32 { return x * x + 1.0; }
+        """)
+
+    assert "return value" in info.value.message
+
+
+# endregion
+
+# region Call Site Binding
+
+def test_checker__binds_function_call():
+    module, table, _ = check("""
+    fn square(x: i32) -> i32 { return x * x; }
+    fn square(x: f32) -> f32 { return x * x; }
+
+    fn main() {
+        let a = square(2);
+    }
+    """)
+
+    target = table.target(body(module, 2)[0].value)
+
+    assert target.declaration is module.function_declarations[0]
+
+
+def test_checker__binds_operators():
+    module, table, _ = check("""
+    fn __mul(x: str, y: str) -> str { return x + y; }
+
+    fn main() {
+        let a = 1 + 2.0;
+        let b = "a" * "b";
+        let c = !true;
+    }
+    """)
+
+    first, second, third = body(module, 1)
+
+    assert table.target(first.value) == Signature("__add", (I32, I32), I32)
+    assert table.target(second.value).declaration is \
+        module.function_declarations[0]
+    assert table.target(third.value).is_builtin
+
+
+def test_checker__binds_inline_cache_for_variants():
+    module, table, _ = check("""
+    enum Entity {
+        struct Player { };
+        struct Animal { };
+    }
+
+    fn describe(p: Entity::Player) -> str { return "player"; }
+    fn describe(a: Entity::Animal) -> str { return "animal"; }
+
+    fn main(e: Entity) {
+        let d = describe(e);
+    }
+    """)
+
+    declaration = body(module, 2)[0]
+
+    assert isinstance(table.target(declaration.value), InlineCache)
+    assert table.type_of(declaration) == STR
+
+
+def test_checker__variant_overloads_must_agree():
+    with pytest.raises(UndefinedFunctionError):
+        check("""
+        enum Entity {
+            struct Player { };
+            struct Animal { };
+        }
+
+        fn describe(p: Entity::Player) -> str { return "player"; }
+        fn describe(a: Entity::Animal) -> i32 { return 0; }
+
+        fn main(e: Entity) {
+            let d = describe(e);
+        }
+        """)
+
+
+def test_checker__cached_targets_rebound():
+    program = """
+    fn helper(x: i32) -> i32 { return x; }
+    fn main() { let a = helper(1) + 2; }
+    """
+    cache = TypeCache()
+
+    check(program, cache)
+    module, table, _ = check(program, cache)
+
+    declaration = body(module, 1)[0]
+
+    assert cache.hits == 2
+    assert table.target(declaration.value.left).declaration is \
+        module.function_declarations[0]
+    assert table.target(declaration.value).is_builtin
+
+# endregion
@@ -0,0 +1,50 @@
+from src.semantic.registry import TypeRegistry
+from src.semantic.types import UserType
+from tests.parser.test_parser import create_parser
+
+PROGRAM = """
+struct Point { x: i32; }
+enum Entity {
+    struct Player { };
+    enum Animal {
+        struct Dog { };
+        struct Cat { };
+    };
+    struct Item { };
+}
+"""
+
+
+def create_registry(program: str = PROGRAM) -> TypeRegistry:
+    return TypeRegistry(create_parser(program).parse())
+
+
+def test_registry__tags_unique():
+    registry = create_registry()
+    types = [("Point",), ("Entity",), ("Entity", "Player"),
+             ("Entity", "Animal"), ("Entity", "Animal", "Dog"),
+             ("Entity", "Animal", "Cat"), ("Entity", "Item")]
+
+    tags = {registry.tag(UserType(path)) for path in types}
+
+    assert tags == set(range(len(types)))
+
+
+def test_registry__tag_ranges_cover_variants():
+    registry = create_registry()
+    entity = registry.tags(UserType(("Entity",)))
+    animal = registry.tags(UserType(("Entity", "Animal")))
+    dog = registry.tag(UserType(("Entity", "Animal", "Dog")))
+    item = registry.tag(UserType(("Entity", "Item")))
+
+    assert entity[0] <= animal[0] < animal[1] <= entity[1]
+    assert animal[0] <= dog < animal[1]
+    assert not animal[0] <= item < animal[1]
+    assert entity[0] <= item < entity[1]
+
+
+def test_registry__struct_range():
+    registry = create_registry()
+    low, high = registry.tags(UserType(("Point",)))
+
+    assert high == low + 1
@@ -0,0 +1,261 @@
+import pytest
+
+from src.parser.ast.module import Module
+from src.semantic.errors import UndefinedVariableError, \
+    ImmutableAssignmentError
+from src.semantic.resolver import Resolver, Resolution
+from tests.parser.test_parser import create_parser
+
+
+# region Utilities
+
+def parse(program: str) -> Module:
+    return create_parser(program).parse()
+
+
+def resolve(program: str) -> tuple[Module, Resolution]:
+    module = parse(program)
+    resolution = Resolver().resolve(module)
+
+    return module, resolution
+
+
+# endregion
+
+# region Slots
+
+def test_resolver__parameters_first():
+    module, resolution = resolve("""
+    fn add(a: i32, b: i32) -> i32 {
+        let c = a + b;
+        return c;
+    }
+    """)
+
+    function = module.function_declarations[0]
+    frame = resolution.frame(function)
+
+    assert [slot.name for slot in frame.slots] == ["a", "b", "c"]
+    assert [slot.index for slot in frame.slots] == [0, 1, 2]
+    assert frame.size == 3
+
+
+def test_resolver__references_bound_to_declaration():
+    module, resolution = resolve("""
+    fn main() {
+        let x = 1;
+        let y = x;
+    }
+    """)
+
+    body = module.function_declarations[0].block.body
+    reference = body[1].value
+
+    assert resolution.slot(reference) is resolution.slot(body[0])
+
+
+def test_resolver__shadowing_allocates_new_slot():
+    module, resolution = resolve("""
+    fn main() {
+        let x = 1;
+        let x = x + 1;
+        let y = x;
+    }
+    """)
+
+    first, second, third = module.function_declarations[0].block.body
+
+    assert resolution.slot(second.value.left).index == 0
+    assert resolution.slot(second).index == 1
+    assert resolution.slot(third.value).index == 1
+
+
+def test_resolver__block_locals_reuse_slots():
+    module, resolution = resolve("""
+    fn main(y: i32) {
+        if (y > 10) {
+            let z = 20;
+        } else {
+            let w = 30;
+        }
+        let d = y;
+    }
+    """)
+
+    function = module.function_declarations[0]
+    if_statement, declaration = function.block.body
+    z = if_statement.block.body[0]
+    w = if_statement.else_block.body[0]
+
+    assert resolution.slot(z).index == 1
+    assert resolution.slot(w).index == 1
+    assert resolution.slot(declaration).index == 1
+    assert resolution.frame(function).size == 2
+
+
+def test_resolver__matcher_binds_name():
+    module, resolution = resolve("""
+    fn main(r: Result) {
+        match (r) {
+            Result::Ok value => {
+                let x = value;
+            };
+        }
+    }
+    """)
+
+    match_statement = module.function_declarations[0].block.body[0]
+    matcher = match_statement.matchers[0]
+    declaration = matcher.block.body[0]
+
+    assert resolution.slot(matcher).index == 1
+    assert resolution.slot(declaration.value) is resolution.slot(matcher)
+
+
+def test_resolver__access_root_resolved():
+    module, resolution = resolve("""
+    fn main(mut item: Item) {
+        item.amount = item.amount + 1;
+    }
+    """)
+
+    assignment = module.function_declarations[0].block.body[0]
+
+    assert resolution.slot(assignment.access.parent).index == 0
+    assert resolution.slot(assignment.value.left.parent).index == 0
+
+
+# endregion
+
+# region Undefined Variables
+
+def test_resolver__undefined_variable():
+    with pytest.raises(UndefinedVariableError):
+        resolve("""
+        fn main() {
+            let x = y;
+        }
+        """)
+
+
+def test_resolver__block_local_removed_on_exit():
+    with pytest.raises(UndefinedVariableError) as info:
+        resolve("""
+        fn x(y: i32) {
+            if (y > 10) {
+                let z: i32 = 20;
+            }
+
+            let d: i32 = z + 0;
+        }
+        """)
+
+    assert info.value.name == "z"
+
+
+def test_resolver__declaration_value_before_binding():
+    with pytest.raises(UndefinedVariableError):
+        resolve("""
+        fn main() {
+            let x = x;
+        }
+        """)
+
+
+def test_resolver__function_names_not_variables():
+    resolve("""
+    fn main() {
+        let x = compute(1, 2);
+        println("Done");
+    }
+    """)
+
+
+def test_resolver__struct_fields_not_variables():
+    resolve("""
+    fn main() {
+        let item = Item { name = "Axe"; amount = 1; };
+    }
+    """)
+
+
+# endregion
+
+# region Immutable Variables
+
+def test_resolver__immutable_assignment():
+    with pytest.raises(ImmutableAssignmentError):
+        resolve("""
+        fn main() {
+            let x: i32 = 3;
+            x = x + 1;
+        }
+        """)
+
+
+def test_resolver__immutable_parameter_assignment():
+    with pytest.raises(ImmutableAssignmentError):
+        resolve("""
+        fn main(x: i32) {
+            x = 1;
+        }
+        """)
+
+
+def test_resolver__immutable_field_assignment():
+    with pytest.raises(ImmutableAssignmentError):
+        resolve("""
+        fn main(item: Item) {
+            item.amount = 4;
+        }
+        """)
+
+
+def test_resolver__mutable_assignment():
+    resolve("""
+    fn main(mut a: i32) {
+        mut let y: i32 = 4;
+        y = y + 1;
+        a = y;
+    }
+    """)
+
+
+def test_resolver__deferred_initialization():
+    resolve("""
+    fn main(c: bool) {
+        let x: i32;
+        if (c) {
+            x = 1;
+        } else {
+            x = 2;
+        }
+    }
+    """)
+
+
+def test_resolver__deferred_initialization_twice():
+    with pytest.raises(ImmutableAssignmentError):
+        resolve("""
+        fn main(c: bool) {
+            let x: i32;
+            if (c) {
+                x = 1;
+            }
+            x = 2;
+        }
+        """)
+
+
+def test_resolver__deferred_initialization_in_loop():
+    with pytest.raises(ImmutableAssignmentError):
+        resolve("""
+        fn main(c: bool) {
+            let x: i32;
+            while (c) {
+                x = 1;
+            }
+        }
+        """)
+
+# endregion
@@ -0,0 +1,420 @@
+import pytest
+
+from src.parser.ast.module import Module
+from src.semantic.errors import TypeMismatchError, TypeInferenceError, \
+    UndefinedFunctionError, UndefinedOperationError, UndefinedFieldError, \
+    UndefinedTypeError, InvalidCastError
+from src.semantic.resolver import Resolver
+from src.semantic.type_checker import TypeChecker, TypeTable, TypeCache
+from src.semantic.types import BuiltinType, UserType
+from tests.parser.test_parser import create_parser
+
+
+# region Utilities
+
+def parse(program: str) -> Module:
+    return create_parser(program).parse()
+
+
+def check(program: str, cache: TypeCache = None
+          ) -> tuple[Module, TypeTable]:
+    module = parse(program)
+    resolution = Resolver().resolve(module)
+    table = TypeChecker(cache).check(module, resolution)
+
+    return module, table
+
+
+def body(module: Module, function: int = 0) -> list:
+    return module.function_declarations[function].block.body
+
+
+# endregion
+
+# region Inference
+
+@pytest.mark.parametrize("literal, expected", [
+    ("10", BuiltinType.I32),
+    ("4000000000", BuiltinType.I64),
+    ("10.3", BuiltinType.F32),
+    ("true", BuiltinType.Bool),
+    ("\"text\"", BuiltinType.Str)
+])
+def test_checker__literal_inference(literal: str, expected: BuiltinType):
+    module, table = check(f"fn main() {{ let x = {literal}; }}")
+
+    declaration = body(module)[0]
+
+    assert table.type_of(declaration) == expected
+    assert table.type_of(declaration.value) == expected
+
+
+def test_checker__declared_type_wins():
+    module, table = check("fn main() { let y: f32 = 1; }")
+
+    declaration = body(module)[0]
+
+    assert table.type_of(declaration) == BuiltinType.F32
+    assert table.type_of(declaration.value) == BuiltinType.I32
+
+
+def test_checker__reference_type():
+    module, table = check("""
+    fn main(a: u16) {
+        let b = a;
+    }
+    """)
+
+    assert table.type_of(body(module)[0].value) == BuiltinType.U16
+
+
+def test_checker__missing_type():
+    with pytest.raises(TypeInferenceError):
+        check("fn main() { let x; }")
+
+
+# endregion
+
+# region Operations
+
+@pytest.mark.parametrize("expression, expected", [
+    ("1 + 2", BuiltinType.I32),
+    ("3.14 + 10", BuiltinType.F32),
+    ("10 + 3.14", BuiltinType.I32),
+    ("\"x = \" + 1", BuiltinType.Str),
+    ("1 < 2.0", BuiltinType.Bool),
+    ("1 == 2", BuiltinType.Bool),
+    ("3 && 4", BuiltinType.Bool),
+    ("-1", BuiltinType.I32),
+    ("!true", BuiltinType.Bool),
+    ("1 as f32", BuiltinType.F32)
+])
+def test_checker__builtin_operations(expression: str, expected: BuiltinType):
+    module, table = check(f"fn main() {{ let x = {expression}; }}")
+
+    assert table.type_of(body(module)[0]) == expected
+
+
+def test_checker__undefined_operation():
+    with pytest.raises(UndefinedOperationError) as info:
+        check("fn main() { let y = \"Example\" / \"E\"; }")
+
+    assert info.value.operator == "/"
+
+
+def test_checker__user_operator_overload():
+    module, table = check("""
+    fn __div(x: str, y: str) -> i32 {
+        return 0;
+    }
+
+    fn main() {
+        let y = "Example" / "E";
+    }
+    """)
+
+    assert table.type_of(body(module, 1)[0]) == BuiltinType.I32
+
+
+def test_checker__condition_must_be_bool():
+    with pytest.raises(TypeMismatchError):
+        check("""
+        struct Item { }
+
+        fn main(item: Item) {
+            if (item) { }
+        }
+        """)
+
+
+# endregion
+
+# region Assignments
+
+def test_checker__assignment_mismatch():
+    with pytest.raises(TypeMismatchError) as info:
+        check("""
+        fn main() {
+            mut let x: i32 = 10;
+            x = "var";
+        }
+        """)
+
+    assert info.value.expected == BuiltinType.I32
+    assert info.value.got == BuiltinType.Str
+
+
+def test_checker__implicit_numeric_assignment():
+    check("""
+    fn main() {
+        mut let x: f32 = 1.0;
+        x = 10;
+    }
+    """)
+
+
+# endregion
+
+# region Functions
+
+def test_checker__function_call():
+    module, table = check("""
+    fn square(x: i32) -> i32 {
+        return x * x;
+    }
+
+    fn square(x: f32) -> f32 {
+        return x * x;
+    }
+
+    fn main() {
+        let a = square(2);
+        let b = square(2.0);
+    }
+    """)
+
+    first, second = body(module, 2)
+
+    assert table.type_of(first) == BuiltinType.I32
+    assert table.type_of(second) == BuiltinType.F32
+
+
+def test_checker__builtin_functions():
+    module, table = check("""
+    fn main() {
+        let x = readi32();
+        println("x = " + x);
+    }
+    """)
+
+    assert table.type_of(body(module)[0]) == BuiltinType.I32
+
+
+def test_checker__undefined_function():
+    with pytest.raises(UndefinedFunctionError):
+        check("fn main() { undefined(1); }")
+
+
+def test_checker__void_value():
+    with pytest.raises(TypeMismatchError):
+        check("fn main() { let x = println(\"\"); }")
+
+
+def test_checker__return_mismatch():
+    with pytest.raises(TypeMismatchError):
+        check("fn main() -> i32 { return \"text\"; }")
+
+
+def test_checker__return_missing_value():
+    with pytest.raises(TypeMismatchError):
+        check("fn main() -> i32 { return; }")
+
+
+def test_checker__return_in_void():
+    with pytest.raises(TypeMismatchError):
+        check("fn main() { return 1; }")
+
+
+# endregion
+
+# region Structs and Enums
+
+STRUCTS = """
+struct Item {
+    name: str;
+    amount: i32;
+}
+
+struct Inventory {
+    item: Item;
+    name: str;
+}
+
+enum Entity {
+    struct Player {
+        firstname: str;
+    };
+
+    struct Animal {
+        name: str;
+    };
+}
+"""
+
+
+def test_checker__new_struct_and_access():
+    module, table = check(STRUCTS + """
+    fn main() {
+        let inventory = Inventory { name = "Bag"; };
+        let amount = inventory.item.amount;
+    }
+    """)
+
+    declaration, access = body(module)
+
+    assert table.type_of(declaration) == UserType(("Inventory",))
+    assert table.type_of(access) == BuiltinType.I32
+    assert table.type_of(access.value.parent) == UserType(("Item",))
+
+
+def test_checker__undefined_field():
+    with pytest.raises(UndefinedFieldError):
+        check(STRUCTS + """
+        fn main(item: Item) {
+            let x = item.cost;
+        }
+        """)
+
+
+def test_checker__undefined_type():
+    with pytest.raises(UndefinedTypeError):
+        check("fn main(item: Unknown) { }")
+
+
+def test_checker__variant_to_enum():
+    module, table = check(STRUCTS + """
+    fn main() {
+        let e: Entity = Entity::Player { firstname = "John"; };
+        if (e is Entity::Player) {
+            let f = e as Entity::Player;
+            let n = f.firstname;
+        }
+    }
+    """)
+
+    declaration, if_statement = body(module)
+    cast, name = if_statement.block.body
+
+    assert table.type_of(declaration) == UserType(("Entity",))
+    assert table.type_of(if_statement.condition) == BuiltinType.Bool
+    assert table.type_of(cast) == UserType(("Entity", "Player"))
+    assert table.type_of(name) == BuiltinType.Str
+
+
+def test_checker__enum_to_variant_requires_cast():
+    with pytest.raises(TypeMismatchError):
+        check(STRUCTS + """
+        fn main(e: Entity) {
+            let p: Entity::Player = e;
+        }
+        """)
+
+
+def test_checker__invalid_cast():
+    with pytest.raises(InvalidCastError):
+        check(STRUCTS + """
+        fn main(i: Item) {
+            let p = i as Entity::Player;
+        }
+        """)
+
+
+def test_checker__match_binds_variant():
+    module, table = check(STRUCTS + """
+    fn main(e: Entity) {
+        match (e) {
+            Entity::Player p => {
+                let n = p.firstname;
+            };
+            Entity::Animal a => {
+                let n = a.name;
+            };
+        }
+    }
+    """)
+
+    matchers = body(module)[0].matchers
+
+    assert table.type_of(matchers[0]) == UserType(("Entity", "Player"))
+    assert table.type_of(matchers[1].block.body[0]) == BuiltinType.Str
+
+
+# endregion
+
+# region Cache
+
+PROGRAM = """
+fn helper(x: i32) -> i32 {
+    return x + 1;
+}
+
+fn main() {
+    let y = helper(2);
+}
+"""
+
+
+def test_checker__cache_reused_for_unchanged_functions():
+    cache = TypeCache()
+
+    check(PROGRAM, cache)
+    module, table = check(PROGRAM, cache)
+
+    assert cache.hits == 2
+    assert cache.misses == 2
+    assert table.type_of(body(module, 1)[0]) == BuiltinType.I32
+
+
+def test_checker__cache_miss_for_changed_function():
+    cache = TypeCache()
+
+    check(PROGRAM, cache)
+    check(PROGRAM.replace("helper(2)", "helper(3)"), cache)
+
+    assert cache.hits == 1
+    assert cache.misses == 3
+
+
+def test_checker__cache_invalidated_by_signature_change():
+    cache = TypeCache()
+
+    check(PROGRAM, cache)
+    module, table = check(PROGRAM.replace("-> i32", "-> f32"), cache)
+
+    assert cache.hits == 0
+    assert table.type_of(body(module, 1)[0]) == BuiltinType.F32
+
+
+def test_checker__cache_kept_for_unrelated_changes():
+    program = PROGRAM + """
+struct Point { x: i32; }
+fn other(p: Point) -> i32 { return p.x; }
+"""
+    cache = TypeCache()
+
+    check(program, cache)
+    check(program.replace("fn other(p: Point) -> i32 { return p.x; }",
+                          "fn other(p: Point) -> i64 { return 1; }")
+          .replace("x: i32;", "x: i64;"), cache)
+
+    assert cache.hits == 2
+    assert cache.misses == 4
+
+
+def test_checker__cache_invalidated_by_referenced_type():
+    program = PROGRAM + """
+struct Point { x: i32; }
+fn get(p: Point) { let a = p.x; }
+"""
+    cache = TypeCache()
+
+    check(program, cache)
+    module, table = check(program.replace("x: i32;", "x: i64;"), cache)
+
+    assert cache.hits == 2
+    assert table.type_of(body(module, 2)[0]) == BuiltinType.I64
+
+
+def test_checker__cache_capacity():
+    cache = TypeCache(capacity=2)
+
+    check(PROGRAM, cache)
+    check(PROGRAM.replace("x + 1", "x + 2"), cache)
+    check(PROGRAM, cache)
+
+    # Entry of main is used by every check, older helper is dropped
+    assert len(cache) == 2
+    assert cache.hits == 2
+    assert cache.misses == 4
+
+# endregion
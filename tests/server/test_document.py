@@ -0,0 +1,59 @@
+from src.server.document import Document
+
+
+def change(start: tuple[int, int], end: tuple[int, int], text: str) -> dict:
+    return {
+        "range": {
+            "start": {"line": start[0], "character": start[1]},
+            "end": {"line": end[0], "character": end[1]}
+        },
+        "text": text
+    }
+
+
+def test_document_offset():
+    document = Document("file:///a", "ab\ncd\n", 1)
+
+    assert document.offset(0, 0) == 0
+    assert document.offset(1, 1) == 4
+    assert document.offset(1, 10) == 5
+    assert document.offset(5, 0) == 6
+
+
+
+def test_document_offset_utf16():
+    text = "a\U0001F600b\nc"
+
+    assert Document("file:///a", text, 1).offset(0, 3) == 2
+    assert Document("file:///a", text, 1).offset(0, 2) == 2
+    assert Document("file:///a", text, 1, utf16=False).offset(0, 2) == 2
+    assert Document("file:///a", text, 1).offset(1, 1) == 5
+
+
+def test_document_apply_insert():
+    document = Document("file:///a", "fn main() {}\n", 1)
+
+    document.apply([change((0, 11), (0, 11), "\n    foo();\n")], 2)
+
+    assert document.text == "fn main() {\n    foo();\n}\n"
+    assert document.version == 2
+
+
+def test_document_apply_many_changes_in_order():
+    document = Document("file:///a", "abc\ndef\n", 1)
+
+    document.apply([
+        change((0, 0), (0, 1), "x"),
+        change((1, 0), (2, 0), ""),
+        change((0, 3), (0, 3), "!")
+    ], 3)
+
+    assert document.text == "xbc!\n"
+
+
+def test_document_apply_full_text():
+    document = Document("file:///a", "abc", 1)
+
+    document.apply([{"text": "def"}], 2)
+
+    assert document.text == "def"
@@ -0,0 +1,171 @@
+import io
+import os
+import threading
+
+import pytest
+
+from src.server.client import LanguageClient, ResponseError
+from src.server.protocol import METHOD_NOT_FOUND, PARSE_ERROR, \
+    SERVER_NOT_INITIALIZED, read_message
+from src.server.server import LanguageServer
+
+URI = "file:///main.fhll"
+
+
+@pytest.fixture
+def connection():
+    server_input, client_output = os.pipe()
+    client_input, server_output = os.pipe()
+
+    server = LanguageServer(open(server_input, "rb"),
+                            open(server_output, "wb"), debounce=0)
+    results = []
+    thread = threading.Thread(target=lambda: results.append(server.serve()))
+    thread.start()
+
+    writer = open(client_output, "wb")
+    client = LanguageClient(open(client_input, "rb"), writer)
+
+    def stop() -> list[int]:
+        # End of input stops server also when test fails
+        writer.close()
+        thread.join(10)
+        return results
+
+    yield client, stop
+    stop()
+
+
+def initialized(client: LanguageClient) -> LanguageClient:
+    client.request("initialize", {"capabilities": {}}, timeout=10)
+    client.notify("initialized")
+    return client
+
+
+def open_document(client: LanguageClient, text: str) -> None:
+    client.notify("textDocument/didOpen", {"textDocument": {
+        "uri": URI, "languageId": "fhll", "version": 1, "text": text
+    }})
+
+
+def test_server_initialize(connection):
+    client, stop = connection
+
+    result = client.request("initialize", {"capabilities": {"general": {
+        "positionEncodings": ["utf-16", "utf-32"]
+    }}}, timeout=10)
+
+    assert result["capabilities"]["positionEncoding"] == "utf-32"
+    assert result["capabilities"]["documentSymbolProvider"]
+    assert client.close() is None
+    assert stop() == [0]
+
+
+def test_server_invalid_content_length():
+    output = io.BytesIO()
+    server = LanguageServer(io.BytesIO(b"Content-Length: abc\r\n\r\n"
+                                       b"Content-Length: -1\r\n\r\n"),
+                            output, debounce=0)
+
+    assert server.serve() == 1
+
+    output.seek(0)
+    for _ in range(2):
+        error = read_message(output)["error"]
+        assert error["code"] == PARSE_ERROR
+        assert error["message"] == "Invalid Content-Length header"
+    assert read_message(output) is None
+
+
+def test_server_not_initialized(connection):
+    client, _ = connection
+
+    with pytest.raises(ResponseError) as error:
+        client.request("textDocument/documentSymbol",
+                       {"textDocument": {"uri": URI}}, timeout=10)
+
+    assert error.value.code == SERVER_NOT_INITIALIZED
+    client.notify("exit")
+
+
+def test_server_unknown_method(connection):
+    client, _ = connection
+    initialized(client)
+
+    with pytest.raises(ResponseError) as error:
+        client.request("textDocument/hover", {}, timeout=10)
+
+    assert error.value.code == METHOD_NOT_FOUND
+    client.close()
+
+
+def test_server_waits_for_first_analysis(connection):
+    client, _ = connection
+    initialized(client)
+
+    open_document(client, "fn main() {}\nstruct S { a: i64; }\n")
+    symbols = client.request("textDocument/documentSymbol",
+                             {"textDocument": {"uri": URI}}, timeout=10)
+
+    assert [symbol["name"] for symbol in symbols] == ["main", "S"]
+    client.close()
+
+
+def test_server_publishes_diagnostics_after_change(connection):
+    client, _ = connection
+    initialized(client)
+
+    open_document(client, "fn main() {}\n")
+    assert client.notification("textDocument/publishDiagnostics",
+                               10)["diagnostics"] == []
+
+    client.notify("textDocument/didChange", {
+        "textDocument": {"uri": URI, "version": 2},
+        "contentChanges": [{
+            "range": {"start": {"line": 0, "character": 11},
+                      "end": {"line": 0, "character": 11}},
+            "text": "let a = 1"
+        }]
+    })
+    published = client.notification("textDocument/publishDiagnostics", 10)
+
+    assert published["version"] == 2
+    assert [diagnostic["message"] for diagnostic
+            in published["diagnostics"]] == ["Semicolon expected"]
+    client.close()
+
+
+def test_server_definition(connection):
+    client, _ = connection
+    initialized(client)
+
+    open_document(client, "fn f() {}\nfn main() { f(); }\n")
+    result = client.request("textDocument/definition", {
+        "textDocument": {"uri": URI},
+        "position": {"line": 1, "character": 12}
+    }, timeout=10)
+
+    assert result == [{"uri": URI, "range": {
+        "start": {"line": 0, "character": 3},
+        "end": {"line": 0, "character": 4}
+    }}]
+    client.close()
+
+
+def test_server_definition_utf16(connection):
+    client, _ = connection
+    initialized(client)
+
+    # Cursor right after call, one character further in UTF-16
+    open_document(client, 'fn main() { let s = "\U0001F600"; f(); }\n'
+                          'fn f() {}\n')
+    result = client.request("textDocument/definition", {
+        "textDocument": {"uri": URI},
+        "position": {"line": 0, "character": 27}
+    }, timeout=10)
+
+    assert result == [{"uri": URI, "range": {
+        "start": {"line": 1, "character": 3},
+        "end": {"line": 1, "character": 4}
+    }}]
+    client.close()
@@ -0,0 +1,128 @@
+from src.common.position import Position
+from src.lexer.errors import ExpectingCharException
+from src.parser.errors import SemicolonExpectedError
+from src.semantic.errors import UndefinedVariableError
+from src.server.snapshot import Snapshot, FUNCTION_SYMBOL, STRUCT_SYMBOL, \
+    ENUM_SYMBOL, ENUM_MEMBER_SYMBOL
+
+PROGRAM = """struct Point { x: i64; }
+enum Shape { struct Circle { r: i64; }; }
+fn add(a: i64, b: i64) -> i64 { mut let c = a + b; c = c + 1; return c; }
+fn add(a: f32, b: f32) -> f32 { return a + b; }
+fn main() {
+    let r = add(1, 2);
+    let p = Point { x = r; };
+    let s = Shape::Circle { r = 1; };
+}
+"""
+
+
+def begins(snapshot: Snapshot, line: int, column: int) -> list[tuple]:
+    return [(location.begin.line, location.begin.column)
+            for location in snapshot.definition(Position(line, column))]
+
+
+def test_snapshot_build():
+    snapshot = Snapshot.build(PROGRAM, 3)
+
+    assert snapshot.version == 3
+    assert snapshot.diagnostics == []
+    assert len(snapshot.module.function_declarations) == 3
+
+
+def test_snapshot_token_at():
+    snapshot = Snapshot.build(PROGRAM, 1)
+
+    assert snapshot.token_at(Position(3, 5)).value == "add"
+    assert snapshot.token_at(Position(3, 3)) is None
+
+
+def test_snapshot_definition_of_variable():
+    snapshot = Snapshot.build(PROGRAM, 1)
+
+    assert begins(snapshot, 3, 45) == [(3, 8)]
+    assert begins(snapshot, 3, 70) == [(3, 41)]
+
+
+def test_snapshot_definition_after_identifier():
+    snapshot = Snapshot.build(PROGRAM, 1)
+
+    assert begins(snapshot, 3, 46) == [(3, 8)]
+
+
+def test_snapshot_definition_of_overloads():
+    snapshot = Snapshot.build(PROGRAM, 1)
+
+    assert begins(snapshot, 6, 13) == [(3, 4), (4, 4)]
+
+
+def test_snapshot_definition_of_types():
+    snapshot = Snapshot.build(PROGRAM, 1)
+
+    assert begins(snapshot, 7, 13) == [(1, 8)]
+    assert begins(snapshot, 8, 13) == [(2, 6)]
+    assert begins(snapshot, 8, 20) == [(2, 21)]
+
+
+def test_snapshot_definition_of_field():
+    snapshot = Snapshot.build(PROGRAM, 1)
+
+    assert begins(snapshot, 7, 21) == []
+
+
+def test_snapshot_symbols():
+    snapshot = Snapshot.build(PROGRAM, 1)
+    symbols = snapshot.symbols()
+
+    assert [(symbol["name"], symbol["kind"]) for symbol in symbols] == [
+        ("Point", STRUCT_SYMBOL),
+        ("Shape", ENUM_SYMBOL),
+        ("add", FUNCTION_SYMBOL),
+        ("add", FUNCTION_SYMBOL),
+        ("main", FUNCTION_SYMBOL)
+    ]
+    assert symbols[1]["children"][0]["kind"] == ENUM_MEMBER_SYMBOL
+    assert symbols[2]["detail"] == "(a: i64, b: i64) -> i64"
+    assert symbols[4]["range"]["end"] == {"line": 8, "character": 1}
+    assert snapshot.symbols() is symbols
+
+
+def test_snapshot_syntax_diagnostics():
+    snapshot = Snapshot.build("fn main() { let a = 1 }", 1)
+
+    assert [type(error) for error in snapshot.diagnostics] == [
+        SemicolonExpectedError
+    ]
+    assert snapshot.lsp_diagnostics()[0]["range"] == {
+        "start": {"line": 0, "character": 22},
+        "end": {"line": 0, "character": 23}
+    }
+
+
+def test_snapshot_lexer_diagnostics():
+    snapshot = Snapshot.build(
+        "fn main() { let b: bool = true & false; }", 1
+    )
+
+    assert isinstance(snapshot.diagnostics[0], ExpectingCharException)
+    assert snapshot.lsp_diagnostics()[0]["range"]["start"] == {
+        "line": 0, "character": 32
+    }
+
+
+def test_snapshot_semantic_diagnostics():
+    snapshot = Snapshot.build("fn main() { let a = b; }", 1)
+
+    assert [type(error) for error in snapshot.diagnostics] == [
+        UndefinedVariableError
+    ]
+
+
+def test_snapshot_utf16_diagnostics():
+    text = 'fn main() { let s = "\U0001F600"; let x = y; }'
+
+    assert [diagnostic["range"]["start"]["character"] for diagnostic
+            in Snapshot.build(text, 1).lsp_diagnostics()] == [34]
+    assert [diagnostic["range"]["start"]["character"] for diagnostic
+            in Snapshot.build(text, 1, utf16=False).lsp_diagnostics()] \
+        == [33]
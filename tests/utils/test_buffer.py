@@ -1,6 +1,9 @@
 import pytest
 
+from src.common.position import Position
 from src.utils.buffer import StreamBuffer
+from src.utils.char_class import IDENTIFIER, WHITESPACE, STRING, TABLE, \
+    IDENTIFIER_START, DECIMAL, classify, char_class
 
 
 @pytest.fixture
@@ -154,3 +157,64 @@ def test_str(test_data):
 
     assert str(stream) == ("StreamBuffer"
                            "(position=Position(line=1, column=5), eof=False)")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+def test_read_while(monkeypatch, chunk_size: int):
+    monkeypatch.setattr("src.utils.buffer.CHUNK_SIZE", chunk_size)
+    stream = StreamBuffer.from_str("abc_1 \n\n  żółw!")
+    stream.read_next_char()
+
+    assert stream.read_while(IDENTIFIER) == "abc_1"
+    assert stream.previous_position == Position(1, 5)
+    assert stream.read_while(WHITESPACE) == " \n\n  "
+    assert stream.position == Position(3, 3)
+    assert stream.read_while(IDENTIFIER, limit=3) == "żół"
+    assert stream.char == "w"
+    assert stream.read_while(WHITESPACE) == ""
+    assert stream.read_while(IDENTIFIER) == "w"
+    assert stream.char == "!"
+    assert stream.read_while(STRING) == "!"
+    assert stream.eof
+    assert stream.previous_position == Position(3, 7)
+
+
+def test_char_class_table():
+    for code in range(256):
+        assert TABLE[code] == classify(chr(code))
+
+    assert char_class("ż") & IDENTIFIER_START
+    assert char_class("٣") & DECIMAL
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_read_span(monkeypatch, chunk_size: int):
+    monkeypatch.setattr("src.utils.buffer.CHUNK_SIZE", chunk_size)
+    stream = StreamBuffer.from_str("say \"hello world\"")
+    stream.read_next_char()
+    stream.read_while(IDENTIFIER | WHITESPACE)
+    stream.read_next_char()
+
+    span = stream.read_span(STRING)
+
+    assert len(span) == 11
+    assert str(span) == "hello world"
+    assert stream.char == "\""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1024])
+def test_peek(monkeypatch, chunk_size: int):
+    monkeypatch.setattr("src.utils.buffer.CHUNK_SIZE", chunk_size)
+    stream = StreamBuffer.from_str("ab\nc")
+
+    assert stream.peek() == ""
+    stream.read_next_char()
+    assert stream.peek() == "b"
+    assert stream.char == "a"
+    assert stream.read_next_char() == "b"
+    assert stream.read_next_char() == "\n"
+    assert stream.peek() == "c"
+    assert stream.read_next_char() == "c"
+    assert stream.position == Position(2, 1)
+    assert stream.peek() == ""
+    assert stream.read_next_char() == ""
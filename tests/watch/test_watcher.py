@@ -0,0 +1,159 @@
+import os
+
+from src.lexer.errors import InvalidEscapeSequenceException
+from src.parser.errors import SemicolonExpectedError
+from src.semantic.errors import UndefinedVariableError
+from src.watch.watcher import Watcher, InternalError
+
+
+def write(path, text: str, mtime: int = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+    # Explicit time, writes in one test may share timestamp
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+def test_watcher_first_cycle(tmp_path):
+    write(tmp_path / "main.fhll", "fn main() {}")
+    write(tmp_path / "lib" / "math.fhll",
+          "fn add(a: i64) -> i64 { return a; }")
+    write(tmp_path / "notes.txt", "fn")
+    write(tmp_path / ".hidden" / "skip.fhll", "fn")
+    watcher = Watcher(str(tmp_path))
+
+    report = watcher.cycle()
+
+    assert report.added == [os.path.join("lib", "math.fhll"), "main.fhll"]
+    assert report.changed == [] and report.removed == []
+    assert watcher.files["main.fhll"].diagnostics == []
+    assert len(watcher.files["main.fhll"].module.function_declarations) == 1
+
+
+def test_watcher_unchanged_files_are_reused(tmp_path):
+    write(tmp_path / "main.fhll", "fn main() {}")
+    watcher = Watcher(str(tmp_path))
+    watcher.cycle()
+    module = watcher.files["main.fhll"].module
+
+    report = watcher.cycle()
+
+    assert not report.modified
+    assert report.unchanged == 1
+    assert report.timings.read == 0 and report.timings.parse == 0
+    assert watcher.files["main.fhll"].module is module
+
+
+def test_watcher_changed_file(tmp_path):
+    write(tmp_path / "a.fhll", "fn a() {}", 1_000)
+    write(tmp_path / "b.fhll", "fn b() {}", 1_000)
+    watcher = Watcher(str(tmp_path))
+    watcher.cycle()
+    module = watcher.files["b.fhll"].module
+
+    write(tmp_path / "a.fhll", "fn a() {}\nfn c() {}", 2_000)
+    report = watcher.cycle()
+
+    assert report.changed == ["a.fhll"]
+    assert report.unchanged == 1
+    assert len(watcher.files["a.fhll"].module.function_declarations) == 2
+    assert watcher.files["b.fhll"].module is module
+
+
+def test_watcher_touched_file_is_not_compiled(tmp_path):
+    write(tmp_path / "a.fhll", "fn a() {}", 1_000)
+    watcher = Watcher(str(tmp_path))
+    watcher.cycle()
+    module = watcher.files["a.fhll"].module
+
+    write(tmp_path / "a.fhll", "fn a() {}", 2_000)
+    report = watcher.cycle()
+
+    assert not report.modified
+    assert report.timings.read > 0 and report.timings.parse == 0
+    assert watcher.files["a.fhll"].module is module
+
+
+def test_watcher_removed_file(tmp_path):
+    write(tmp_path / "a.fhll", "fn a() {}")
+    watcher = Watcher(str(tmp_path))
+    watcher.cycle()
+
+    (tmp_path / "a.fhll").unlink()
+    report = watcher.cycle()
+
+    assert report.removed == ["a.fhll"]
+    assert watcher.files == {}
+
+
+def test_watcher_diagnostics(tmp_path):
+    write(tmp_path / "syntax.fhll", "fn a() { let x = 1 }")
+    write(tmp_path / "semantic.fhll", "fn a() { let x = y; }")
+    watcher = Watcher(str(tmp_path))
+
+    report = watcher.cycle()
+    text = watcher.format(report)
+
+    assert [type(error) for error
+            in watcher.files["syntax.fhll"].diagnostics] == [
+        SemicolonExpectedError
+    ]
+    assert [type(error) for error
+            in watcher.files["semantic.fhll"].diagnostics] == [
+        UndefinedVariableError
+    ]
+    assert "2 errors" in text
+    assert "syntax.fhll:1:20: Semicolon expected" in text
+
+
+def test_watcher_lexer_diagnostics(tmp_path):
+    write(tmp_path / "lexer.fhll", 'fn a() { let s: str = "a\\q"; }')
+    watcher = Watcher(str(tmp_path))
+
+    text = watcher.format(watcher.cycle())
+
+    assert isinstance(watcher.files["lexer.fhll"].diagnostics[0],
+                      InvalidEscapeSequenceException)
+    assert "lexer.fhll:1:26: Invalid escape sequence" in text
+
+
+def test_watcher_survives_compiler_failure(tmp_path, monkeypatch):
+    write(tmp_path / "a.fhll", "fn a() {}", 1)
+    watcher = Watcher(str(tmp_path))
+    watcher.cycle()
+    module = watcher.files["a.fhll"].module
+
+    def fail(content, timings):
+        raise AttributeError("broken")
+
+    monkeypatch.setattr(watcher, "_compile", fail)
+    write(tmp_path / "a.fhll", "fn a() { let x = 1; }", 2)
+    write(tmp_path / "b.fhll", "fn b() {}", 2)
+    report = watcher.cycle()
+    text = watcher.format(report)
+
+    assert report.changed == ["a.fhll"]
+    assert report.added == ["b.fhll"]
+    assert watcher.files["a.fhll"].module is module
+    assert watcher.files["b.fhll"].module is None
+    assert isinstance(watcher.files["a.fhll"].diagnostics[0], InternalError)
+    assert "a.fhll:1:1: Internal error: AttributeError: broken" in text
+
+    # Same content is not compiled again
+    assert watcher.cycle().unchanged == 2
+
+
+def test_watcher_reuses_type_checks_of_unchanged_functions(tmp_path):
+    program = "fn a() -> i64 { return 1; }\nfn b() -> i64 { return 2; }"
+    write(tmp_path / "a.fhll", program, 1_000)
+    watcher = Watcher(str(tmp_path))
+    watcher.cycle()
+    misses = watcher.cache.misses
+
+    write(tmp_path / "a.fhll", program + "\n// comment", 2_000)
+    report = watcher.cycle()
+
+    assert report.changed == ["a.fhll"]
+    assert watcher.cache.misses == misses
+    assert watcher.cache.hits == 2